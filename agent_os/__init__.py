@@ -5,6 +5,7 @@ from .job import Job
 from .artifacts import ArtifactManifest
 from .step import Step, StepContext
 from .runner import Runner
+from .plan import TaskPlan, load_task_plan
 from .memory import MemoryBank, distill_success_patterns
 
 __version__ = "1.0.0"
@@ -17,6 +18,8 @@ __all__ = [
     "Step",
     "StepContext",
     "Runner",
+    "TaskPlan",
+    "load_task_plan",
     "MemoryBank",
     "distill_success_patterns",
 ]
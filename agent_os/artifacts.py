@@ -1,36 +1,78 @@
 """Artifact management (manifest.json)."""
 
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, IO, List, Optional, Tuple, Union
 
 from .config import get_config
-from .utils import compute_sha256, load_json, save_json, get_logger
+from .utils import (
+    compute_sha256,
+    compute_merkle_leaf,
+    compute_merkle_root,
+    compress_file,
+    compute_raw_digest,
+    detect_compression,
+    is_table_path,
+    read_table_header,
+    link_into_pool,
+    open_artifact,
+    JobArchive,
+    load_json,
+    loads_json,
+    save_json,
+    get_logger,
+)
 
 logger = get_logger(__name__)
 
+# Reserved manifest key holding the Merkle digest of all artifacts
+MERKLE_KEY = "_merkle"
+
 
 class ArtifactManifest:
     """Artifact manifest (decision point for deterministic replay)."""
 
-    def __init__(self, manifest_path: Path):
+    def __init__(self, manifest_path: Path, archive: Optional[JobArchive] = None):
         """Initialize manifest.
 
         Args:
-            manifest_path: Path to manifest.json
+            manifest_path: Path to manifest.json (member name if archive is given)
+            archive: Packed job archive to read manifest and artifacts from (read-only)
         """
         self.manifest_path = manifest_path
+        self.archive = archive
         self.config = get_config()
         self.artifacts: Dict[str, Dict[str, Any]] = {}
+        self.merkle: Dict[str, Any] = {}
 
         # Load existing manifest if exists
-        if self.manifest_path.exists():
+        if self.archive is not None:
+            logger.info(f"Loading packed manifest: {self.archive.archive_path}")
+            self.artifacts = loads_json(self.archive.read_bytes(Path(manifest_path).as_posix()))
+            self.merkle = self.artifacts.pop(MERKLE_KEY, {})
+        elif self.manifest_path.exists():
             logger.info(f"Loading existing manifest: {self.manifest_path}")
             self.artifacts = load_json(self.manifest_path)
+            self.merkle = self.artifacts.pop(MERKLE_KEY, {})
         else:
             logger.info(f"Creating new manifest: {self.manifest_path}")
 
+    @classmethod
+    def from_archive(cls, archive_path: Union[str, Path]) -> "ArtifactManifest":
+        """Load manifest of a packed job without extracting it.
+
+        Args:
+            archive_path: Path to job archive
+
+        Returns:
+            Read-only manifest backed by the archive
+        """
+        return cls(Path(get_config().artifacts.manifest_file), archive=JobArchive(archive_path))
+
     def add_artifact(
         self,
         key: str,
@@ -39,9 +81,16 @@ class ArtifactManifest:
         inputs_used: List[str],
         schema_used: Optional[str] = None,
         validated: bool = False,
+        compression: Optional[str] = None,
     ) -> None:
         """Add artifact to manifest.
 
+        Artifacts may be stored compressed under a suffixed name (see
+        _apply_compression); the manifest then records the stored path and
+        both the stored and the raw size/digest. Unvalidated artifacts are
+        compressed only once mark_validated is called, so the gate reads
+        them as written.
+
         Args:
             key: Artifact key
             path: Path to artifact file
@@ -49,7 +98,19 @@ class ArtifactManifest:
             inputs_used: List of input artifact keys
             schema_used: Schema file used for validation
             validated: Whether artifact passed validation
+            compression: Codec (zstd/gzip/auto), "none", or None for size policy
+
+        Raises:
+            ValueError: If key is reserved
         """
+        if key == MERKLE_KEY:
+            raise ValueError(f"Artifact key is reserved: {key}")
+
+        # A rewritten output replaces its compressed copy from an earlier run
+        previous = self.artifacts.get(key)
+        if previous and previous.get("compression") and previous["path"] != str(path) and path.exists():
+            Path(previous["path"]).unlink(missing_ok=True)
+
         artifact_info = {
             "key": key,
             "path": str(path),
@@ -60,10 +121,38 @@ class ArtifactManifest:
             "created_at": datetime.now().isoformat(),
         }
 
+        # Compress final artifacts (or detect already compressed content)
+        if path.exists():
+            if validated or detect_compression(path) is not None:
+                artifact_info.update(self._apply_compression(path, compression))
+                path = Path(artifact_info["path"])
+            elif compression is not None:
+                artifact_info["compression_requested"] = compression
+
+        # Record table layout so consumers need not open the file
+        if is_table_path(path) and path.exists():
+            header = read_table_header(path)
+            artifact_info["format"] = "table"
+            artifact_info["table"] = {
+                "fields": [list(field) for field in header["fields"]],
+                "rows": header["rows"],
+            }
+
         # Add hash if configured
         if self.config.artifacts.include_hashes and path.exists():
             artifact_info["sha256"] = compute_sha256(path)
 
+            # Share identical bytes across jobs (final artifacts only)
+            if self.config.artifacts.dedup and validated:
+                status = link_into_pool(path, artifact_info["sha256"], self.get_pool_root())
+                logger.debug(f"Dedup {key}: {status}")
+
+        # Add stat info (used to skip re-hashing unchanged files)
+        if path.exists():
+            stat = path.stat()
+            artifact_info["size"] = stat.st_size
+            artifact_info["mtime_ns"] = stat.st_mtime_ns
+
         # Add tool versions if configured
         if self.config.artifacts.include_tool_versions:
             artifact_info["python_version"] = sys.version
@@ -72,6 +161,106 @@ class ArtifactManifest:
         logger.info(f"Added artifact to manifest: {key}")
         self.save()
 
+    def _apply_compression(self, path: Path, compression: Optional[str]) -> Dict[str, Any]:
+        """Compress artifact file according to per-output setting or size policy.
+
+        Args:
+            path: Artifact file
+            compression: Codec, "none", or None to apply the configured policy
+
+        Returns:
+            Compression fields for the manifest entry (empty if stored raw),
+            including the new path if the file was compressed
+        """
+        existing = detect_compression(path)
+        if existing is not None:
+            return {"compression": existing, **compute_raw_digest(path)}
+
+        # Tables are memory-mapped in place
+        if compression == "none" or is_table_path(path):
+            return {}
+
+        if compression is None:
+            settings = self.config.artifacts
+            if not settings.compress_min_size or path.suffix not in settings.compress_suffixes:
+                return {}
+            if path.stat().st_size < settings.compress_min_size:
+                return {}
+            compression = settings.compress_codec
+
+        result = compress_file(path, codec=compression)
+        logger.info(f"Compressed {path.name} with {result['codec']}: "
+                    f"{result['raw_size']} -> {result['stored_size']} bytes")
+        return {
+            "path": str(result["path"]),
+            "compression": result["codec"],
+            "raw_size": result["raw_size"],
+            "raw_sha256": result["raw_sha256"],
+        }
+
+    def _finalize_artifact(self, key: str) -> None:
+        """Compress and pool a validated artifact, refreshing its stored digest and stat."""
+        artifact = self.artifacts[key]
+        path = Path(artifact["path"])
+        if self.archive is not None or self.check_artifact(key)["status"] != "ok":
+            return
+
+        if not artifact.get("compression"):
+            compression = artifact.pop("compression_requested", None)
+            fields = self._apply_compression(path, compression)
+            if fields:
+                artifact.update(fields)
+                path = Path(artifact["path"])
+                if self.config.artifacts.include_hashes:
+                    artifact["sha256"] = compute_sha256(path)
+                artifact["size"] = path.stat().st_size
+
+        # Final now: share identical bytes across jobs
+        if self.config.artifacts.dedup and artifact.get("sha256"):
+            status = link_into_pool(path, artifact["sha256"], self.get_pool_root())
+            logger.debug(f"Dedup {key}: {status}")
+
+        artifact["mtime_ns"] = path.stat().st_mtime_ns
+
+    def get_pool_root(self) -> Path:
+        """Get content-addressed pool root shared by all jobs.
+
+        Returns:
+            Pool root directory
+        """
+        return Path(self.config.paths.work_root) / "pool"
+
+    def dedup(self) -> Dict[str, Any]:
+        """Hardlink this job's artifacts against the content-addressed pool.
+
+        Only validated artifacts whose file still matches the recorded digest
+        are linked; unvalidated ones may still be rewritten by a retry.
+
+        Returns:
+            Dedup report (counts per status, bytes saved)
+        """
+        report = {"deduplicated": 0, "pooled": 0, "already_linked": 0, "skipped": 0, "bytes_saved": 0}
+        if self.archive is not None:
+            report["skipped"] = len(self.artifacts)
+            return report
+        pool_root = self.get_pool_root()
+
+        for key, artifact in self.artifacts.items():
+            digest = artifact.get("sha256")
+            if not digest or not artifact.get("validated") or self.check_artifact(key)["status"] != "ok":
+                report["skipped"] += 1
+                continue
+
+            path = Path(artifact["path"])
+            status = link_into_pool(path, digest, pool_root)
+            report[status] += 1
+            if status == "deduplicated":
+                report["bytes_saved"] += artifact.get("size", 0)
+            artifact["mtime_ns"] = path.stat().st_mtime_ns
+
+        self.save()
+        return report
+
     def get_artifact(self, key: str) -> Optional[Dict[str, Any]]:
         """Get artifact info.
 
@@ -111,31 +300,175 @@ class ArtifactManifest:
         if artifact is None:
             return False
 
-        # Check if file exists
-        path = Path(artifact["path"])
-        if not path.exists():
-            logger.warning(f"Artifact file missing: {path}")
-            return False
-
         # Check if validated
         if not artifact.get("validated", False):
             logger.info(f"Artifact not validated, will regenerate: {key}")
             return False
 
-        # Verify hash if configured
-        if self.config.artifacts.include_hashes:
-            stored_hash = artifact.get("sha256")
-            if stored_hash:
-                current_hash = compute_sha256(path)
-                if current_hash != stored_hash:
-                    logger.warning(f"Hash mismatch for {key}, will regenerate")
-                    return False
+        # Check file integrity (existence, size, hash)
+        status = self.check_artifact(key)["status"]
+        if status == "missing":
+            logger.warning(f"Artifact file missing: {artifact['path']}")
+            return False
+        if status != "ok":
+            logger.warning(f"Integrity check failed for {key} ({status}), will regenerate")
+            return False
 
         logger.info(f"Reusing validated artifact: {key}")
         return True
 
+    def check_artifact(self, key: str, full: bool = False) -> Dict[str, Any]:
+        """Check artifact file against the manifest (existence, size, digest).
+
+        The recorded size and mtime act as a stat cache: if both still match,
+        the stored digest is trusted and the file is not re-hashed.
+
+        Args:
+            key: Artifact key
+            full: Always re-hash, ignoring the stat cache
+
+        Returns:
+            Check result dict (key, status, size, hashed)
+        """
+        artifact = self.get_artifact(key)
+        if artifact is None:
+            return {"key": key, "status": "unknown", "size": 0, "hashed": False}
+
+        if self.archive is not None:
+            return self._check_packed_artifact(key, artifact, full)
+
+        path = Path(artifact["path"])
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return {"key": key, "status": "missing", "size": 0, "hashed": False}
+
+        result = {"key": key, "status": "ok", "size": stat.st_size, "hashed": False}
+
+        stored_size = artifact.get("size")
+        if stored_size is not None and stored_size != stat.st_size:
+            result["status"] = "size_mismatch"
+            return result
+
+        stored_hash = artifact.get("sha256")
+        if not self.config.artifacts.include_hashes or not stored_hash:
+            return result
+
+        stat_unchanged = stored_size is not None and artifact.get("mtime_ns") == stat.st_mtime_ns
+        if stat_unchanged and not full:
+            return result
+
+        result["hashed"] = True
+        if compute_sha256(path) != stored_hash:
+            result["status"] = "hash_mismatch"
+        return result
+
+    def _check_packed_artifact(self, key: str, artifact: Dict[str, Any], full: bool) -> Dict[str, Any]:
+        """Check packed artifact against the archive index (re-hash if full)."""
+        member = self.archive.member_name(artifact["path"])
+        if member not in self.archive:
+            return {"key": key, "status": "missing", "size": 0, "hashed": False}
+
+        info = self.archive.get_info(member)
+        result = {"key": key, "status": "ok", "size": info["size"], "hashed": False}
+
+        stored_size = artifact.get("size")
+        if stored_size is not None and stored_size != info["size"]:
+            result["status"] = "size_mismatch"
+            return result
+
+        stored_hash = artifact.get("sha256")
+        if not self.config.artifacts.include_hashes or not stored_hash:
+            return result
+
+        digest = info["sha256"]
+        if full:
+            result["hashed"] = True
+            digest = self.archive.compute_sha256(member)
+        if digest != stored_hash:
+            result["status"] = "hash_mismatch"
+        return result
+
+    def locate(self, key: str) -> Tuple[Path, int, int]:
+        """Locate artifact bytes (as stored) on disk.
+
+        Args:
+            key: Artifact key
+
+        Returns:
+            (file path, offset, size); offset is 0 unless the job is packed
+
+        Raises:
+            KeyError: If artifact is not in the manifest (or archive)
+        """
+        artifact = self.get_artifact(key)
+        if artifact is None:
+            raise KeyError(f"Artifact not in manifest: {key}")
+
+        if self.archive is not None:
+            info = self.archive.get_info(self.archive.member_name(artifact["path"]))
+            return self.archive.archive_path, info["offset"], info["size"]
+
+        path = Path(artifact["path"])
+        return path, 0, path.stat().st_size
+
+    def open_artifact(self, key: str, mode: str = 'rb') -> IO:
+        """Open artifact for reading (from the workdir or the job archive).
+
+        Args:
+            key: Artifact key
+            mode: 'rb' or 'r'
+
+        Returns:
+            Readable file object over the raw (decompressed) content
+
+        Raises:
+            KeyError: If artifact is not in the manifest
+        """
+        artifact = self.get_artifact(key)
+        if artifact is None:
+            raise KeyError(f"Artifact not in manifest: {key}")
+
+        if self.archive is not None:
+            return self.archive.open(self.archive.member_name(artifact["path"]), mode=mode)
+        return open_artifact(artifact["path"], mode=mode)
+
+    def verify_all(self, workers: Optional[int] = None, full: bool = False) -> Dict[str, Any]:
+        """Verify every artifact in the manifest concurrently.
+
+        Args:
+            workers: Number of worker threads (defaults to CPU count)
+            full: Always re-hash, ignoring the stat cache
+
+        Returns:
+            Verification report (counts, mismatches, throughput)
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        keys = sorted(self.artifacts)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            results = list(executor.map(lambda k: self.check_artifact(k, full=full), keys))
+        elapsed = time.perf_counter() - start
+
+        total_bytes = sum(r["size"] for r in results)
+        mismatches = [r for r in results if r["status"] != "ok"]
+
+        return {
+            "manifest": str(self.manifest_path),
+            "artifacts_total": len(results),
+            "artifacts_ok": len(results) - len(mismatches),
+            "artifacts_hashed": sum(1 for r in results if r["hashed"]),
+            "mismatches": mismatches,
+            "bytes_total": total_bytes,
+            "elapsed_sec": round(elapsed, 4),
+            "throughput_mb_s": round(total_bytes / elapsed / 1e6, 2) if elapsed > 0 else 0.0,
+            "success": not mismatches,
+        }
+
     def mark_validated(self, key: str) -> None:
-        """Mark artifact as validated.
+        """Mark artifact as validated, then compress and pool it if configured.
 
         Args:
             key: Artifact key
@@ -143,11 +476,101 @@ class ArtifactManifest:
         if key in self.artifacts:
             self.artifacts[key]["validated"] = True
             logger.info(f"Marked artifact as validated: {key}")
+            self._finalize_artifact(key)
             self.save()
 
+    @staticmethod
+    def _content_digest(artifact: Dict[str, Any]) -> str:
+        """Digest identifying artifact content (raw digest if stored compressed)."""
+        return artifact.get("raw_sha256", artifact.get("sha256", ""))
+
+    def compute_merkle(self) -> Dict[str, Any]:
+        """Compute Merkle digest over all artifacts.
+
+        Leaves are (key, content digest) pairs grouped by producer step; each step
+        gets its own subtree root and the job root is built over step roots.
+        Both levels are ordered by key so the digest is deterministic.
+
+        Returns:
+            Merkle info dict (root, per-step roots, leaf count)
+        """
+        steps: Dict[str, List[str]] = {}
+        for key in sorted(self.artifacts):
+            artifact = self.artifacts[key]
+            leaf = compute_merkle_leaf(key, self._content_digest(artifact))
+            steps.setdefault(artifact["producer_step"], []).append(leaf)
+
+        step_roots = {step_id: compute_merkle_root(leaves) for step_id, leaves in sorted(steps.items())}
+        step_nodes = [compute_merkle_leaf(step_id, root) for step_id, root in step_roots.items()]
+
+        return {
+            "algorithm": "sha256",
+            "root": compute_merkle_root(step_nodes),
+            "steps": step_roots,
+            "leaf_count": len(self.artifacts),
+        }
+
+    def get_merkle_root(self) -> str:
+        """Get Merkle root of all artifacts.
+
+        Returns:
+            Hexadecimal root hash
+        """
+        if not self.merkle:
+            self.merkle = self.compute_merkle()
+        return self.merkle["root"]
+
+    def diff(self, other: "ArtifactManifest") -> List[str]:
+        """Find artifacts that differ from another manifest.
+
+        Compares job roots first, then step roots, and only inspects the
+        artifacts of steps whose subtree differs.
+
+        Args:
+            other: Manifest to compare against
+
+        Returns:
+            Sorted list of differing artifact keys
+        """
+        if self.get_merkle_root() == other.get_merkle_root():
+            return []
+
+        own_steps = self.merkle["steps"]
+        other_steps = other.merkle["steps"]
+        changed_steps = {
+            step_id
+            for step_id in set(own_steps) | set(other_steps)
+            if own_steps.get(step_id) != other_steps.get(step_id)
+        }
+
+        differing = set()
+        for manifest, counterpart in ((self, other), (other, self)):
+            for key, artifact in manifest.artifacts.items():
+                if artifact["producer_step"] not in changed_steps:
+                    continue
+                counterpart_artifact = counterpart.get_artifact(key)
+                if counterpart_artifact is None or (
+                    self._content_digest(artifact) != self._content_digest(counterpart_artifact)
+                ):
+                    differing.add(key)
+
+        return sorted(differing)
+
     def save(self) -> None:
-        """Save manifest to file."""
-        save_json(self.artifacts, self.manifest_path)
+        """Save manifest to file (with Merkle digest).
+
+        Raises:
+            RuntimeError: If the manifest is backed by a job archive
+        """
+        if self.archive is not None:
+            raise RuntimeError(f"Packed manifest is read-only: {self.archive.archive_path}")
+
+        self.merkle = self.compute_merkle()
+        save_json(
+            {**self.artifacts, MERKLE_KEY: self.merkle},
+            self.manifest_path,
+            compact=self.config.serialization.compact_manifests,
+        )
         logger.debug(f"Manifest saved: {self.manifest_path}")
 
     def get_all_artifacts(self) -> Dict[str, Dict[str, Any]]:
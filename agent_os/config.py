@@ -1,10 +1,10 @@
 """Configuration loader (SSOT: spec/agent_os.yaml)."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 
-from .utils import load_yaml, get_logger
+from .utils import load_yaml, set_json_backend, configure_yaml_cache, get_logger
 
 logger = get_logger(__name__)
 
@@ -25,6 +25,7 @@ class PathsConfig:
     logs_dir: str
     artifacts_dir: str
     cache_dir: str
+    job_index: str = "work/jobs.sqlite"
 
 
 @dataclass
@@ -41,6 +42,27 @@ class ArtifactsConfig:
     include_hashes: bool
     include_tool_versions: bool
     reuse_if_validated: bool
+    compress_min_size: int = 0
+    compress_codec: str = "auto"
+    compress_suffixes: List[str] = field(default_factory=lambda: [".json", ".jsonl", ".txt", ".srt"])
+    dedup: bool = False
+
+
+@dataclass
+class SerializationConfig:
+    """Serialization configuration."""
+    json_backend: str = "auto"
+    compact_manifests: bool = True
+    compact_artifacts: bool = False
+
+
+@dataclass
+class CacheConfig:
+    """Process-independent cache configuration."""
+    root: str = "work/.cache"
+    yaml_disk_cache: bool = False
+    plan_disk_cache: bool = True
+    validation_results: bool = True
 
 
 @dataclass
@@ -48,6 +70,7 @@ class ValidationConfig:
     """Validation configuration."""
     jsonschema_strict: bool
     fail_fast: bool
+    codegen: bool = True
 
 
 @dataclass
@@ -75,6 +98,8 @@ class AgentOSConfig:
     paths: PathsConfig
     memory_bank: MemoryBankConfig
     artifacts: ArtifactsConfig
+    serialization: SerializationConfig
+    cache: CacheConfig
     validation: ValidationConfig
     llm: LLMConfig
     tasks: TasksConfig
@@ -92,6 +117,15 @@ class AgentOSConfig:
         logger.info(f"Loading SSOT from {spec_path}")
         data = load_yaml(spec_path)
 
+        serialization = SerializationConfig(**data.get("serialization", {}))
+        backend = set_json_backend(serialization.json_backend)
+        logger.info(f"JSON backend: {backend}")
+
+        cache = CacheConfig(**data.get("cache", {}))
+        if cache.yaml_disk_cache:
+            # Pickles are private to the user, like compiled plans (not under the shared cache root)
+            configure_yaml_cache(Path(data["paths"]["work_root"]) / "yaml")
+
         return cls(
             version=data["version"],
             last_updated=data["last_updated"],
@@ -99,6 +133,8 @@ class AgentOSConfig:
             paths=PathsConfig(**data["paths"]),
             memory_bank=MemoryBankConfig(**data["memory_bank"]),
             artifacts=ArtifactsConfig(**data["artifacts"]),
+            serialization=serialization,
+            cache=cache,
             validation=ValidationConfig(**data["validation"]),
             llm=LLMConfig(**data["llm"]),
             tasks=TasksConfig(**data["tasks"]),
@@ -1,9 +1,14 @@
 """Command executors."""
 
-from .shell import execute_shell
+from .shell import execute_shell, ResourceLimits
 from .python import execute_python
+from .async_shell import execute_shell_async, execute_many_async, execute_many
 
 __all__ = [
     "execute_shell",
+    "ResourceLimits",
     "execute_python",
+    "execute_shell_async",
+    "execute_many_async",
+    "execute_many",
 ]
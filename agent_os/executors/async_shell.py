@@ -0,0 +1,241 @@
+"""Asyncio shell executor for running many short commands concurrently."""
+
+import asyncio
+import os
+import signal
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from ..utils import get_logger
+
+logger = get_logger(__name__)
+
+# Command as a shell string (run via /bin/sh -c) or an argv list (no shell)
+Command = Union[str, Sequence[str]]
+
+
+def _command_argv(command: Command) -> List[str]:
+    if isinstance(command, str):
+        return ["/bin/sh", "-c", command]
+    return [str(arg) for arg in command]
+
+
+def _command_text(command: Command) -> str:
+    return command if isinstance(command, str) else " ".join(str(arg) for arg in command)
+
+
+def _kill_process_group(process: asyncio.subprocess.Process) -> None:
+    """Kill the command and everything it spawned (own process group)."""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def execute_shell_async(
+    command: Command,
+    workdir: Optional[Path] = None,
+    log_file: Optional[Path] = None,
+    timeout: Optional[float] = 300,
+    semaphore: Optional[asyncio.Semaphore] = None
+) -> Dict[str, Any]:
+    """Execute shell command without blocking the event loop.
+
+    The command runs in its own process group, which is killed on timeout
+    or when the awaiting task is cancelled (CancelledError is re-raised).
+
+    Args:
+        command: Shell command string, or argv list executed directly
+        workdir: Working directory
+        log_file: Log file path
+        timeout: Timeout in seconds (None = no limit)
+        semaphore: Concurrency limit shared with other commands
+
+    Returns:
+        Execution result dict (same keys as execute_shell, plus elapsed_sec)
+    """
+    if semaphore is not None:
+        async with semaphore:
+            return await _execute(command, workdir, log_file, timeout)
+    return await _execute(command, workdir, log_file, timeout)
+
+
+async def _execute(
+    command: Command,
+    workdir: Optional[Path],
+    log_file: Optional[Path],
+    timeout: Optional[float]
+) -> Dict[str, Any]:
+    text = _command_text(command)
+    logger.info(f"Executing shell command: {text}")
+    start = time.monotonic()
+
+    spawn = asyncio.ensure_future(asyncio.create_subprocess_exec(
+        *_command_argv(command),
+        cwd=workdir,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        start_new_session=True,
+    ))
+    try:
+        process = await asyncio.shield(spawn)
+    except asyncio.CancelledError:
+        # Cancelled while spawning: the process may still start, so kill it too
+        try:
+            process = await spawn
+        except Exception:
+            raise asyncio.CancelledError()
+        _kill_process_group(process)
+        await process.wait()
+        raise
+    except Exception as e:
+        logger.error(f"Command execution error: {e}")
+        return {
+            "command": text,
+            "returncode": -1,
+            "stdout": "",
+            "stderr": str(e),
+            "success": False,
+            "elapsed_sec": round(time.monotonic() - start, 3)
+        }
+
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        _kill_process_group(process)
+        await process.wait()
+        logger.error(f"Command timed out after {timeout}s: {text}")
+        return {
+            "command": text,
+            "returncode": -1,
+            "stdout": "",
+            "stderr": f"Timeout after {timeout}s",
+            "success": False,
+            "elapsed_sec": round(time.monotonic() - start, 3)
+        }
+    except asyncio.CancelledError:
+        _kill_process_group(process)
+        await asyncio.shield(process.wait())
+        logger.warning(f"Command cancelled: {text}")
+        raise
+
+    stdout_text = stdout.decode('utf-8', errors='replace')
+    stderr_text = stderr.decode('utf-8', errors='replace')
+
+    if log_file:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(log_file, 'w', encoding='utf-8') as f:
+            f.write(f"Command: {text}\n")
+            f.write(f"Return code: {process.returncode}\n")
+            f.write(f"\n--- STDOUT ---\n{stdout_text}\n")
+            f.write(f"\n--- STDERR ---\n{stderr_text}\n")
+
+    if process.returncode != 0:
+        logger.error(f"Command failed with code {process.returncode}: {text}")
+        logger.error(f"STDERR: {stderr_text}")
+
+    return {
+        "command": text,
+        "returncode": process.returncode,
+        "stdout": stdout_text,
+        "stderr": stderr_text,
+        "success": process.returncode == 0,
+        "elapsed_sec": round(time.monotonic() - start, 3)
+    }
+
+
+async def execute_many_async(
+    commands: Sequence[Command],
+    max_concurrency: Optional[int] = None,
+    workdir: Optional[Path] = None,
+    log_dir: Optional[Path] = None,
+    timeout: Optional[float] = 300,
+    fail_fast: bool = False
+) -> Dict[str, Any]:
+    """Run commands concurrently, at most max_concurrency at a time.
+
+    Args:
+        commands: Commands (shell strings or argv lists)
+        max_concurrency: Concurrent processes (defaults to CPU count)
+        workdir: Working directory for all commands
+        log_dir: Directory for per-command logs (cmd_0000.log, ...)
+        timeout: Per-command timeout in seconds
+        fail_fast: Cancel remaining commands after the first failure
+
+    Returns:
+        Aggregated result: success, counts, per-command results in input
+        order (None for commands cancelled by fail_fast), elapsed_sec
+    """
+    start = time.monotonic()
+    semaphore = asyncio.Semaphore(max_concurrency or os.cpu_count() or 1)
+
+    def log_path(index: int) -> Optional[Path]:
+        return log_dir / f"cmd_{index:04d}.log" if log_dir else None
+
+    tasks = [
+        asyncio.ensure_future(execute_shell_async(command, workdir, log_path(i), timeout, semaphore))
+        for i, command in enumerate(commands)
+    ]
+
+    try:
+        if fail_fast:
+            for future in asyncio.as_completed(tasks):
+                if not (await future)["success"]:
+                    break
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        else:
+            await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    results = [
+        task.result() if task.done() and not task.cancelled() else None
+        for task in tasks
+    ]
+    succeeded = sum(1 for r in results if r is not None and r["success"])
+    failed = sum(1 for r in results if r is not None and not r["success"])
+    cancelled = sum(1 for r in results if r is None)
+
+    logger.info(f"Executed {len(commands)} commands: {succeeded} succeeded, "
+                f"{failed} failed, {cancelled} cancelled")
+    return {
+        "success": succeeded == len(commands),
+        "total": len(commands),
+        "succeeded": succeeded,
+        "failed": failed,
+        "cancelled": cancelled,
+        "results": results,
+        "elapsed_sec": round(time.monotonic() - start, 3)
+    }
+
+
+def execute_many(
+    commands: Sequence[Command],
+    max_concurrency: Optional[int] = None,
+    workdir: Optional[Path] = None,
+    log_dir: Optional[Path] = None,
+    timeout: Optional[float] = 300,
+    fail_fast: bool = False
+) -> Dict[str, Any]:
+    """Synchronous wrapper around execute_many_async for step code.
+
+    Args:
+        commands: Commands (shell strings or argv lists)
+        max_concurrency: Concurrent processes (defaults to CPU count)
+        workdir: Working directory for all commands
+        log_dir: Directory for per-command logs
+        timeout: Per-command timeout in seconds
+        fail_fast: Cancel remaining commands after the first failure
+
+    Returns:
+        Aggregated result (see execute_many_async)
+    """
+    return asyncio.run(execute_many_async(
+        commands, max_concurrency, workdir, log_dir, timeout, fail_fast
+    ))
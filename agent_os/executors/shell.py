@@ -1,50 +1,431 @@
 """Shell command executor."""
 
+import os
+import select
+import signal
 import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, IO, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 
 from ..utils import get_logger
 
 logger = get_logger(__name__)
 
+# Callback receiving (stream name, line) for each output line while streaming
+LineCallback = Callable[[str, str], None]
+
+# Default bytes of stdout/stderr kept (per stream) in streaming mode
+DEFAULT_MAX_OUTPUT_BYTES = 64 * 1024
+
+_READ_SIZE = 64 * 1024
+
+# Grace period for pipe readers after the process group was killed
+_PIPE_CLOSE_GRACE = 1.0
+
+
+@dataclass
+class ResourceLimits:
+    """Per-command rlimits (None = inherit). POSIX only."""
+    cpu_seconds: Optional[int] = None
+    address_space: Optional[int] = None
+    open_files: Optional[int] = None
+
+    def apply(self) -> None:
+        """Apply limits to the current process (runs in the child before exec)."""
+        for limit, value in (
+            (resource.RLIMIT_CPU, self.cpu_seconds),
+            (resource.RLIMIT_AS, self.address_space),
+            (resource.RLIMIT_NOFILE, self.open_files),
+        ):
+            if value is None:
+                continue
+            _, hard = resource.getrlimit(limit)
+            if hard != resource.RLIM_INFINITY:
+                value = min(value, hard)
+            if limit == resource.RLIMIT_CPU and (hard == resource.RLIM_INFINITY or value < hard):
+                # SIGXCPU at the soft limit, SIGKILL one second later
+                resource.setrlimit(limit, (value, value + 1))
+            else:
+                resource.setrlimit(limit, (value, value))
+
+
+def _spawn(command: str, workdir: Optional[Path], limits: Optional[ResourceLimits]) -> subprocess.Popen:
+    """Start command with piped output in its own process group."""
+    preexec_fn = None
+    if limits is not None:
+        if resource is None:
+            raise RuntimeError("Resource limits are not supported on this platform")
+        preexec_fn = limits.apply
+
+    return subprocess.Popen(
+        command,
+        shell=True,
+        cwd=workdir,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=os.name == "posix",
+        preexec_fn=preexec_fn,
+    )
+
+
+class _Reaper(threading.Thread):
+    """Reap the child with wait4 to capture its own resource usage."""
+
+    def __init__(self, process: subprocess.Popen):
+        super().__init__(name="shell-reaper", daemon=True)
+        self.process = process
+        self.rusage = None
+
+    def run(self) -> None:
+        if not hasattr(os, "wait4"):
+            self.process.wait()
+            return
+        try:
+            _, status, self.rusage = os.wait4(self.process.pid, 0)
+        except ChildProcessError:
+            # Already reaped elsewhere; no usage available
+            self.process.wait()
+            return
+        self.process.returncode = os.waitstatus_to_exitcode(status)
+
+
+def _wait(process: subprocess.Popen, pumps: List["_StreamPump"], timeout: Optional[float]) -> Tuple[bool, Any]:
+    """Wait for process and pipe readers, killing its process group on timeout.
+
+    The deadline also covers reading output: a background child that keeps
+    stdout/stderr open past the deadline is killed and its pipes are closed.
+
+    Returns:
+        (timed out, rusage of the command and its waited-for descendants or None)
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    def remaining() -> Optional[float]:
+        return None if deadline is None else max(deadline - time.monotonic(), 0)
+
+    reaper = _Reaper(process)
+    reaper.start()
+    reaper.join(remaining())
+    timed_out = reaper.is_alive()
+    if timed_out:
+        _kill_process_tree(process)
+        reaper.join()
+
+    for pump in pumps:
+        pump.join(remaining())
+    if any(pump.is_alive() for pump in pumps):
+        # Descendants still hold the pipes open
+        timed_out = True
+        _kill_process_tree(process)
+        for pump in pumps:
+            pump.join(_PIPE_CLOSE_GRACE)
+            pump.stop()
+        for pump in pumps:
+            pump.join()
+    return timed_out, reaper.rusage
+
+
+def _usage_report(rusage: Any, wall_sec: float) -> Dict[str, Any]:
+    """Resource usage dict for the result (CPU, peak RSS, block I/O)."""
+    report: Dict[str, Any] = {"wall_sec": round(wall_sec, 3)}
+    if rusage is None:
+        return report
+    # ru_maxrss is in KiB on Linux, bytes on macOS
+    max_rss = rusage.ru_maxrss if sys.platform == "darwin" else rusage.ru_maxrss * 1024
+    report.update({
+        "user_cpu_sec": round(rusage.ru_utime, 3),
+        "system_cpu_sec": round(rusage.ru_stime, 3),
+        "max_rss_bytes": max_rss,
+        "read_blocks": rusage.ru_inblock,
+        "write_blocks": rusage.ru_oublock,
+        "voluntary_switches": rusage.ru_nvcsw,
+        "involuntary_switches": rusage.ru_nivcsw,
+    })
+    return report
+
+
+class _TailBuffer:
+    """Keep the last max_bytes of a byte stream (everything if max_bytes is None)."""
+
+    def __init__(self, max_bytes: Optional[int]):
+        self.max_bytes = max_bytes
+        self.total = 0
+        self.truncated = False
+        self._chunks: deque = deque()
+        self._size = 0
+
+    def append(self, data: bytes) -> None:
+        self.total += len(data)
+        self._chunks.append(data)
+        self._size += len(data)
+        while self.max_bytes is not None and self._size > self.max_bytes:
+            excess = self._size - self.max_bytes
+            head = self._chunks[0]
+            if len(head) <= excess:
+                self._chunks.popleft()
+                self._size -= len(head)
+            else:
+                self._chunks[0] = head[excess:]
+                self._size -= excess
+            self.truncated = True
+
+    def getvalue(self) -> str:
+        return b"".join(self._chunks).decode('utf-8', errors='replace')
+
+
+class _StreamPump(threading.Thread):
+    """Read one pipe in chunks: tail buffer, log file and line callback."""
+
+    def __init__(
+        self,
+        name: str,
+        pipe: IO[bytes],
+        tail: _TailBuffer,
+        log: Optional[IO[str]],
+        log_lock: Optional[threading.Lock] = None,
+        on_line: Optional[LineCallback] = None,
+        max_line_bytes: Optional[int] = None
+    ):
+        super().__init__(name=f"shell-{name}", daemon=True)
+        self.stream_name = name
+        self.pipe = pipe
+        self.tail = tail
+        self.log = log
+        self.log_lock = log_lock
+        self.on_line = on_line
+        self.max_line_bytes = max_line_bytes or DEFAULT_MAX_OUTPUT_BYTES
+        self.split_lines = log is not None or on_line is not None
+        self._partial = b""
+        self._after_cr = False
+        self._stopped = threading.Event()
+
+    def stop(self) -> None:
+        """Stop reading and close the pipe (output still held open by others)."""
+        self._stopped.set()
+
+    def run(self) -> None:
+        fd = self.pipe.fileno()
+        try:
+            while not self._stopped.is_set():
+                if os.name == "posix":
+                    readable, _, _ = select.select([fd], [], [], 0.1)
+                    if not readable:
+                        continue
+                chunk = os.read(fd, _READ_SIZE)
+                if not chunk:
+                    break
+                self.tail.append(chunk)
+                if self.split_lines:
+                    self._split_lines(chunk)
+            if self._partial:
+                self._emit(self._partial)
+        finally:
+            self.pipe.close()
+
+    def _split_lines(self, chunk: bytes) -> None:
+        # "\r" also ends a line (progress output such as ffmpeg's)
+        if self._after_cr and chunk.startswith(b"\n"):
+            # "\n" of a "\r\n" pair split across reads
+            chunk = chunk[1:]
+        self._after_cr = chunk.endswith(b"\r")
+
+        data = self._partial + chunk
+        if b"\r" in data:
+            data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        lines = data.split(b"\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self._emit(line)
+
+        if len(self._partial) > self.max_line_bytes:
+            self._emit(self._partial)
+            self._partial = b""
+
+    def _emit(self, raw: bytes) -> None:
+        line = raw.decode('utf-8', errors='replace')
+        if self.log is not None:
+            with self.log_lock:
+                self.log.write(f"[{self.stream_name}] {line}\n")
+        if self.on_line is not None:
+            try:
+                self.on_line(self.stream_name, line)
+            except Exception as e:
+                logger.warning(f"Line callback error ({self.stream_name}): {e}")
+
+
+def _kill_process_tree(process: subprocess.Popen) -> None:
+    """Kill the command and everything it spawned (own process group on POSIX)."""
+    try:
+        if os.name == "posix":
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _execute_streaming(
+    command: str,
+    workdir: Optional[Path],
+    log_file: Optional[Path],
+    timeout: int,
+    max_output_bytes: int,
+    on_line: Optional[LineCallback],
+    limits: Optional[ResourceLimits]
+) -> Dict[str, Any]:
+    """Run command, teeing output to log file and bounded tail buffers."""
+    log = None
+    if log_file:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        log = open(log_file, 'w', encoding='utf-8')
+        log.write(f"Command: {command}\n\n")
+        log.flush()
+
+    try:
+        start = time.monotonic()
+        process = _spawn(command, workdir, limits)
+
+        log_lock = threading.Lock()
+        tails = {"stdout": _TailBuffer(max_output_bytes), "stderr": _TailBuffer(max_output_bytes)}
+        pumps = [
+            _StreamPump(name, pipe, tails[name], log, log_lock, on_line, max_output_bytes)
+            for name, pipe in (("stdout", process.stdout), ("stderr", process.stderr))
+        ]
+        for pump in pumps:
+            pump.start()
+
+        timed_out, rusage = _wait(process, pumps, timeout)
+        returncode = -1 if timed_out else process.returncode
+
+        stderr = tails["stderr"].getvalue()
+        if timed_out:
+            logger.error(f"Command timed out after {timeout}s")
+            stderr += f"\nTimeout after {timeout}s"
+        elif returncode != 0:
+            logger.error(f"Command failed with code {returncode}")
+            logger.error(f"STDERR (tail): {stderr}")
+        else:
+            logger.info("Command succeeded")
+
+        if log is not None:
+            log.write(f"\nReturn code: {returncode}\n")
+
+        return {
+            "command": command,
+            "returncode": returncode,
+            "stdout": tails["stdout"].getvalue(),
+            "stderr": stderr,
+            "success": returncode == 0 and not timed_out,
+            "stdout_bytes": tails["stdout"].total,
+            "stderr_bytes": tails["stderr"].total,
+            "output_truncated": tails["stdout"].truncated or tails["stderr"].truncated,
+            "resources": _usage_report(rusage, time.monotonic() - start),
+        }
+
+    finally:
+        if log is not None:
+            log.close()
+
+
+def _decode_text(data: str) -> str:
+    """Decode captured output like text-mode pipes (universal newlines)."""
+    return data.replace("\r\n", "\n").replace("\r", "\n")
+
 
 def execute_shell(
     command: str,
     workdir: Optional[Path] = None,
     log_file: Optional[Path] = None,
-    timeout: int = 300
+    timeout: int = 300,
+    stream: bool = False,
+    max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+    on_line: Optional[LineCallback] = None,
+    limits: Optional[ResourceLimits] = None
 ) -> Dict[str, Any]:
     """Execute shell command.
 
+    In streaming mode (stream=True, implied by on_line) output is written to
+    the log file as it arrives and only the last max_output_bytes of each
+    stream are kept for the result, so memory stays bounded for verbose
+    commands. Lines end at "\\n" or "\\r".
+
+    The result's "resources" entry reports wall time and, on POSIX, the CPU
+    time, peak RSS and block I/O of the command and its waited-for children.
+
     Args:
         command: Shell command
         workdir: Working directory
         log_file: Log file path
         timeout: Timeout in seconds
+        stream: Stream output instead of capturing it whole
+        max_output_bytes: Bytes of stdout/stderr tail kept per stream (streaming)
+        on_line: Callback(stream name, line) for each output line (streaming)
+        limits: rlimits applied to the command (CPU seconds, address space,
+            open files)
 
     Returns:
-        Execution result dict
+        Execution result dict (streaming adds stdout_bytes, stderr_bytes,
+        output_truncated; stdout/stderr then hold the tails)
     """
     logger.info(f"Executing shell command: {command}")
 
+    if stream or on_line is not None:
+        try:
+            return _execute_streaming(command, workdir, log_file, timeout, max_output_bytes, on_line, limits)
+        except Exception as e:
+            logger.error(f"Command execution error: {e}")
+            return {
+                "command": command,
+                "returncode": -1,
+                "stdout": "",
+                "stderr": str(e),
+                "success": False
+            }
+
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            cwd=workdir,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            encoding='utf-8'
-        )
+        start = time.monotonic()
+        process = _spawn(command, workdir, limits)
+
+        tails = {"stdout": _TailBuffer(None), "stderr": _TailBuffer(None)}
+        pumps = [
+            _StreamPump(name, pipe, tails[name], None)
+            for name, pipe in (("stdout", process.stdout), ("stderr", process.stderr))
+        ]
+        for pump in pumps:
+            pump.start()
 
+        timed_out, rusage = _wait(process, pumps, timeout)
+
+        if timed_out:
+            logger.error(f"Command timed out after {timeout}s")
+            return {
+                "command": command,
+                "returncode": -1,
+                "stdout": "",
+                "stderr": f"Timeout after {timeout}s",
+                "success": False,
+                "resources": _usage_report(rusage, time.monotonic() - start)
+            }
+
+        stdout = _decode_text(tails["stdout"].getvalue())
+        stderr = _decode_text(tails["stderr"].getvalue())
         output = {
             "command": command,
-            "returncode": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-            "success": result.returncode == 0
+            "returncode": process.returncode,
+            "stdout": stdout,
+            "stderr": stderr,
+            "success": process.returncode == 0,
+            "resources": _usage_report(rusage, time.monotonic() - start)
         }
 
         # Write log if specified
@@ -52,28 +433,18 @@ def execute_shell(
             log_file.parent.mkdir(parents=True, exist_ok=True)
             with open(log_file, 'w', encoding='utf-8') as f:
                 f.write(f"Command: {command}\n")
-                f.write(f"Return code: {result.returncode}\n")
-                f.write(f"\n--- STDOUT ---\n{result.stdout}\n")
-                f.write(f"\n--- STDERR ---\n{result.stderr}\n")
+                f.write(f"Return code: {process.returncode}\n")
+                f.write(f"\n--- STDOUT ---\n{stdout}\n")
+                f.write(f"\n--- STDERR ---\n{stderr}\n")
 
-        if result.returncode != 0:
-            logger.error(f"Command failed with code {result.returncode}")
-            logger.error(f"STDERR: {result.stderr}")
+        if process.returncode != 0:
+            logger.error(f"Command failed with code {process.returncode}")
+            logger.error(f"STDERR: {stderr}")
         else:
             logger.info("Command succeeded")
 
         return output
 
-    except subprocess.TimeoutExpired as e:
-        logger.error(f"Command timed out after {timeout}s")
-        return {
-            "command": command,
-            "returncode": -1,
-            "stdout": "",
-            "stderr": f"Timeout after {timeout}s",
-            "success": False
-        }
-
     except Exception as e:
         logger.error(f"Command execution error: {e}")
         return {
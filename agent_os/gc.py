@@ -0,0 +1,219 @@
+"""Size-budgeted garbage collection for job workdirs."""
+
+import os
+import shutil
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .artifacts import ArtifactManifest
+from .config import get_config
+from .jobindex import Inode, JobIndex, compute_dir_size
+from .utils import get_logger
+
+logger = get_logger(__name__)
+
+_SIZE_UNITS = {"": 1, "B": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+def parse_size(text: str) -> int:
+    """Parse human-readable size (e.g. "200G", "512M", "1024").
+
+    Args:
+        text: Size string (binary units)
+
+    Returns:
+        Size in bytes
+
+    Raises:
+        ValueError: If the size cannot be parsed
+    """
+    value = text.strip().upper().removesuffix("IB").removesuffix("B") or "0"
+    unit = value[-1] if value[-1] in _SIZE_UNITS else ""
+    number = value[:-1] if unit else value
+    try:
+        return int(float(number) * _SIZE_UNITS[unit])
+    except ValueError:
+        raise ValueError(f"Invalid size: {text}")
+
+
+# A running job whose index entry was not touched for this long is treated
+# as crashed (the runner touches it before every step)
+RUNNING_STALE_SEC = 24 * 3600
+
+
+def _trim_job(workdir: Path, dry_run: bool) -> int:
+    """Remove a job's cache files and unvalidated artifacts.
+
+    Args:
+        workdir: Job workdir
+        dry_run: Only measure
+
+    Returns:
+        Bytes reclaimed (hardlinked artifacts do not free space and are not counted)
+    """
+    config = get_config()
+    reclaimed = 0
+
+    cache_dir = workdir / config.paths.cache_dir
+    if cache_dir.exists():
+        reclaimed += compute_dir_size(cache_dir)
+        if not dry_run:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            cache_dir.mkdir(exist_ok=True)
+
+    manifest_path = workdir / config.artifacts.manifest_file
+    if manifest_path.exists():
+        manifest = ArtifactManifest(manifest_path)
+        unvalidated = [k for k, a in manifest.get_all_artifacts().items() if not a.get("validated", False)]
+        for key in unvalidated:
+            path = Path(manifest.get_artifact(key)["path"])
+            if path.exists():
+                stat = path.stat()
+                if stat.st_nlink == 1:
+                    reclaimed += stat.st_size
+                if not dry_run:
+                    path.unlink()
+            if not dry_run:
+                del manifest.artifacts[key]
+        if unvalidated and not dry_run:
+            manifest.save()
+
+    return reclaimed
+
+
+def _remove_pool_orphans(pool_root: Path, dry_run: bool) -> int:
+    """Remove pool entries no longer linked from any job.
+
+    Args:
+        pool_root: Content-addressed pool root
+        dry_run: Only measure
+
+    Returns:
+        Bytes reclaimed
+    """
+    reclaimed = 0
+    if not pool_root.exists():
+        return 0
+
+    for bucket in os.scandir(pool_root):
+        if not bucket.is_dir():
+            continue
+        for entry in os.scandir(bucket.path):
+            stat = entry.stat(follow_symlinks=False)
+            if stat.st_nlink == 1:
+                reclaimed += stat.st_size
+                if not dry_run:
+                    os.unlink(entry.path)
+    return reclaimed
+
+
+def collect_garbage(
+    max_size: int,
+    keep_last: int = 0,
+    dry_run: bool = False,
+    index: JobIndex = None,
+    running_stale_sec: float = RUNNING_STALE_SEC
+) -> Dict[str, Any]:
+    """Evict least-recently-used job data until indexed jobs fit the budget.
+
+    Usage comes from the job index (recorded when each job finished) and
+    only jobs used since are rescanned. Hardlinked (deduped) files are
+    counted once, so evicting a job only counts shared data once no other
+    job links it. Eviction order: cache files and unvalidated artifacts of
+    LRU jobs first, then whole LRU job workdirs. Pinned jobs, running jobs
+    (unless idle for running_stale_sec) and the keep_last most recently
+    used jobs are never touched. Orphaned pool entries are always removed.
+
+    Args:
+        max_size: Size budget in bytes
+        keep_last: Number of most recently used jobs to keep intact
+        dry_run: Report what would be reclaimed without deleting
+        index: Job index (defaults to the configured index)
+        running_stale_sec: Age after which a "running" job counts as crashed
+
+    Returns:
+        GC report (sizes, evicted and trimmed jobs, reclaimed bytes)
+    """
+    if index is None:
+        index = JobIndex()
+
+    jobs = index.list_jobs(most_recent_first=True)
+    protected = (
+        {job["job_id"] for job in jobs[:keep_last]}
+        | {job["job_id"] for job in jobs if job["pinned"]}
+        | {job["job_id"] for job in jobs
+           if job["status"] == "running" and job["last_used"] >= time.time() - running_stale_sec}
+    )
+    candidates: List[Dict[str, Any]] = [job for job in reversed(jobs) if job["job_id"] not in protected]
+
+    # Orphans from earlier evictions are not part of any job's usage
+    pool_root = Path(get_config().paths.work_root) / "pool"
+    stale_orphans = _remove_pool_orphans(pool_root, dry_run)
+    pool_reclaimed = stale_orphans
+
+    usage = {job["job_id"]: index.get_usage(job) for job in jobs}
+    shared_sizes: Dict[Inode, int] = {}
+    job_links: Counter = Counter()
+    for _, shared, links in usage.values():
+        shared_sizes.update(shared)
+        job_links.update(links)
+
+    size_before = sum(exclusive for exclusive, _, _ in usage.values()) + sum(shared_sizes.values())
+    size = size_before
+    trimmed: List[str] = []
+    evicted: List[str] = []
+
+    # Phase 1: caches and unvalidated artifacts (cheap to regenerate)
+    for job in candidates:
+        if size <= max_size:
+            break
+        reclaimed = _trim_job(Path(job["workdir"]), dry_run)
+        if reclaimed:
+            size -= reclaimed
+            trimmed.append(job["job_id"])
+            exclusive, shared, links = usage[job["job_id"]]
+            usage[job["job_id"]] = (max(exclusive - reclaimed, 0), shared, links)
+            if not dry_run:
+                index.update_size(job["job_id"])
+
+    # Phase 2: whole jobs; shared files are freed with their last job link
+    for job in candidates:
+        if size <= max_size:
+            break
+        exclusive, _, links = usage[job["job_id"]]
+        size -= exclusive
+        for inode, count in links.items():
+            job_links[inode] -= count
+            if job_links[inode] <= 0:
+                size -= shared_sizes[inode]
+        evicted.append(job["job_id"])
+        if not dry_run:
+            if os.path.isfile(job["workdir"]):
+                # Packed job archive
+                os.unlink(job["workdir"])
+            else:
+                shutil.rmtree(job["workdir"], ignore_errors=True)
+            index.remove(job["job_id"])
+
+    if evicted and not dry_run:
+        # Pool copies of data no remaining job links (already counted above)
+        pool_reclaimed += _remove_pool_orphans(pool_root, dry_run)
+
+    size_after = max(size, 0)
+    report = {
+        "dry_run": dry_run,
+        "max_size": max_size,
+        "size_before": size_before,
+        "size_after": size_after,
+        "jobs_total": len(jobs),
+        "jobs_protected": len(protected),
+        "jobs_trimmed": trimmed,
+        "jobs_evicted": evicted,
+        "pool_reclaimed": pool_reclaimed,
+        "reclaimed_bytes": size_before - size_after + stale_orphans,
+    }
+    logger.info(f"GC reclaimed {report['reclaimed_bytes']} bytes "
+                f"({len(trimmed)} trimmed, {len(evicted)} evicted)")
+    return report
@@ -1,11 +1,13 @@
 """Job management (job_id, workdir, paths)."""
 
+import sqlite3
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 from .config import get_config
+from .jobindex import JobIndex
 from .utils import compute_input_hash, get_logger
 
 logger = get_logger(__name__)
@@ -50,6 +52,17 @@ class Job:
         self.logs_dir.mkdir(exist_ok=True)
         self.artifacts_dir.mkdir(exist_ok=True)
         self.cache_dir.mkdir(exist_ok=True)
+        try:
+            JobIndex().register(
+                self.job_id,
+                self.workdir,
+                task_name=self.task_name,
+                input_hash=compute_input_hash(self.inputs),
+            )
+        except sqlite3.Error as e:
+            # The index is advisory; listing/GC can rebuild it from workdirs
+            logger.warning(f"Could not register job in index: {e}")
+
         logger.info(f"Workdir setup complete: {self.workdir}")
 
     def get_artifact_path(self, artifact_key: str) -> Path:
@@ -0,0 +1,439 @@
+"""Job index (SQLite) for listing jobs without scanning work/jobs."""
+
+import json
+import os
+import re
+import sqlite3
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .config import get_config
+from .utils import get_logger, load_json
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    workdir TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    pinned INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# Columns added after the first index version (name -> SQL type)
+_EXTRA_COLUMNS = {
+    "task_name": "TEXT",
+    "input_hash": "TEXT",
+    "status": "TEXT NOT NULL DEFAULT 'created'",
+    "started_at": "REAL",
+    "finished_at": "REAL",
+    "duration_sec": "REAL",
+    "exclusive_bytes": "INTEGER",
+    "shared_files": "TEXT",
+    "size_measured_at": "REAL",
+}
+
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS jobs_last_used ON jobs (last_used);
+CREATE INDEX IF NOT EXISTS jobs_task_name ON jobs (task_name);
+CREATE INDEX IF NOT EXISTS jobs_input_hash ON jobs (input_hash);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status);
+"""
+
+JOB_STATUSES = ("created", "running", "success", "failed")
+
+# Generated job IDs end in the input hash ("20250101_120000_1a2b3c4d")
+_GENERATED_JOB_ID_RE = re.compile(r"^\d{8}_\d{6}_([0-9a-f]{8})$")
+
+
+def compute_dir_size(path: Union[str, Path]) -> int:
+    """Compute total size of files under a directory.
+
+    Args:
+        path: Directory path
+
+    Returns:
+        Size in bytes (0 if missing; file size if path is a file, e.g. a packed job)
+    """
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+
+    total = 0
+    stack = [str(path)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
+# Hardlinked file identity (st_dev, st_ino)
+Inode = Tuple[int, int]
+
+# (bytes of single-link files, {inode: size} of hardlinked files, this job's links per inode)
+JobUsage = Tuple[int, Dict[Inode, int], Counter]
+
+
+def scan_job_usage(path: Union[str, Path]) -> JobUsage:
+    """Measure a job's disk usage, separating hardlinked (deduped) files.
+
+    Args:
+        path: Job workdir (or packed job archive)
+
+    Returns:
+        (exclusive bytes, {inode: size} of hardlinked files, number of
+        this job's links per hardlinked inode)
+    """
+    exclusive = 0
+    shared: Dict[Inode, int] = {}
+    links: Counter = Counter()
+
+    if os.path.isfile(path):
+        return os.path.getsize(path), shared, links
+
+    stack = [str(path)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    stat = entry.stat(follow_symlinks=False)
+                    if stat.st_nlink > 1:
+                        inode = (stat.st_dev, stat.st_ino)
+                        shared[inode] = stat.st_size
+                        links[inode] += 1
+                    else:
+                        exclusive += stat.st_size
+    return exclusive, shared, links
+
+
+def _usage_columns(usage: JobUsage) -> Tuple[int, int, str]:
+    """Get (size_bytes, exclusive_bytes, shared_files) column values for a usage."""
+    exclusive, shared, links = usage
+    shared_files = json.dumps([[dev, ino, size, links[(dev, ino)]] for (dev, ino), size in shared.items()])
+    return exclusive + sum(shared.values()), exclusive, shared_files
+
+
+class JobIndex:
+    """SQLite index of jobs (task, inputs, status, timings, size, pinning)."""
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None):
+        """Open (and create if needed) the index.
+
+        Args:
+            db_path: Path to SQLite file (defaults to paths.job_index)
+        """
+        self.config = get_config()
+        self.db_path = Path(db_path or self.config.paths.job_index)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+            existing = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for column, column_type in _EXTRA_COLUMNS.items():
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {column_type}")
+            conn.executescript(_INDEXES)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, commit on success and always close it."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def register(
+        self,
+        job_id: str,
+        workdir: Union[str, Path],
+        task_name: Optional[str] = None,
+        input_hash: Optional[str] = None
+    ) -> None:
+        """Register job (or mark it used if already indexed).
+
+        Args:
+            job_id: Job ID
+            workdir: Job workdir
+            task_name: Task name (kept if None)
+            input_hash: Hash of job inputs (kept if None)
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (job_id, workdir, created_at, last_used, task_name, input_hash) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(job_id) DO UPDATE SET last_used = excluded.last_used, "
+                "task_name = COALESCE(excluded.task_name, task_name), "
+                "input_hash = COALESCE(excluded.input_hash, input_hash)",
+                (job_id, str(workdir), now, now, task_name, input_hash),
+            )
+
+    def set_status(self, job_id: str, status: str) -> None:
+        """Record job status and timings.
+
+        "running" sets started_at; "success"/"failed" set finished_at and
+        duration_sec.
+
+        Args:
+            job_id: Job ID
+            status: One of JOB_STATUSES
+
+        Raises:
+            ValueError: If status is unknown
+        """
+        if status not in JOB_STATUSES:
+            raise ValueError(f"Unknown job status: {status}")
+
+        now = time.time()
+        with self._connect() as conn:
+            if status == "running":
+                conn.execute(
+                    "UPDATE jobs SET status = ?, started_at = ?, finished_at = NULL, duration_sec = NULL, "
+                    "last_used = ? WHERE job_id = ?",
+                    (status, now, now, job_id),
+                )
+            elif status == "created":
+                conn.execute("UPDATE jobs SET status = ? WHERE job_id = ?", (status, job_id))
+            else:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, finished_at = ?, duration_sec = ? - COALESCE(started_at, ?), "
+                    "last_used = ? WHERE job_id = ?",
+                    (status, now, now, now, now, job_id),
+                )
+
+    def touch(self, job_id: str) -> None:
+        """Mark job as recently used.
+
+        Args:
+            job_id: Job ID
+        """
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET last_used = ? WHERE job_id = ?", (time.time(), job_id))
+
+    def update_size(self, job_id: str, size_bytes: Optional[int] = None) -> int:
+        """Record job size on disk.
+
+        The workdir scan also records exclusive and hardlinked (shared) usage,
+        which garbage collection reads instead of rescanning the job.
+
+        Args:
+            job_id: Job ID
+            size_bytes: Size in bytes of a job without hardlinks (measured
+                from the workdir if None)
+
+        Returns:
+            Recorded size in bytes
+        """
+        if size_bytes is None:
+            job = self.get(job_id)
+            usage = scan_job_usage(job["workdir"]) if job else (0, {}, Counter())
+        else:
+            usage = (size_bytes, {}, Counter())
+        size_bytes, exclusive, shared_files = _usage_columns(usage)
+
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET size_bytes = ?, exclusive_bytes = ?, shared_files = ?, size_measured_at = ? "
+                "WHERE job_id = ?",
+                (size_bytes, exclusive, shared_files, time.time(), job_id),
+            )
+        return size_bytes
+
+    def get_usage(self, job: Dict[str, Any]) -> JobUsage:
+        """Get a job's recorded disk usage, rescanning only if it is stale.
+
+        Usage is stale if it was never measured or the job was used since.
+
+        Args:
+            job: Job row dict (from get/list_jobs)
+
+        Returns:
+            (exclusive bytes, {inode: size} of hardlinked files, this job's
+            links per hardlinked inode)
+        """
+        measured_at = job.get("size_measured_at")
+        if measured_at is None or job.get("exclusive_bytes") is None or measured_at < job["last_used"]:
+            self.update_size(job["job_id"])
+            job = self.get(job["job_id"]) or {**job, "exclusive_bytes": 0, "shared_files": "[]"}
+
+        shared: Dict[Inode, int] = {}
+        links: Counter = Counter()
+        for dev, ino, size, count in json.loads(job["shared_files"] or "[]"):
+            shared[(dev, ino)] = size
+            links[(dev, ino)] = count
+        return job["exclusive_bytes"], shared, links
+
+    def set_workdir(self, job_id: str, workdir: Union[str, Path]) -> None:
+        """Record new job location (e.g. after packing into an archive).
+
+        Args:
+            job_id: Job ID
+            workdir: Job workdir or archive path
+        """
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET workdir = ? WHERE job_id = ?", (str(workdir), job_id))
+
+    def set_pinned(self, job_id: str, pinned: bool = True) -> bool:
+        """Pin job (protect from garbage collection) or unpin it.
+
+        Args:
+            job_id: Job ID
+            pinned: Pin state
+
+        Returns:
+            True if job exists in the index
+        """
+        with self._connect() as conn:
+            cursor = conn.execute("UPDATE jobs SET pinned = ? WHERE job_id = ?", (int(pinned), job_id))
+            return cursor.rowcount > 0
+
+    def remove(self, job_id: str) -> None:
+        """Remove job from the index.
+
+        Args:
+            job_id: Job ID
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get indexed job.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Job row dict or None
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def list_jobs(self, most_recent_first: bool = True) -> List[Dict[str, Any]]:
+        """List indexed jobs ordered by last use.
+
+        Args:
+            most_recent_first: Sort order
+
+        Returns:
+            List of job row dicts
+        """
+        order = "DESC" if most_recent_first else "ASC"
+        with self._connect() as conn:
+            rows = conn.execute(f"SELECT * FROM jobs ORDER BY last_used {order}").fetchall()
+        return [dict(row) for row in rows]
+
+    def find(
+        self,
+        task_name: Optional[str] = None,
+        input_hash: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Find jobs matching all given filters (most recently used first).
+
+        Args:
+            task_name: Task name
+            input_hash: Hash of job inputs (prefix match)
+            status: Job status
+            limit: Maximum number of jobs
+
+        Returns:
+            List of job row dicts
+        """
+        clauses, params = [], []
+        if task_name is not None:
+            clauses.append("task_name = ?")
+            params.append(task_name)
+        if input_hash is not None:
+            clauses.append("input_hash LIKE ?")
+            params.append(input_hash + "%")
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+
+        query = "SELECT * FROM jobs"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY last_used DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def total_size(self) -> int:
+        """Get total indexed size.
+
+        Returns:
+            Size in bytes
+        """
+        with self._connect() as conn:
+            return conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM jobs").fetchone()[0]
+
+    def rebuild(self, workdirs: List[Path]) -> int:
+        """Index existing workdirs (one-time scan for jobs created before the index).
+
+        Status, task name and input hash are taken from execution_summary.json
+        when present; the input hash of generated job IDs is also read from
+        the ID. Values already in the index are kept.
+
+        Args:
+            workdirs: Job workdirs (directory name is the job_id)
+
+        Returns:
+            Number of jobs indexed
+        """
+        for workdir in workdirs:
+            mtime = workdir.stat().st_mtime
+            status = "created"
+            summary = {}
+            summary_path = workdir / "execution_summary.json"
+            if summary_path.exists():
+                summary = load_json(summary_path)
+                status = "success" if summary.get("success") else "failed"
+
+            input_hash = summary.get("input_hash")
+            match = _GENERATED_JOB_ID_RE.match(workdir.name)
+            if input_hash is None and match:
+                input_hash = match.group(1)
+
+            size_bytes, exclusive, shared_files = _usage_columns(scan_job_usage(workdir))
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT INTO jobs (job_id, workdir, size_bytes, exclusive_bytes, shared_files, "
+                    "size_measured_at, created_at, last_used, status, task_name, input_hash) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(job_id) DO UPDATE SET size_bytes = excluded.size_bytes, "
+                    "exclusive_bytes = excluded.exclusive_bytes, shared_files = excluded.shared_files, "
+                    "size_measured_at = excluded.size_measured_at, "
+                    "task_name = COALESCE(task_name, excluded.task_name), "
+                    "input_hash = COALESCE(input_hash, excluded.input_hash)",
+                    (workdir.name, str(workdir), size_bytes, exclusive, shared_files, time.time(),
+                     mtime, mtime, status, summary.get("task_name"), input_hash),
+                )
+        return len(workdirs)
@@ -0,0 +1,260 @@
+"""Compiled task plans (validated spec, resolved steps, dependency graph)."""
+
+import copy
+import pickle
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from .config import get_config
+from .step import Step
+from .steps_builtin import BUILTIN_STEP_CLASSES
+from .utils import compute_sha256, is_trusted_file, load_yaml, write_private_file, get_logger
+
+logger = get_logger(__name__)
+
+# Bump when the pickled plan layout changes
+PLAN_FORMAT_VERSION = 1
+
+_PLACEHOLDER_RE = re.compile(r"\{([^{}]*)\}")
+
+# In-process cache: spec digest -> TaskPlan
+_plan_cache: Dict[str, "TaskPlan"] = {}
+
+
+class ConfigTemplate:
+    """Config string with {input_key} placeholders, split once at compile time."""
+
+    def __init__(self, template: str):
+        """Compile template.
+
+        Args:
+            template: String containing {input_key} placeholders
+        """
+        self.template = template
+        self.parts: List[Tuple[bool, str]] = []
+
+        pos = 0
+        for match in _PLACEHOLDER_RE.finditer(template):
+            if match.start() > pos:
+                self.parts.append((False, template[pos:match.start()]))
+            self.parts.append((True, match.group(1)))
+            pos = match.end()
+        if pos < len(template):
+            self.parts.append((False, template[pos:]))
+
+    def render(self, inputs: Dict[str, Any]) -> str:
+        """Render template (unknown placeholders are kept verbatim).
+
+        Args:
+            inputs: Input parameters
+
+        Returns:
+            Rendered string
+        """
+        rendered = []
+        for is_field, text in self.parts:
+            if not is_field:
+                rendered.append(text)
+            elif text in inputs:
+                rendered.append(str(inputs[text]))
+            else:
+                rendered.append("{" + text + "}")
+        return "".join(rendered)
+
+
+@dataclass
+class StepPlan:
+    """Compiled step definition."""
+    step_id: str
+    name: str
+    step_class: Type[Step]
+    static_config: Dict[str, Any]
+    templates: Dict[str, ConfigTemplate]
+    inputs: List[str]
+    outputs: List[str]
+    validator: Dict[str, Any]
+    depends_on: List[str] = field(default_factory=list)
+
+    def instantiate(self, inputs: Dict[str, Any]) -> Step:
+        """Create Step instance for given inputs.
+
+        Args:
+            inputs: Input parameters
+
+        Returns:
+            Step instance
+        """
+        config = copy.deepcopy(self.static_config)
+        for key, template in self.templates.items():
+            config[key] = template.render(inputs)
+
+        return self.step_class(
+            step_id=self.step_id,
+            name=self.name,
+            config={
+                **config,
+                "inputs": list(self.inputs),
+                "outputs": list(self.outputs),
+                "validator": copy.deepcopy(self.validator),
+            }
+        )
+
+
+@dataclass
+class TaskPlan:
+    """Compiled task specification."""
+    name: str
+    description: str
+    spec_digest: str
+    steps: List[StepPlan]
+
+    @classmethod
+    def compile(
+        cls,
+        task_spec: Dict[str, Any],
+        spec_digest: str = "",
+        step_classes: Optional[Dict[str, Type[Step]]] = None
+    ) -> "TaskPlan":
+        """Compile task spec into a plan.
+
+        Args:
+            task_spec: Task specification
+            spec_digest: SHA256 of the spec file (cache key)
+            step_classes: Step type registry (defaults to built-in steps)
+
+        Returns:
+            TaskPlan instance
+
+        Raises:
+            ValueError: If the spec is invalid
+        """
+        if step_classes is None:
+            step_classes = BUILTIN_STEP_CLASSES
+
+        steps: List[StepPlan] = []
+        producers: Dict[str, str] = {}
+
+        for step_config in task_spec["steps"]:
+            for required in ("id", "name", "type"):
+                if required not in step_config:
+                    raise ValueError(f"Step definition missing '{required}': {step_config}")
+
+            step_id = step_config["id"]
+            step_type = step_config["type"]
+            step_class = step_classes.get(step_type)
+
+            if not step_class:
+                raise ValueError(f"Unknown step type: {step_type}")
+
+            if any(s.step_id == step_id for s in steps):
+                raise ValueError(f"Duplicate step id: {step_id}")
+
+            static_config = {}
+            templates = {}
+            for key, value in (step_config.get("config") or {}).items():
+                if isinstance(value, str) and "{" in value:
+                    templates[key] = ConfigTemplate(value)
+                else:
+                    static_config[key] = value
+
+            inputs = list(step_config.get("inputs", []))
+            outputs = list(step_config.get("outputs", []))
+            depends_on = sorted({producers[key] for key in inputs if key in producers})
+
+            steps.append(StepPlan(
+                step_id=step_id,
+                name=step_config["name"],
+                step_class=step_class,
+                static_config=static_config,
+                templates=templates,
+                inputs=inputs,
+                outputs=outputs,
+                validator=step_config.get("validator", {}),
+                depends_on=depends_on,
+            ))
+
+            for output_key in outputs:
+                producers[output_key] = step_id
+
+        return cls(
+            name=task_spec["name"],
+            description=task_spec.get("description", ""),
+            spec_digest=spec_digest,
+            steps=steps,
+        )
+
+    def get_dependency_graph(self) -> Dict[str, List[str]]:
+        """Get step dependency graph.
+
+        Returns:
+            Dict of step_id -> step_ids producing its inputs
+        """
+        return {step.step_id: list(step.depends_on) for step in self.steps}
+
+    def instantiate(self, inputs: Dict[str, Any]) -> List[Step]:
+        """Create Step instances for a job.
+
+        Args:
+            inputs: Input parameters
+
+        Returns:
+            List of Step instances
+        """
+        return [step.instantiate(inputs) for step in self.steps]
+
+
+def _plan_cache_path(spec_digest: str) -> Path:
+    # Under the work root rather than the shared cache root: unpickling runs code
+    return Path(get_config().paths.work_root) / "plans" / f"{spec_digest}.v{PLAN_FORMAT_VERSION}.pickle"
+
+
+def load_task_plan(task_path: Union[str, Path], use_cache: bool = True) -> TaskPlan:
+    """Load compiled task plan, cached by spec file hash.
+
+    The on-disk cache is a pickle, so loading it executes code: it lives
+    under paths.work_root, is written private to the current user, and
+    files owned by another user or writable by group/others are ignored.
+
+    Args:
+        task_path: Path to task YAML
+        use_cache: Use in-process and on-disk plan caches
+
+    Returns:
+        TaskPlan instance
+    """
+    spec_digest = compute_sha256(task_path)
+
+    if use_cache:
+        plan = _plan_cache.get(spec_digest)
+        if plan is not None:
+            return plan
+
+    config = get_config()
+    disk_cache = use_cache and config.cache.plan_disk_cache
+    cache_path = _plan_cache_path(spec_digest)
+
+    if disk_cache and cache_path.exists():
+        try:
+            if not is_trusted_file(cache_path):
+                raise pickle.UnpicklingError("not owned by this user or writable by others")
+            with open(cache_path, 'rb') as f:
+                plan = pickle.load(f)
+            _plan_cache[spec_digest] = plan
+            logger.info(f"Loaded cached task plan: {cache_path}")
+            return plan
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logger.warning(f"Ignoring unreadable plan cache {cache_path}: {e}")
+
+    plan = TaskPlan.compile(load_yaml(task_path), spec_digest=spec_digest)
+
+    if use_cache:
+        _plan_cache[spec_digest] = plan
+    if disk_cache:
+        try:
+            write_private_file(cache_path, pickle.dumps(plan, protocol=pickle.HIGHEST_PROTOCOL))
+        except (OSError, pickle.PicklingError) as e:
+            logger.warning(f"Could not write plan cache {cache_path}: {e}")
+
+    return plan
@@ -1,14 +1,17 @@
 """Step runner (execution engine with retry/gate logic)."""
 
-from typing import List, Dict, Any
+import sqlite3
+from typing import Any, Callable, Dict, List
 from pathlib import Path
 
 from .config import get_config
 from .job import Job
+from .jobindex import JobIndex
 from .artifacts import ArtifactManifest
 from .memory import MemoryBank
 from .step import Step, StepContext
-from .utils import get_logger, save_json
+from .validators import ValidationResultCache, ValidatorPipeline
+from .utils import compute_input_hash, get_logger, save_json
 
 logger = get_logger(__name__)
 
@@ -40,6 +43,14 @@ class Runner:
         self.memory_bank.reset_active_context()
 
         self.ctx = StepContext(job, self.manifest, self.memory_bank)
+        self.validation_cache = None
+        if self.config.cache.validation_results:
+            # Advisory like the job index: validate uncached if it cannot be opened
+            try:
+                self.validation_cache = ValidationResultCache()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Validation result cache unavailable, validating uncached: {e}")
+        self.validation_reports: Dict[str, Dict[str, Any]] = {}
 
         logger.info(f"Runner initialized with {len(steps)} steps")
 
@@ -50,9 +61,21 @@ class Runner:
             Execution summary
         """
         logger.info("Starting step execution")
+        input_hash = compute_input_hash(self.job.inputs)
+
+        # The index is advisory: a locked or broken database must not fail the job
+        try:
+            index = JobIndex()
+            index.register(self.job.job_id, self.job.workdir, task_name=self.job.task_name, input_hash=input_hash)
+            index.set_status(self.job.job_id, "running")
+        except sqlite3.Error as e:
+            logger.warning(f"Job index unavailable, not recording this run: {e}")
+            index = None
 
         results = {
             "job_id": self.job.job_id,
+            "task_name": self.job.task_name,
+            "input_hash": input_hash,
             "steps_total": len(self.steps),
             "steps_executed": 0,
             "steps_skipped": 0,
@@ -62,38 +85,67 @@ class Runner:
             "failed_step": None
         }
 
-        for step in self.steps:
-            logger.info(f"\n{'=' * 60}")
-            logger.info(f"Step: {step.step_id} - {step.name}")
-            logger.info(f"{'=' * 60}")
-
-            try:
-                # Check if should skip (deterministic replay)
-                if step.should_skip(self.ctx):
-                    results["steps_skipped"] += 1
-                    logger.info(f"Skipped {step.step_id}")
-                    continue
-
-                # Execute step with retry logic
-                self._execute_step_with_retry(step)
-                results["steps_executed"] += 1
-
-            except StepExecutionError as e:
-                logger.error(f"Step {step.step_id} failed: {e}")
-                results["success"] = False
-                results["error"] = str(e)
-                results["failed_step"] = step.step_id
-                results["steps_failed"] += 1
+        # Final status is recorded even if the run is aborted by an unexpected error
+        finished = False
+        try:
+            for step in self.steps:
+                logger.info(f"\n{'=' * 60}")
+                logger.info(f"Step: {step.step_id} - {step.name}")
+                logger.info(f"{'=' * 60}")
+
+                # Heartbeat: GC treats jobs left "running" without one as crashed
+                if index is not None:
+                    self._update_index(lambda: index.touch(self.job.job_id))
+
+                try:
+                    # Check if should skip (deterministic replay)
+                    if step.should_skip(self.ctx):
+                        results["steps_skipped"] += 1
+                        logger.info(f"Skipped {step.step_id}")
+                        continue
+
+                    # Execute step with retry logic
+                    self._execute_step_with_retry(step)
+                    results["steps_executed"] += 1
+
+                except StepExecutionError as e:
+                    logger.error(f"Step {step.step_id} failed: {e}")
+                    results["success"] = False
+                    results["error"] = str(e)
+                    results["failed_step"] = step.step_id
+                    results["steps_failed"] += 1
+
+                    if self.config.runtime.stop_on_fail:
+                        logger.error("Stopping execution (stop_on_fail=true)")
+                        break
+
+            # Gate reports (per-check timings) of the last attempt of each step
+            results["validation"] = self.validation_reports
+
+            # Save execution summary
+            summary_path = self.job.workdir / "execution_summary.json"
+            save_json(results, summary_path)
+            finished = True
+        finally:
+            # Update job index (status, timings, size on disk)
+            if index is not None:
+                status = "success" if finished and results["success"] else "failed"
+                self._update_index(lambda: index.set_status(self.job.job_id, status))
+                self._update_index(lambda: index.update_size(self.job.job_id))
 
-                if self.config.runtime.stop_on_fail:
-                    logger.error("Stopping execution (stop_on_fail=true)")
-                    break
+        return results
 
-        # Save execution summary
-        summary_path = self.job.workdir / "execution_summary.json"
-        save_json(results, summary_path)
+    @staticmethod
+    def _update_index(update: Callable[[], Any]) -> None:
+        """Apply a job index update; the index is advisory, so errors only warn.
 
-        return results
+        Args:
+            update: Callable performing the update
+        """
+        try:
+            update()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not update job index: {e}")
 
     def _execute_step_with_retry(self, step: Step) -> None:
         """Execute step with retry logic (max 3 attempts).
@@ -117,6 +169,7 @@ class Runner:
                 logger.info(f"Step execution completed")
 
                 # Register outputs in manifest
+                compression = step.config.get("compression", {})
                 for output_key in step.outputs:
                     output_path = step.get_output_path(self.ctx, output_key)
                     if output_path.exists():
@@ -125,7 +178,8 @@ class Runner:
                             path=output_path,
                             producer_step=step.step_id,
                             inputs_used=step.inputs,
-                            validated=False
+                            validated=False,
+                            compression=compression.get(output_key)
                         )
 
                 # Validate (GATE)
@@ -161,7 +215,7 @@ class Runner:
                 logger.warning(f"Retrying {step.step_id} (attempt {attempt + 1}/{max_retries})")
 
     def _validate_step(self, step: Step) -> bool:
-        """Validate step outputs.
+        """Validate step outputs through the declarative validator pipeline.
 
         Args:
             step: Step to validate
@@ -171,12 +225,38 @@ class Runner:
         """
         logger.info(f"Validating {step.step_id}")
 
+        # Reuse outcome for identical outputs and validator (retries, replays, other jobs)
+        key = step.get_validation_key(self.ctx) if self.validation_cache is not None else None
+        if key is not None:
+            try:
+                cached = self.validation_cache.get(*key)
+            except sqlite3.Error as e:
+                logger.warning(f"Validation result cache lookup failed: {e}")
+                cached = None
+            if cached is not None:
+                logger.info(f"Using cached validation result for {step.step_id}: "
+                            f"{'passed' if cached else 'failed'}")
+                self.validation_reports[step.step_id] = {"passed": cached, "cached": True}
+                return cached
+
         try:
-            return step.validate(self.ctx)
+            report = ValidatorPipeline.from_step(step).run(step, self.ctx)
         except Exception as e:
             logger.error(f"Validation error: {e}")
             return False
 
+        self.validation_reports[step.step_id] = report
+        logger.info(f"Validation {'passed' if report['passed'] else 'failed'} for {step.step_id} "
+                    f"({len(report['checks'])} checks, {report['elapsed_ms']} ms)")
+
+        # Errors are not cached (may be transient)
+        if key is not None and not report["errored"]:
+            try:
+                self.validation_cache.put(*key, report["passed"])
+            except sqlite3.Error as e:
+                logger.warning(f"Could not record validation result: {e}")
+        return report["passed"]
+
     def _generate_failure_report(
         self,
         step: Step,
@@ -1,10 +1,26 @@
 """Step abstract class."""
 
+import hashlib
+import inspect
+import json
+import mmap
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
 
-from .utils import get_logger
+from .config import get_config
+from .validators import build_checks, check_record, compute_schema_digest, ValidatingJsonlWriter, RecordValidationError
+from .validators.records import RecordCheck
+from .utils import (
+    load_json,
+    save_json,
+    iter_json_items,
+    JsonlWriter,
+    TableWriter,
+    get_logger,
+)
 
 logger = get_logger(__name__)
 
@@ -24,11 +40,180 @@ class StepContext:
         self.manifest = manifest
         self.memory_bank = memory_bank
         self.step_data: Dict[str, Any] = {}
+        # Parsed output objects: key -> ((mtime_ns, size), data)
+        self.output_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        # Outputs validated while produced: key -> ((mtime_ns, size), schema path)
+        self.prevalidated: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+    def mark_prevalidated(self, key: str, path: Path, schema_path: str) -> None:
+        """Record that an output was validated against a schema while written.
+
+        Args:
+            key: Artifact key
+            path: Artifact file
+            schema_path: Schema every record/object was checked against
+        """
+        stat = Path(path).stat()
+        self.prevalidated[key] = ((stat.st_mtime_ns, stat.st_size), str(schema_path))
+
+    def is_prevalidated(self, key: str, path: Path, schema_path: str) -> bool:
+        """Check whether an unchanged output was already validated against a schema.
+
+        Args:
+            key: Artifact key
+            path: Artifact file
+            schema_path: Schema the gate would check
+
+        Returns:
+            True if the gate's schema check can be skipped
+        """
+        entry = self.prevalidated.get(key)
+        if entry is None or entry[1] != str(schema_path):
+            return False
+        try:
+            stat = Path(path).stat()
+        except FileNotFoundError:
+            return False
+        return entry[0] == (stat.st_mtime_ns, stat.st_size)
+
+    def cache_output(self, key: str, path: Path, data: Any) -> None:
+        """Remember the parsed object of an output just written.
+
+        Args:
+            key: Artifact key
+            path: Artifact file the object was saved to
+            data: Saved object (must not be mutated afterwards)
+        """
+        stat = Path(path).stat()
+        self.output_cache[key] = ((stat.st_mtime_ns, stat.st_size), data)
+
+    def get_cached_output(self, key: str, path: Path) -> Optional[Any]:
+        """Get the parsed object of an output if the file is unchanged since saving.
+
+        Args:
+            key: Artifact key
+            path: Artifact file
+
+        Returns:
+            Cached object, or None if absent or stale
+        """
+        entry = self.output_cache.get(key)
+        if entry is None:
+            return None
+        try:
+            stat = Path(path).stat()
+        except FileNotFoundError:
+            return None
+        if entry[0] != (stat.st_mtime_ns, stat.st_size):
+            return None
+        return entry[1]
+
+    def get_artifact_path(self, key: str) -> Path:
+        """Resolve artifact path through the manifest.
+
+        Args:
+            key: Artifact key
+
+        Returns:
+            Path to artifact file
+
+        Raises:
+            KeyError: If artifact is not in the manifest
+        """
+        artifact = self.manifest.get_artifact(key)
+        if artifact is None:
+            raise KeyError(f"Artifact not in manifest: {key}")
+        return Path(artifact["path"])
+
+    @contextmanager
+    def open_artifact_mmap(self, key: str) -> Iterator[memoryview]:
+        """Map artifact file read-only and expose it as a memoryview.
+
+        Slicing the view does not copy; the mapping is released on exit, so
+        slices must not outlive the with block.
+
+        Args:
+            key: Artifact key
+
+        Yields:
+            Read-only memoryview over the file contents
+
+        Raises:
+            ValueError: If the artifact is stored compressed
+        """
+        self.get_artifact_path(key)
+        if self.manifest.get_artifact(key).get("compression"):
+            raise ValueError(f"Cannot map compressed artifact: {key}")
+
+        # Packed jobs map the artifact's region of the archive file
+        path, offset, size = self.manifest.locate(key)
+        with open(path, 'rb') as f:
+            if size == 0:
+                # Empty files cannot be mapped
+                yield memoryview(b"")
+                return
+
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            view = memoryview(mapped)
+            region = view[offset:offset + size]
+            try:
+                yield region
+            finally:
+                region.release()
+                view.release()
+                mapped.close()
+
+    def read_artifact_bytes(self, key: str) -> memoryview:
+        """Read artifact file into a single buffer.
+
+        The file is read directly into a preallocated buffer; the returned
+        memoryview can be sliced without further copies. Compressed
+        artifacts are decompressed into the buffer.
+
+        Args:
+            key: Artifact key
+
+        Returns:
+            memoryview over the file contents
+        """
+        self.get_artifact_path(key)
+        artifact = self.manifest.get_artifact(key)
+        size = artifact.get("raw_size")
+        if size is None:
+            size = self.manifest.locate(key)[2]
+        with self.manifest.open_artifact(key) as f:
+            buffer = bytearray(size)
+            view = memoryview(buffer)
+            filled = 0
+            while filled < len(buffer):
+                n = f.readinto(view[filled:])
+                if not n:
+                    break
+                filled += n
+        return view[:filled]
+
+
+@lru_cache(maxsize=None)
+def _class_source_digest(cls: type) -> Optional[str]:
+    """Digest of a step class's source and of its Step base classes (None if unavailable)."""
+    sources = []
+    for klass in cls.__mro__:
+        if not (isinstance(klass, type) and issubclass(klass, Step)):
+            continue
+        try:
+            sources.append(inspect.getsource(klass))
+        except (OSError, TypeError):
+            return None
+    return hashlib.sha256("\n".join(sources).encode('utf-8')).hexdigest()
 
 
 class Step(ABC):
     """Abstract step class."""
 
+    # Bump when validate() changes in a way the class source does not show
+    # (e.g. behavior of a helper it calls); part of the gate cache key
+    VALIDATOR_VERSION = 1
+
     def __init__(self, step_id: str, name: str, config: Dict[str, Any]):
         """Initialize step.
 
@@ -43,6 +228,7 @@ class Step(ABC):
         self.inputs: List[str] = config.get("inputs", [])
         self.outputs: List[str] = config.get("outputs", [])
         self.validator_config = config.get("validator", {})
+        self.record_checks: Dict[str, List[RecordCheck]] = {}
 
     @abstractmethod
     def run(self, ctx: StepContext) -> Dict[str, Any]:
@@ -57,7 +243,10 @@ class Step(ABC):
         pass
 
     def validate(self, ctx: StepContext) -> bool:
-        """Validate step outputs (gate).
+        """Validate step outputs (custom gate check).
+
+        Declarative checks from the validator block run first (see
+        validators.ValidatorPipeline); this method runs last as "custom".
 
         Args:
             ctx: Step context
@@ -66,13 +255,75 @@ class Step(ABC):
             True if validation passed
         """
         # Default implementation - can be overridden
-        if not self.validator_config:
-            logger.info(f"No validator configured for {self.step_id}")
-            return True
-
-        # Will be implemented by specific validators
         return True
 
+    def get_validation_key(self, ctx: StepContext) -> Optional[Tuple[str, str]]:
+        """Get key under which this step's gate outcome can be cached.
+
+        The artifact digest covers every output's content digest; the
+        validator identity covers the step class (name, VALIDATOR_VERSION
+        and source), its config, the expanded gate checks and the digest of
+        every schema they use (including the schemas it can $ref).
+        Override and return None if validate() depends on anything else.
+
+        Args:
+            ctx: Step context
+
+        Returns:
+            (artifact digest, validator identity), or None if not cacheable
+        """
+        digests = []
+        for output_key in sorted(self.outputs):
+            artifact = ctx.manifest.get_artifact(output_key)
+            digest = artifact and artifact.get("raw_sha256", artifact.get("sha256"))
+            if not digest:
+                return None
+            digests.append([output_key, digest])
+
+        checks = build_checks(self.validator_config, self.outputs)
+        schemas = {check.params["schema"] for check in checks if "schema" in check.params}
+        if self.validator_config.get("schema"):
+            schemas.add(self.validator_config["schema"])
+
+        identity = {
+            "class": f"{type(self).__module__}.{type(self).__qualname__}",
+            "version": type(self).VALIDATOR_VERSION,
+            "source": _class_source_digest(type(self)),
+            "config": self.config,
+            "checks": [[check.type, check.output_key, check.params] for check in checks],
+            "schemas": {str(schema): compute_schema_digest(schema) for schema in schemas},
+        }
+        artifact_digest = hashlib.sha256(json.dumps(digests).encode('utf-8')).hexdigest()
+        validator_id = hashlib.sha256(
+            json.dumps(identity, sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest()
+        return artifact_digest, validator_id
+
+    def register_record_check(self, output_key: str, check: RecordCheck) -> None:
+        """Register an incremental check applied to output records as they are written.
+
+        Args:
+            output_key: Output artifact key
+            check: Callable returning an error message, or None if the record is valid
+        """
+        self.record_checks.setdefault(output_key, []).append(check)
+
+    def get_output_schema(self, output_key: str) -> Optional[str]:
+        """Get schema the gate checks an output against (whole-document or per record).
+
+        Args:
+            output_key: Output artifact key
+
+        Returns:
+            Schema path, or None
+        """
+        for check in build_checks(self.validator_config, self.outputs):
+            if check.output_key != output_key or "prefix" in check.params:
+                continue
+            if check.type in ("jsonschema", "records"):
+                return check.params["schema"]
+        return None
+
     def on_fail(self, ctx: StepContext, error: Exception) -> Dict[str, str]:
         """Handle step failure.
 
@@ -123,6 +374,19 @@ class Step(ABC):
                 paths[input_key] = Path(artifact["path"])
         return paths
 
+    def iter_input_items(self, ctx: StepContext, input_key: str, prefix: str) -> Iterator[Any]:
+        """Iterate sub-trees of a JSON input artifact without loading it whole.
+
+        Args:
+            ctx: Step context
+            input_key: Input artifact key
+            prefix: Dotted path ("item" for array elements)
+
+        Returns:
+            Iterator over values at prefix
+        """
+        return iter_json_items(self.get_input_paths(ctx)[input_key], prefix)
+
     def get_output_path(self, ctx: StepContext, output_key: str) -> Path:
         """Get output artifact path.
 
@@ -134,3 +398,98 @@ class Step(ABC):
             Path to output artifact
         """
         return ctx.job.get_artifact_path(output_key)
+
+    def save_output_json(self, ctx: StepContext, output_key: str, data: Dict[str, Any]) -> Path:
+        """Save JSON output artifact (honors serialization config).
+
+        The object is checked against the output's gate schema and registered
+        record checks before writing.
+
+        Args:
+            ctx: Step context
+            output_key: Output artifact key
+            data: Data to save
+
+        Returns:
+            Path to output artifact
+
+        Raises:
+            RecordValidationError: If the object is invalid (nothing is written)
+        """
+        schema_path = self.get_output_schema(output_key)
+        message = check_record(data, schema_path, self.record_checks.get(output_key, ()))
+        if message is not None:
+            raise RecordValidationError(1, message)
+
+        output_path = self.get_output_path(ctx, output_key)
+        save_json(data, output_path, compact=get_config().serialization.compact_artifacts)
+        ctx.cache_output(output_key, output_path, data)
+        if schema_path is not None:
+            ctx.mark_prevalidated(output_key, output_path, schema_path)
+        return output_path
+
+    def load_output_json(self, ctx: StepContext, output_key: str) -> Any:
+        """Load JSON output artifact, reusing the object saved in this process.
+
+        Gates call this to avoid re-reading and re-parsing what run() just
+        wrote; the file is loaded if it changed since. Once validated and
+        compressed, the output is read from the path in the manifest.
+
+        Args:
+            ctx: Step context
+            output_key: Output artifact key
+
+        Returns:
+            Parsed output
+        """
+        output_path = self.get_output_path(ctx, output_key)
+        if not output_path.exists() and ctx.manifest.get_artifact(output_key):
+            output_path = ctx.get_artifact_path(output_key)
+        data = ctx.get_cached_output(output_key, output_path)
+        if data is None:
+            data = load_json(output_path)
+        return data
+
+    def open_output_jsonl(self, ctx: StepContext, output_key: str) -> JsonlWriter:
+        """Open buffered JSON Lines writer for an output artifact.
+
+        If the gate checks the output against a schema, or record checks are
+        registered, records are validated as they are written and the first
+        invalid one raises RecordValidationError.
+
+        Args:
+            ctx: Step context
+            output_key: Output artifact key
+
+        Returns:
+            JsonlWriter (use as context manager)
+        """
+        output_path = self.get_output_path(ctx, output_key)
+        schema_path = self.get_output_schema(output_key)
+        checks = self.record_checks.get(output_key, [])
+        if schema_path is None and not checks:
+            return JsonlWriter(output_path)
+
+        def on_complete() -> None:
+            if schema_path is not None:
+                ctx.mark_prevalidated(output_key, output_path, schema_path)
+
+        return ValidatingJsonlWriter(output_path, schema_path=schema_path, checks=checks, on_complete=on_complete)
+
+    def open_output_table(
+        self,
+        ctx: StepContext,
+        output_key: str,
+        fields: Sequence[Tuple[str, str]]
+    ) -> TableWriter:
+        """Open binary table writer for an output artifact (.tbl).
+
+        Args:
+            ctx: Step context
+            output_key: Output artifact key
+            fields: Column (name, type) pairs
+
+        Returns:
+            TableWriter (use as context manager)
+        """
+        return TableWriter(self.get_output_path(ctx, output_key), fields)
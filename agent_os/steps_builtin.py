@@ -1,17 +1,107 @@
 """Built-in step implementations for sample tasks."""
 
+import codecs
+import hashlib
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Optional, TextIO
 
 from .step import Step, StepContext
 from .validators import validate_file_exists, validate_file_size, validate_json_schema
-from .utils import load_json, save_json, get_logger
+from .utils import (
+    compute_sha256,
+    load_json,
+    is_jsonl_path,
+    iter_jsonl,
+    read_json_value,
+    read_json_string_head,
+    snapshot_file,
+    get_logger,
+)
 
 logger = get_logger(__name__)
 
+# Read size for streaming referenced inputs
+INPUT_CHUNK_SIZE = 1024 * 1024
+
+
+def check_input_snapshot(artifact_data: Dict[str, Any], full: bool = False) -> Optional[str]:
+    """Check a reference-mode snapshot still holds the recorded content.
+
+    A hardlink snapshot shares its inode with the source, so edits of the
+    source show through; stat changes are always detected, and full=True
+    also compares the digest.
+
+    Args:
+        artifact_data: LoadInputStep artifact (mode="reference")
+        full: Re-hash the snapshot
+
+    Returns:
+        Error message, or None if unchanged
+    """
+    snapshot_path = Path(artifact_data["snapshot_path"])
+    try:
+        stat = snapshot_path.stat()
+    except FileNotFoundError:
+        return f"Snapshot missing: {snapshot_path}"
+
+    if stat.st_size != artifact_data["size"]:
+        return f"Snapshot size changed: {snapshot_path}"
+    if "mtime_ns" in artifact_data and stat.st_mtime_ns != artifact_data["mtime_ns"]:
+        return f"Snapshot modified: {snapshot_path}"
+    if full and compute_sha256(snapshot_path) != artifact_data["sha256"]:
+        return f"Snapshot content changed: {snapshot_path}"
+    return None
+
+
+def open_input_text(artifact_data: Dict[str, Any]) -> TextIO:
+    """Open the text of a reference-mode input artifact.
+
+    Args:
+        artifact_data: LoadInputStep artifact (mode="reference")
+
+    Returns:
+        Text file handle over the snapshot
+
+    Raises:
+        ValueError: If the snapshot changed since it was recorded
+    """
+    error = check_input_snapshot(artifact_data)
+    if error:
+        raise ValueError(error)
+    return open(artifact_data["snapshot_path"], 'r', encoding=artifact_data["encoding"])
+
+
+def iter_input_text(artifact_data: Dict[str, Any], chunk_chars: int = INPUT_CHUNK_SIZE) -> Iterator[str]:
+    """Iterate input text in chunks (works for inline and reference artifacts).
+
+    Args:
+        artifact_data: LoadInputStep artifact
+        chunk_chars: Characters per chunk
+
+    Yields:
+        Text chunks
+    """
+    if artifact_data.get("mode") != "reference":
+        content = artifact_data["content"]
+        for start in range(0, len(content), chunk_chars):
+            yield content[start:start + chunk_chars]
+        return
+
+    with open_input_text(artifact_data) as f:
+        for chunk in iter(lambda: f.read(chunk_chars), ""):
+            yield chunk
+
 
 class LoadInputStep(Step):
-    """Load input file into artifact."""
+    """Load input file into artifact.
+
+    A .jsonl output key produces one record per input line instead of a
+    single JSON document, so the input is never held in memory at once.
+    Record text excludes the line ending; a final line without one is
+    marked "eol": false.
+    With config mode="reference" the artifact records a snapshot of the
+    source (path, size, digest, encoding) instead of embedding its text.
+    """
 
     def run(self, ctx: StepContext) -> Dict[str, Any]:
         """Load input file.
@@ -30,25 +120,115 @@ class LoadInputStep(Step):
         if not input_path.exists():
             raise FileNotFoundError(f"Input file not found: {input_file}")
 
+        output_key = self.outputs[0]
+        if is_jsonl_path(output_key):
+            return self._run_jsonl(ctx, input_path, output_key)
+
+        if self.config.get("mode", "inline") == "reference":
+            return self._run_reference(ctx, input_path, output_key)
+
         # Read input
         with open(input_path, 'r', encoding='utf-8') as f:
             content = f.read()
 
         # Save as artifact
-        output_key = self.outputs[0]
-        output_path = self.get_output_path(ctx, output_key)
-
         artifact_data = {
+            "mode": "inline",
             "source_file": str(input_path),
             "content": content,
             "length": len(content)
         }
 
-        save_json(artifact_data, output_path)
+        self.save_output_json(ctx, output_key, artifact_data)
         logger.info(f"Loaded input: {len(content)} characters")
 
         return {"status": "success", "length": len(content)}
 
+    def _run_reference(self, ctx: StepContext, input_path: Path, output_key: str) -> Dict[str, Any]:
+        """Snapshot input file and record a reference artifact.
+
+        Args:
+            ctx: Step context
+            input_path: Input file path
+            output_key: Output artifact key
+
+        Returns:
+            Result dict
+        """
+        encoding = self.config.get("encoding", "utf-8")
+        snapshot_path = ctx.job.artifacts_dir / "sources" / input_path.name
+        method = snapshot_file(input_path, snapshot_path)
+
+        # Single pass: digest, size and character count (validates encoding)
+        sha256 = hashlib.sha256()
+        decoder = codecs.getincrementaldecoder(encoding)()
+        size = 0
+        length = 0
+        with open(snapshot_path, 'rb') as f:
+            for block in iter(lambda: f.read(INPUT_CHUNK_SIZE), b""):
+                sha256.update(block)
+                size += len(block)
+                length += len(decoder.decode(block))
+        length += len(decoder.decode(b"", final=True))
+        mtime_ns = snapshot_path.stat().st_mtime_ns
+
+        artifact_data = {
+            "mode": "reference",
+            "source_file": str(input_path),
+            "snapshot_path": str(snapshot_path),
+            "snapshot_method": method,
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "sha256": sha256.hexdigest(),
+            "encoding": encoding,
+            "length": length
+        }
+
+        self.save_output_json(ctx, output_key, artifact_data)
+        logger.info(f"Referenced input: {length} characters ({size} bytes, {method})")
+
+        return {"status": "success", "length": length}
+
+    def _run_jsonl(self, ctx: StepContext, input_path: Path, output_key: str) -> Dict[str, Any]:
+        """Stream input lines into a JSONL artifact.
+
+        Args:
+            ctx: Step context
+            input_path: Input file path
+            output_key: Output artifact key (.jsonl)
+
+        Returns:
+            Result dict
+        """
+        length = 0
+        # newline='' keeps line endings as read; each one counts as one character
+        with open(input_path, 'r', encoding='utf-8', newline='') as f, \
+                self.open_output_jsonl(ctx, output_key) as writer:
+            for line_no, line in enumerate(f, start=1):
+                text = line.rstrip("\r\n")
+                record = {"line": line_no, "text": text}
+                if text == line:
+                    record["eol"] = False
+                length += len(text) + (text != line)
+                writer.write(record)
+
+        logger.info(f"Loaded input: {length} characters ({writer.count} lines)")
+
+        return {"status": "success", "length": length, "records": writer.count}
+
+    def get_validation_key(self, ctx: StepContext):
+        """Get gate cache key (none in reference mode, where the gate also checks the snapshot).
+
+        Args:
+            ctx: Step context
+
+        Returns:
+            (artifact digest, validator identity) or None
+        """
+        if self.config.get("mode", "inline") == "reference":
+            return None
+        return super().get_validation_key(ctx)
+
     def validate(self, ctx: StepContext) -> bool:
         """Validate output.
 
@@ -68,6 +248,15 @@ class LoadInputStep(Step):
         if not validate_file_size(output_path, min_size=10):
             return False
 
+        if self.config.get("mode", "inline") == "reference" and not is_jsonl_path(output_key):
+            artifact_data = self.load_output_json(ctx, output_key)
+            # A hardlink snapshot is the source's inode: compare content
+            full = artifact_data.get("snapshot_method") == "hardlink"
+            error = check_input_snapshot(artifact_data, full=full)
+            if error:
+                logger.error(error)
+                return False
+
         return True
 
 
@@ -88,31 +277,78 @@ class SummarizeStep(Step):
         input_key = self.inputs[0]
         input_path = input_paths[input_key]
 
-        input_data = load_json(input_path)
-        content = input_data["content"]
+        max_length = self.config.get("max_summary_length", 200)
+        if is_jsonl_path(input_path):
+            head, original_length = self._read_jsonl_head(input_path, max_length)
+        else:
+            head, original_length = self._read_json_head(input_path, max_length)
 
         # Simple summarization: first N characters + stats
-        max_length = self.config.get("max_summary_length", 200)
-        summary_text = content[:max_length]
-        if len(content) > max_length:
+        summary_text = head
+        if original_length > max_length:
             summary_text += "..."
 
         summary_data = {
             "summary": summary_text,
-            "original_length": len(content),
+            "original_length": original_length,
             "summary_length": len(summary_text),
-            "compression_ratio": round(len(summary_text) / len(content), 2) if len(content) > 0 else 0
+            "compression_ratio": round(len(summary_text) / original_length, 2) if original_length > 0 else 0
         }
 
         # Save output
         output_key = self.outputs[0]
-        output_path = self.get_output_path(ctx, output_key)
-        save_json(summary_data, output_path)
+        self.save_output_json(ctx, output_key, summary_data)
 
         logger.info(f"Created summary: {len(summary_text)} characters")
 
         return {"status": "success", "summary_length": len(summary_text)}
 
+    def _read_json_head(self, input_path: Path, max_length: int) -> tuple:
+        """Read leading text and total length without loading the content.
+
+        Args:
+            input_path: Path to JSON input (LoadInputStep artifact)
+            max_length: Number of leading characters to keep
+
+        Returns:
+            Tuple of (head text, total length)
+        """
+        if read_json_value(input_path, "mode", "inline") == "reference":
+            artifact_data = load_json(input_path)
+            with open_input_text(artifact_data) as f:
+                return f.read(max_length), artifact_data["length"]
+
+        original_length = read_json_value(input_path, "length")
+        if original_length is None:
+            # Legacy artifact without length - load fully
+            content = load_json(input_path)["content"]
+            return content[:max_length], len(content)
+
+        return read_json_string_head(input_path, "content", max_length), original_length
+
+    def _read_jsonl_head(self, input_path: Path, max_length: int) -> tuple:
+        """Read leading text and total length from line records.
+
+        Args:
+            input_path: Path to JSONL input (records with "text")
+            max_length: Number of leading characters to keep
+
+        Returns:
+            Tuple of (head text, total length)
+        """
+        parts = []
+        kept = 0
+        total = 0
+        for record in iter_jsonl(input_path):
+            text = record["text"].rstrip("\r\n")
+            if record.get("eol", True):
+                text += "\n"
+            total += len(text)
+            if kept < max_length:
+                parts.append(text[:max_length - kept])
+                kept += len(parts[-1])
+        return "".join(parts), total
+
     def validate(self, ctx: StepContext) -> bool:
         """Validate summary.
 
@@ -129,9 +365,9 @@ class SummarizeStep(Step):
         if not validate_file_exists(output_path):
             return False
 
-        # Load and validate content
+        # Validate content (object saved by run() if unchanged, else the file)
         try:
-            data = load_json(output_path)
+            data = self.load_output_json(ctx, output_key)
 
             # Check required fields
             if "summary" not in data:
@@ -171,13 +407,17 @@ class StubStep(Step):
 
         # Create stub output
         for output_key in self.outputs:
-            output_path = self.get_output_path(ctx, output_key)
+            if is_jsonl_path(output_key):
+                with self.open_output_jsonl(ctx, output_key) as writer:
+                    writer.write({"step_id": self.step_id, "status": "stub", "index": 0})
+                continue
+
             stub_data = {
                 "step_id": self.step_id,
                 "status": "stub",
                 "message": f"Stub output for {output_key}"
             }
-            save_json(stub_data, output_path)
+            self.save_output_json(ctx, output_key, stub_data)
 
         return {"status": "success", "mode": "stub"}
 
@@ -197,3 +437,11 @@ class StubStep(Step):
                 return False
 
         return True
+
+
+# Step type registry used by task specs
+BUILTIN_STEP_CLASSES = {
+    "LoadInputStep": LoadInputStep,
+    "SummarizeStep": SummarizeStep,
+    "StubStep": StubStep,
+}
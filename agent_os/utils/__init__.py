@@ -1,16 +1,86 @@
 """Utility functions for Agent OS."""
 
-from .hashing import compute_sha256, compute_input_hash
-from .jsonio import load_json, save_json, load_yaml, save_yaml
+from .hashing import compute_sha256, compute_input_hash, compute_merkle_leaf, compute_merkle_root
+from .jsonio import (
+    load_json,
+    save_json,
+    dumps_json,
+    loads_json,
+    set_json_backend,
+    get_json_backend,
+    is_jsonl_path,
+    iter_jsonl,
+    JsonlWriter,
+    save_jsonl,
+    load_yaml,
+    save_yaml,
+    configure_yaml_cache,
+    clear_yaml_cache,
+)
+from .jsonstream import iter_json_items, read_json_value, read_json_string_head
+from .table import is_table_path, read_table_header, TableWriter, TableReader
+from .compression import (
+    open_artifact,
+    wrap_artifact_stream,
+    compress_file,
+    strip_codec_suffix,
+    compute_raw_digest,
+    detect_compression,
+    default_codec,
+)
+from .archive import pack_directory, JobArchive, ARCHIVE_SUFFIX
+from .fileops import (
+    snapshot_file,
+    break_hardlink,
+    get_pool_path,
+    link_into_pool,
+    is_trusted_file,
+    write_private_file,
+)
 from .logging_setup import setup_logging, get_logger
 
 __all__ = [
     "compute_sha256",
     "compute_input_hash",
+    "compute_merkle_leaf",
+    "compute_merkle_root",
     "load_json",
     "save_json",
+    "dumps_json",
+    "loads_json",
+    "set_json_backend",
+    "get_json_backend",
+    "is_jsonl_path",
+    "iter_jsonl",
+    "JsonlWriter",
+    "save_jsonl",
+    "iter_json_items",
+    "read_json_value",
+    "read_json_string_head",
+    "is_table_path",
+    "read_table_header",
+    "TableWriter",
+    "TableReader",
+    "open_artifact",
+    "wrap_artifact_stream",
+    "compress_file",
+    "strip_codec_suffix",
+    "compute_raw_digest",
+    "detect_compression",
+    "default_codec",
+    "pack_directory",
+    "JobArchive",
+    "ARCHIVE_SUFFIX",
+    "snapshot_file",
+    "break_hardlink",
+    "get_pool_path",
+    "link_into_pool",
+    "is_trusted_file",
+    "write_private_file",
     "load_yaml",
     "save_yaml",
+    "configure_yaml_cache",
+    "clear_yaml_cache",
     "setup_logging",
     "get_logger",
 ]
@@ -0,0 +1,231 @@
+"""Single-file job archives with a random-access footer index.
+
+Layout:
+    magic (8 bytes) | member data ... | index JSON | index length (uint64 LE) | trailer (8 bytes)
+
+Members are stored back to back without padding or compression (compressed
+artifacts stay compressed). The footer index maps each member name (path
+relative to the packed directory) to its offset, size and SHA256, so a single
+member can be read with one seek and no extraction. The index also records
+the packed directory (root) so original file paths can be mapped to members.
+"""
+
+import hashlib
+import io
+import json
+import os
+import struct
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, IO, List, Union
+
+from .compression import wrap_artifact_stream
+
+ARCHIVE_MAGIC = b"AOSPAK1\x00"
+ARCHIVE_TRAILER = b"AOSPAKIX"
+ARCHIVE_SUFFIX = ".pack"
+
+_FOOTER = struct.Struct("<Q")
+_BLOCK_SIZE = 1024 * 1024
+
+
+def pack_directory(src_dir: Union[str, Path], archive_path: Union[str, Path]) -> Dict[str, Any]:
+    """Pack all files under a directory into one archive (atomic replace).
+
+    Args:
+        src_dir: Directory to pack
+        archive_path: Archive file to write
+
+    Returns:
+        Archive index (members with offset, size, sha256)
+    """
+    src_dir = Path(src_dir)
+    archive_path = Path(archive_path)
+    tmp_path = archive_path.with_name(f".{archive_path.name}.{os.getpid()}.tmp")
+
+    files = sorted(p for p in src_dir.rglob("*") if p.is_file() and not p.is_symlink())
+    members: Dict[str, Dict[str, Any]] = {}
+
+    try:
+        with open(tmp_path, 'wb') as dst:
+            dst.write(ARCHIVE_MAGIC)
+            for file_path in files:
+                offset = dst.tell()
+                digest = hashlib.sha256()
+                with open(file_path, 'rb') as src:
+                    for block in iter(lambda: src.read(_BLOCK_SIZE), b""):
+                        digest.update(block)
+                        dst.write(block)
+                members[file_path.relative_to(src_dir).as_posix()] = {
+                    "offset": offset,
+                    "size": dst.tell() - offset,
+                    "sha256": digest.hexdigest(),
+                }
+
+            index = {"root": src_dir.as_posix(), "created_at": datetime.now().isoformat(), "members": members}
+            index_bytes = json.dumps(index, separators=(",", ":")).encode('utf-8')
+            dst.write(index_bytes)
+            dst.write(_FOOTER.pack(len(index_bytes)) + ARCHIVE_TRAILER)
+
+        os.replace(tmp_path, archive_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    return index
+
+
+class _MemberReader(io.RawIOBase):
+    """Seekable read-only view of one archive member."""
+
+    def __init__(self, f: IO[bytes], offset: int, size: int):
+        self._f = f
+        self._offset = offset
+        self._size = size
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        n = min(len(buffer), self._size - self._pos)
+        if n <= 0:
+            return 0
+        self._f.seek(self._offset + self._pos)
+        n = self._f.readinto(memoryview(buffer)[:n])
+        self._pos += n
+        return n
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: self._size}[whence]
+        self._pos = max(0, base + pos)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        if not self.closed:
+            self._f.close()
+        super().close()
+
+
+class JobArchive:
+    """Random-access reader for packed job archives."""
+
+    def __init__(self, archive_path: Union[str, Path]):
+        """Open archive and load its footer index.
+
+        Args:
+            archive_path: Path to archive file
+
+        Raises:
+            ValueError: If the file is not a valid archive
+        """
+        self.archive_path = Path(archive_path)
+
+        with open(self.archive_path, 'rb') as f:
+            if f.read(len(ARCHIVE_MAGIC)) != ARCHIVE_MAGIC:
+                raise ValueError(f"Not a job archive: {self.archive_path}")
+            footer_size = _FOOTER.size + len(ARCHIVE_TRAILER)
+            f.seek(-footer_size, io.SEEK_END)
+            footer = f.read(footer_size)
+            if footer[_FOOTER.size:] != ARCHIVE_TRAILER:
+                raise ValueError(f"Truncated job archive: {self.archive_path}")
+            (index_len,) = _FOOTER.unpack(footer[:_FOOTER.size])
+            f.seek(-(footer_size + index_len), io.SEEK_END)
+            self.index: Dict[str, Any] = json.loads(f.read(index_len).decode('utf-8'))
+
+        self.members: Dict[str, Dict[str, Any]] = self.index["members"]
+
+    def member_name(self, file_path: Union[str, Path]) -> str:
+        """Map an original file path (under the packed root) to its member name.
+
+        Args:
+            file_path: Path as it was before packing
+
+        Returns:
+            Member name
+        """
+        return Path(file_path).relative_to(self.index["root"]).as_posix()
+
+    def names(self) -> List[str]:
+        """List member names.
+
+        Returns:
+            Sorted member names
+        """
+        return sorted(self.members)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.members
+
+    def get_info(self, name: str) -> Dict[str, Any]:
+        """Get member index entry.
+
+        Args:
+            name: Member name
+
+        Returns:
+            Dict with offset, size, sha256
+
+        Raises:
+            KeyError: If member does not exist
+        """
+        if name not in self.members:
+            raise KeyError(f"Member not in archive: {name}")
+        return self.members[name]
+
+    def open(self, name: str, mode: str = 'rb', encoding: str = 'utf-8') -> IO:
+        """Open member for reading, decompressing transparently.
+
+        Args:
+            name: Member name
+            mode: 'rb' or 'r'
+            encoding: Text encoding (text mode only)
+
+        Returns:
+            Readable file object over the member's raw (decompressed) bytes or text
+        """
+        return wrap_artifact_stream(self.open_stored(name), mode=mode, encoding=encoding)
+
+    def open_stored(self, name: str) -> IO[bytes]:
+        """Open member bytes exactly as stored (no decompression).
+
+        Args:
+            name: Member name
+
+        Returns:
+            Seekable binary file object
+        """
+        info = self.get_info(name)
+        return io.BufferedReader(_MemberReader(open(self.archive_path, 'rb'), info["offset"], info["size"]))
+
+    def read_bytes(self, name: str) -> bytes:
+        """Read whole member (decompressed).
+
+        Args:
+            name: Member name
+
+        Returns:
+            Member content
+        """
+        with self.open(name) as f:
+            return f.read()
+
+    def compute_sha256(self, name: str) -> str:
+        """Hash member bytes as stored.
+
+        Args:
+            name: Member name
+
+        Returns:
+            Hexadecimal SHA256 digest
+        """
+        digest = hashlib.sha256()
+        with self.open_stored(name) as f:
+            for block in iter(lambda: f.read(_BLOCK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
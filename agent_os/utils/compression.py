@@ -0,0 +1,212 @@
+"""Transparent artifact compression (zstd if installed, else gzip)."""
+
+import gzip
+import hashlib
+import io
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, IO, Optional, Union
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+COMPRESSION_CODECS = ("zstd", "gzip")
+
+# File name suffix of compressed artifacts ("summary.json" -> "summary.json.gz")
+CODEC_SUFFIXES = {"zstd": ".zst", "gzip": ".gz"}
+
+# Stream block size for (de)compression
+_BLOCK_SIZE = 1024 * 1024
+
+
+def default_codec() -> str:
+    """Get preferred available codec.
+
+    Returns:
+        "zstd" if zstandard is installed, else "gzip"
+    """
+    return "zstd" if zstandard is not None else "gzip"
+
+
+def resolve_codec(codec: str) -> str:
+    """Resolve codec name ("auto" or an unavailable zstd fall back to gzip).
+
+    Args:
+        codec: auto / zstd / gzip
+
+    Returns:
+        Codec name to use
+
+    Raises:
+        ValueError: If codec is unknown
+    """
+    if codec == "auto":
+        return default_codec()
+    if codec not in COMPRESSION_CODECS:
+        raise ValueError(f"Unknown compression codec: {codec}")
+    if codec == "zstd" and zstandard is None:
+        return "gzip"
+    return codec
+
+
+def strip_codec_suffix(file_path: Union[str, Path]) -> Path:
+    """Get the path of the uncompressed format ("a.jsonl.gz" -> "a.jsonl").
+
+    Args:
+        file_path: Path to file, compressed or not
+
+    Returns:
+        Path without a trailing codec suffix
+    """
+    path = Path(file_path)
+    if path.suffix in CODEC_SUFFIXES.values():
+        return path.with_suffix("")
+    return path
+
+
+def detect_compression(file_path: Union[str, Path]) -> Optional[str]:
+    """Detect compression codec from file magic bytes.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        "zstd", "gzip" or None for uncompressed files
+    """
+    with open(file_path, 'rb') as f:
+        head = f.read(4)
+    if head.startswith(ZSTD_MAGIC):
+        return "zstd"
+    if head.startswith(GZIP_MAGIC):
+        return "gzip"
+    return None
+
+
+def wrap_artifact_stream(stream: BinaryIO, mode: str = 'rb', encoding: str = 'utf-8') -> IO:
+    """Wrap a seekable binary stream, decompressing transparently.
+
+    Closing the returned object closes the underlying stream.
+
+    Args:
+        stream: Seekable binary stream positioned at the start of the content
+        mode: 'rb' or 'r'
+        encoding: Text encoding (text mode only)
+
+    Returns:
+        Readable file object over the raw (decompressed) bytes or text
+    """
+    if mode not in ('rb', 'r'):
+        stream.close()
+        raise ValueError(f"Unsupported mode: {mode}")
+
+    start = stream.tell()
+    head = stream.read(4)
+    stream.seek(start)
+
+    try:
+        if head.startswith(ZSTD_MAGIC):
+            if zstandard is None:
+                raise RuntimeError("zstd-compressed artifact requires the zstandard package")
+            stream = io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(stream, closefd=True))
+        elif head.startswith(GZIP_MAGIC):
+            reader = gzip.GzipFile(fileobj=stream, mode='rb')
+            # GzipFile closes myfileobj (as gzip.open does for paths it opened)
+            reader.myfileobj = stream
+            stream = reader
+    except Exception:
+        stream.close()
+        raise
+
+    if mode == 'r':
+        return io.TextIOWrapper(stream, encoding=encoding)
+    return stream
+
+
+def open_artifact(file_path: Union[str, Path], mode: str = 'rb', encoding: str = 'utf-8') -> IO:
+    """Open artifact for reading, decompressing transparently.
+
+    Args:
+        file_path: Path to artifact
+        mode: 'rb' or 'r'
+        encoding: Text encoding (text mode only)
+
+    Returns:
+        Readable file object over the raw (decompressed) bytes or text
+    """
+    if mode not in ('rb', 'r'):
+        raise ValueError(f"Unsupported mode: {mode}")
+    return wrap_artifact_stream(open(file_path, 'rb'), mode=mode, encoding=encoding)
+
+
+def compress_file(file_path: Union[str, Path], codec: str = "auto", level: Optional[int] = None) -> Dict[str, Any]:
+    """Compress a file into a suffixed sibling and remove the original.
+
+    The codec suffix (.gz/.zst) is appended, so the stored file is never
+    mistaken for the uncompressed format by plain readers.
+
+    Args:
+        file_path: Path to file (must be uncompressed)
+        codec: auto / zstd / gzip
+        level: Compression level (codec default if None)
+
+    Returns:
+        Dict with codec, path (compressed file), raw_size, raw_sha256, stored_size
+    """
+    path = Path(file_path)
+    codec = resolve_codec(codec)
+    stored_path = path.with_name(path.name + CODEC_SUFFIXES[codec])
+    tmp_path = path.with_name(f".{stored_path.name}.{os.getpid()}.tmp")
+
+    raw_hash = hashlib.sha256()
+    raw_size = 0
+    try:
+        with open(path, 'rb') as src, open(tmp_path, 'wb') as dst:
+            if codec == "gzip":
+                # mtime=0 and no filename keep output deterministic
+                writer = gzip.GzipFile(filename="", fileobj=dst, mode='wb',
+                                       compresslevel=6 if level is None else level, mtime=0)
+            else:
+                compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+                writer = compressor.stream_writer(dst, closefd=False)
+
+            with writer:
+                for block in iter(lambda: src.read(_BLOCK_SIZE), b""):
+                    raw_hash.update(block)
+                    raw_size += len(block)
+                    writer.write(block)
+
+        os.replace(tmp_path, stored_path)
+        path.unlink()
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    return {
+        "codec": codec,
+        "path": stored_path,
+        "raw_size": raw_size,
+        "raw_sha256": raw_hash.hexdigest(),
+        "stored_size": stored_path.stat().st_size,
+    }
+
+
+def compute_raw_digest(file_path: Union[str, Path]) -> Dict[str, Any]:
+    """Compute size and SHA256 of decompressed content.
+
+    Args:
+        file_path: Path to (possibly compressed) file
+
+    Returns:
+        Dict with raw_size and raw_sha256
+    """
+    raw_hash = hashlib.sha256()
+    raw_size = 0
+    with open_artifact(file_path) as f:
+        for block in iter(lambda: f.read(_BLOCK_SIZE), b""):
+            raw_hash.update(block)
+            raw_size += len(block)
+    return {"raw_size": raw_size, "raw_sha256": raw_hash.hexdigest()}
@@ -0,0 +1,161 @@
+"""File operations for artifact snapshots and content-addressed storage."""
+
+import errno
+import os
+import shutil
+import stat
+from pathlib import Path
+from typing import Union
+
+# Linux FICLONE ioctl (copy-on-write clone on btrfs/xfs/ocfs2)
+_FICLONE = 0x40049409
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover - non-POSIX
+        return False
+
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        return True
+    except OSError:
+        dst.unlink(missing_ok=True)
+        return False
+
+
+def snapshot_file(src: Union[str, Path], dst: Union[str, Path]) -> str:
+    """Snapshot a file without copying its bytes when possible.
+
+    Tries a copy-on-write reflink first (a true snapshot), then a hardlink
+    (shares the inode, so later in-place edits of the source show through),
+    and falls back to a regular copy.
+
+    Args:
+        src: Source file
+        dst: Destination path (replaced if it exists)
+
+    Returns:
+        Method used: "reflink", "hardlink" or "copy"
+    """
+    src, dst = Path(src), Path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    dst.unlink(missing_ok=True)
+
+    if _reflink(src, dst):
+        return "reflink"
+
+    try:
+        os.link(src, dst)
+        return "hardlink"
+    except OSError:
+        pass
+
+    shutil.copyfile(src, dst)
+    return "copy"
+
+
+def break_hardlink(file_path: Union[str, Path]) -> None:
+    """Unlink a file shared with other paths before rewriting it.
+
+    Writers that truncate in place would otherwise modify every hardlinked
+    copy (e.g. deduplicated artifacts in other jobs).
+
+    Args:
+        file_path: Path about to be rewritten
+    """
+    try:
+        if os.stat(file_path).st_nlink > 1:
+            os.unlink(file_path)
+    except FileNotFoundError:
+        pass
+
+
+def get_pool_path(pool_root: Union[str, Path], digest: str) -> Path:
+    """Get content-addressed pool location for a digest.
+
+    Args:
+        pool_root: Pool root directory
+        digest: SHA256 hex digest
+
+    Returns:
+        Path of the pool entry
+    """
+    return Path(pool_root) / digest[:2] / digest
+
+
+def link_into_pool(file_path: Union[str, Path], digest: str, pool_root: Union[str, Path]) -> str:
+    """Store file bytes once in a content-addressed pool.
+
+    If the pool already holds the digest, the file is atomically replaced by
+    a hardlink to the pool entry; otherwise the file becomes the pool entry.
+    Linked files share one inode, so only final (validated) artifacts should
+    be pooled and writers must call break_hardlink before rewriting.
+
+    Args:
+        file_path: Artifact file (content must match digest)
+        digest: SHA256 hex digest of the file
+        pool_root: Pool root directory
+
+    Returns:
+        "deduplicated", "pooled", "already_linked" or "skipped" (e.g. cross-device)
+    """
+    path = Path(file_path)
+    pool_path = get_pool_path(pool_root, digest)
+
+    try:
+        if pool_path.exists():
+            if os.path.samefile(pool_path, path):
+                return "already_linked"
+            if pool_path.stat().st_size != path.stat().st_size:
+                return "skipped"
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.link")
+            tmp_path.unlink(missing_ok=True)
+            os.link(pool_path, tmp_path)
+            os.replace(tmp_path, path)
+            return "deduplicated"
+
+        pool_path.parent.mkdir(parents=True, exist_ok=True)
+        os.link(path, pool_path)
+        return "pooled"
+    except OSError as e:
+        if e.errno in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+            return "skipped"
+        raise
+
+
+def is_trusted_file(file_path: Union[str, Path]) -> bool:
+    """Check that a file is owned by this user and not writable by group/others.
+
+    Cached files that are executed or unpickled must pass this check.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        True if only the current user can have written the file
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    file_stat = Path(file_path).stat()
+    return file_stat.st_uid == os.getuid() and not file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def write_private_file(file_path: Union[str, Path], data: bytes) -> None:
+    """Atomically write a file readable only by this user (0600 in a 0700 directory).
+
+    Args:
+        file_path: Destination path
+        data: File contents
+    """
+    path = Path(file_path)
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
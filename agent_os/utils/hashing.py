@@ -3,7 +3,10 @@
 import hashlib
 import json
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Union
+
+# Read size for file hashing (large blocks keep hashlib out of the interpreter loop)
+HASH_CHUNK_SIZE = 1024 * 1024
 
 
 def compute_sha256(file_path: Union[str, Path]) -> str:
@@ -17,7 +20,7 @@ def compute_sha256(file_path: Union[str, Path]) -> str:
     """
     sha256_hash = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
+        for byte_block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
             sha256_hash.update(byte_block)
     return sha256_hash.hexdigest()
 
@@ -35,3 +38,45 @@ def compute_input_hash(inputs: Dict[str, Any]) -> str:
     sorted_json = json.dumps(inputs, sort_keys=True, ensure_ascii=False)
     hash_obj = hashlib.sha256(sorted_json.encode('utf-8'))
     return hash_obj.hexdigest()[:8]
+
+
+def compute_merkle_leaf(key: str, digest: str) -> str:
+    """Compute Merkle leaf hash for an artifact.
+
+    The key is bound into the leaf so that renaming an artifact changes the root.
+
+    Args:
+        key: Artifact key
+        digest: Content digest (empty string if unknown)
+
+    Returns:
+        Hexadecimal leaf hash
+    """
+    payload = b"\x00" + key.encode('utf-8') + b"\x00" + digest.encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()
+
+
+def compute_merkle_root(hashes: List[str]) -> str:
+    """Compute Merkle root over ordered hashes.
+
+    Nodes are combined pairwise; an odd trailing node is promoted unchanged.
+
+    Args:
+        hashes: Ordered list of hexadecimal hashes
+
+    Returns:
+        Hexadecimal root hash (hash of empty input if no hashes)
+    """
+    if not hashes:
+        return hashlib.sha256(b"").hexdigest()
+
+    level = list(hashes)
+    while len(level) > 1:
+        next_level = []
+        for i in range(0, len(level) - 1, 2):
+            node = b"\x01" + bytes.fromhex(level[i]) + bytes.fromhex(level[i + 1])
+            next_level.append(hashlib.sha256(node).hexdigest())
+        if len(level) % 2 == 1:
+            next_level.append(level[-1])
+        level = next_level
+    return level[0]
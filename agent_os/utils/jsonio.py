@@ -1,14 +1,129 @@
 """JSON and YAML I/O with UTF-8 encoding."""
 
+import copy
+import hashlib
 import json
+import pickle
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
 
 import yaml
 
+from .compression import open_artifact, strip_codec_suffix
+from .fileops import break_hardlink, is_trusted_file, write_private_file
+
+# Optional fast JSON backends
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+JSON_BACKENDS = ("orjson", "msgspec", "stdlib")
+
+# libyaml-backed loader when available (much faster than pure Python)
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML cache: resolved path -> ((mtime_ns, size), data)
+_yaml_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+_yaml_disk_cache_dir: Optional[Path] = None
+
+_json_backend = "stdlib"
+
+
+def _available_backends() -> Dict[str, bool]:
+    return {"orjson": orjson is not None, "msgspec": msgspec is not None, "stdlib": True}
+
+
+def set_json_backend(name: str = "auto") -> str:
+    """Select JSON backend.
+
+    Args:
+        name: auto / orjson / msgspec / stdlib ("auto" picks the fastest installed)
+
+    Returns:
+        Name of the backend in use
+
+    Raises:
+        ValueError: If backend name is unknown
+    """
+    global _json_backend
+
+    available = _available_backends()
+    if name == "auto":
+        name = next(b for b in JSON_BACKENDS if available[b])
+    elif name not in available:
+        raise ValueError(f"Unknown JSON backend: {name}")
+    elif not available[name]:
+        # Requested backend not installed - fall back to stdlib
+        name = "stdlib"
+
+    _json_backend = name
+    return name
+
+
+def get_json_backend() -> str:
+    """Get name of the JSON backend in use.
+
+    Returns:
+        Backend name
+    """
+    return _json_backend
+
+
+def dumps_json(data: Any, indent: Optional[int] = 2, compact: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes using the selected backend.
+
+    Args:
+        data: Data to serialize
+        indent: Indentation level (ignored when compact)
+        compact: Emit minimal JSON without whitespace
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if compact:
+        indent = None
+
+    if _json_backend == "orjson" and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+
+    if _json_backend == "msgspec":
+        encoded = msgspec.json.encode(data)
+        if indent is None:
+            return encoded
+        return msgspec.json.format(encoded, indent=indent)
+
+    if indent is None:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, indent=indent).encode('utf-8')
+
+
+def loads_json(raw: Union[bytes, str]) -> Any:
+    """Parse JSON bytes or text using the selected backend.
+
+    Args:
+        raw: JSON document
+
+    Returns:
+        Parsed JSON object
+    """
+    if _json_backend == "orjson":
+        return orjson.loads(raw)
+    if _json_backend == "msgspec":
+        return msgspec.json.decode(raw)
+    return json.loads(raw)
+
 
 def load_json(file_path: Union[str, Path]) -> Dict[str, Any]:
-    """Load JSON file with UTF-8 encoding.
+    """Load JSON file with UTF-8 encoding (compressed files are decompressed).
 
     Args:
         file_path: Path to JSON file
@@ -16,34 +131,215 @@ def load_json(file_path: Union[str, Path]) -> Dict[str, Any]:
     Returns:
         Parsed JSON object
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open_artifact(file_path) as f:
+        return loads_json(f.read())
 
 
-def save_json(data: Dict[str, Any], file_path: Union[str, Path], indent: int = 2) -> None:
+def save_json(
+    data: Dict[str, Any],
+    file_path: Union[str, Path],
+    indent: int = 2,
+    compact: bool = False
+) -> None:
     """Save JSON file with UTF-8 encoding.
 
     Args:
         data: Data to save
         file_path: Path to JSON file
         indent: Indentation level
+        compact: Write minimal JSON (for machine-only files)
     """
     Path(file_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=indent)
+    break_hardlink(file_path)
+    with open(file_path, 'wb') as f:
+        f.write(dumps_json(data, indent=indent, compact=compact))
+
+
+def is_jsonl_path(file_path: Union[str, Path]) -> bool:
+    """Check whether path is a JSON Lines artifact.
 
+    Args:
+        file_path: Path to file
 
-def load_yaml(file_path: Union[str, Path]) -> Dict[str, Any]:
+    Returns:
+        True if the file uses the .jsonl format (also when stored compressed)
+    """
+    return strip_codec_suffix(file_path).suffix == ".jsonl"
+
+
+def iter_jsonl(file_path: Union[str, Path]) -> Iterator[Any]:
+    """Iterate records of a JSON Lines file (one record in memory at a time).
+
+    Args:
+        file_path: Path to JSONL file
+
+    Yields:
+        Parsed records (blank lines are skipped)
+    """
+    with open_artifact(file_path) as f:
+        for line in f:
+            if line.strip():
+                yield loads_json(line)
+
+
+class JsonlWriter:
+    """Buffered JSON Lines writer.
+
+    Records are encoded compactly and flushed to disk whenever the buffer
+    exceeds buffer_size bytes, so peak memory is bounded by the buffer.
+    """
+
+    def __init__(self, file_path: Union[str, Path], buffer_size: int = 1024 * 1024):
+        """Open writer (truncates existing file).
+
+        Args:
+            file_path: Path to JSONL file
+            buffer_size: Flush threshold in bytes
+        """
+        self.file_path = Path(file_path)
+        self.buffer_size = buffer_size
+        self.count = 0
+        self._buffer: list = []
+        self._buffered = 0
+
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        break_hardlink(self.file_path)
+        self._file = open(self.file_path, 'wb')
+
+    def write(self, record: Any) -> None:
+        """Append one record.
+
+        Args:
+            record: JSON-serializable record
+        """
+        line = dumps_json(record, compact=True) + b"\n"
+        self._buffer.append(line)
+        self._buffered += len(line)
+        self.count += 1
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def write_many(self, records: Iterable[Any]) -> None:
+        """Append multiple records.
+
+        Args:
+            records: Iterable of JSON-serializable records
+        """
+        for record in records:
+            self.write(record)
+
+    def flush(self) -> None:
+        """Write buffered records to disk."""
+        if self._buffer:
+            self._file.write(b"".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def save_jsonl(records: Iterable[Any], file_path: Union[str, Path]) -> int:
+    """Save records as JSON Lines.
+
+    Args:
+        records: Iterable of JSON-serializable records
+        file_path: Path to JSONL file
+
+    Returns:
+        Number of records written
+    """
+    with JsonlWriter(file_path) as writer:
+        writer.write_many(records)
+        return writer.count
+
+
+def configure_yaml_cache(disk_cache_dir: Optional[Union[str, Path]] = None) -> None:
+    """Configure on-disk cache for parsed YAML.
+
+    Args:
+        disk_cache_dir: Directory for pickled parses (None disables disk cache)
+    """
+    global _yaml_disk_cache_dir
+    _yaml_disk_cache_dir = Path(disk_cache_dir) if disk_cache_dir else None
+
+
+def clear_yaml_cache() -> None:
+    """Clear in-process parsed YAML cache."""
+    _yaml_cache.clear()
+
+
+def _load_yaml_disk_cache(cache_path: Path, stamp: Tuple[int, int]) -> Tuple[bool, Any]:
+    try:
+        # Unpickling runs code: only trust files nobody else could have written
+        if not is_trusted_file(cache_path):
+            return False, None
+        with open(cache_path, 'rb') as f:
+            cached_stamp, data = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError, ImportError):
+        return False, None
+    return cached_stamp == stamp, data
+
+
+def _save_yaml_disk_cache(cache_path: Path, stamp: Tuple[int, int], data: Any) -> None:
+    try:
+        write_private_file(cache_path, pickle.dumps((stamp, data), protocol=pickle.HIGHEST_PROTOCOL))
+    except (OSError, pickle.PicklingError):
+        pass  # Cache is best-effort
+
+
+def load_yaml(file_path: Union[str, Path], use_cache: bool = True) -> Dict[str, Any]:
     """Load YAML file with UTF-8 encoding.
 
+    Parses are cached in-process (and on disk if configured), keyed by
+    resolved path and validated against the file's mtime and size.
+    Callers always receive a private copy.
+
     Args:
         file_path: Path to YAML file
+        use_cache: Use the parsed cache
 
     Returns:
         Parsed YAML object
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    path = Path(file_path)
+    if not use_cache:
+        with open(path, 'r', encoding='utf-8') as f:
+            return yaml.load(f, Loader=YamlLoader)
+
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    key = str(path.resolve())
+
+    entry = _yaml_cache.get(key)
+    if entry is not None and entry[0] == stamp:
+        return copy.deepcopy(entry[1])
+
+    cache_path = None
+    found = False
+    if _yaml_disk_cache_dir is not None:
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        cache_path = _yaml_disk_cache_dir / f"{digest}.pickle"
+        found, data = _load_yaml_disk_cache(cache_path, stamp)
+
+    if not found:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=YamlLoader)
+        if cache_path is not None:
+            _save_yaml_disk_cache(cache_path, stamp, data)
+
+    _yaml_cache[key] = (stamp, data)
+    return copy.deepcopy(data)
 
 
 def save_yaml(data: Dict[str, Any], file_path: Union[str, Path]) -> None:
@@ -0,0 +1,316 @@
+"""Incremental JSON parsing for large single-document artifacts.
+
+Paths use dotted prefixes: object members by key and array elements by
+"item" (e.g. "content.segments.item"). Only values under the requested
+prefix are materialized; everything else is skipped while scanning.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Union
+
+from .compression import open_artifact
+
+# Characters read from the file per refill
+CHUNK_SIZE = 64 * 1024
+
+_WS_RE = re.compile(r"[^ \t\n\r]")
+_STRUCT_RE = re.compile(r'["\[\]{}]')
+_SCALAR_END_RE = re.compile(r"[,\]}\s]")
+_ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+
+
+class _JsonScanner:
+    """Chunked JSON scanner over a UTF-8 text file."""
+
+    def __init__(self, f):
+        self._file = f
+        self._buf = ""
+        self._pos = 0
+        self._mark: Optional[int] = None
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read next chunk, dropping consumed text. Returns False at EOF."""
+        if self._eof:
+            return False
+        keep = self._pos if self._mark is None else self._mark
+        if keep:
+            self._buf = self._buf[keep:]
+            self._pos -= keep
+            if self._mark is not None:
+                self._mark -= keep
+        # While a value is held, read as much as is buffered so the buffer
+        # doubles per refill and appends copy O(n) in total, not O(n^2)
+        size = CHUNK_SIZE if self._mark is None else max(CHUNK_SIZE, len(self._buf))
+        chunk = self._file.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf += chunk
+        return True
+
+    def _error(self, message: str) -> ValueError:
+        return ValueError(f"Invalid JSON: {message}")
+
+    def peek(self) -> str:
+        """Skip whitespace and return next character ('' at EOF)."""
+        while True:
+            match = _WS_RE.search(self._buf, self._pos)
+            if match:
+                self._pos = match.start()
+                return self._buf[self._pos]
+            self._pos = len(self._buf)
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self._error(f"expected {char!r} at offset {self._pos}")
+        self._pos += 1
+
+    def _find_string_end(self) -> int:
+        """Find closing quote of the string whose body starts at the current position.
+
+        Returns:
+            Index of the closing quote in the buffer
+        """
+        search_from = self._pos
+        while True:
+            idx = self._buf.find('"', search_from)
+            if idx == -1:
+                # Keep a trailing run of backslashes so escapes survive refill
+                tail = len(self._buf)
+                while tail > self._pos and self._buf[tail - 1] == '\\':
+                    tail -= 1
+                self._pos = tail
+                if not self._fill():
+                    raise self._error("unterminated string")
+                search_from = self._pos
+                continue
+
+            backslashes = 0
+            j = idx - 1
+            while j >= self._pos and self._buf[j] == '\\':
+                backslashes += 1
+                j -= 1
+            if backslashes % 2 == 0:
+                return idx
+            search_from = idx + 1
+
+    def read_string(self) -> str:
+        """Read and decode a complete string value."""
+        self.expect('"')
+        self._mark = self._pos - 1
+        try:
+            end = self._find_string_end()
+            raw = self._buf[self._mark:end + 1]
+        finally:
+            self._mark = None
+        self._pos = end + 1
+        return json.loads(raw)
+
+    def read_string_head(self, max_chars: int) -> str:
+        """Decode only the first max_chars characters of a string value."""
+        self.expect('"')
+        out: List[str] = []
+        while len(out) < max_chars:
+            # Longest escape is a surrogate pair (12 chars)
+            while self._pos + 12 > len(self._buf) and self._fill():
+                pass
+            if self._pos >= len(self._buf):
+                raise self._error("unterminated string")
+            char = self._buf[self._pos]
+            if char == '"':
+                break
+            if char != '\\':
+                out.append(char)
+                self._pos += 1
+                continue
+            code = self._buf[self._pos + 1]
+            if code != 'u':
+                out.append(_ESCAPES[code])
+                self._pos += 2
+                continue
+            escape_len = 6
+            if 0xD800 <= int(self._buf[self._pos + 2:self._pos + 6], 16) < 0xDC00 \
+                    and self._buf[self._pos + 6:self._pos + 8] == "\\u":
+                escape_len = 12
+            out.append(json.loads('"' + self._buf[self._pos:self._pos + escape_len] + '"'))
+            self._pos += escape_len
+        return "".join(out)
+
+    def skip_string(self) -> None:
+        """Skip a string value without decoding it."""
+        self.expect('"')
+        self._pos = self._find_string_end() + 1
+
+    def skip_value(self) -> None:
+        """Skip any value without materializing it."""
+        char = self.peek()
+        if char == '"':
+            self.skip_string()
+        elif char in "{[":
+            self._pos += 1
+            depth = 1
+            while depth:
+                match = _STRUCT_RE.search(self._buf, self._pos)
+                if not match:
+                    self._pos = len(self._buf)
+                    if not self._fill():
+                        raise self._error("unterminated container")
+                    continue
+                found = match.group()
+                self._pos = match.start()
+                if found == '"':
+                    self.skip_string()
+                    continue
+                self._pos += 1
+                depth += 1 if found in "{[" else -1
+        elif char:
+            self._scalar_end()
+        else:
+            raise self._error("unexpected end of document")
+
+    def _scalar_end(self) -> int:
+        while True:
+            match = _SCALAR_END_RE.search(self._buf, self._pos)
+            if match:
+                self._pos = match.start()
+                return self._pos
+            if not self._fill():
+                self._pos = len(self._buf)
+                return self._pos
+
+    def read_value(self) -> Any:
+        """Read and materialize the next value."""
+        self.peek()
+        self._mark = self._pos
+        try:
+            self.skip_value()
+            raw = self._buf[self._mark:self._pos]
+        finally:
+            self._mark = None
+        return json.loads(raw)
+
+    def iter_object(self) -> Iterator[str]:
+        """Iterate object keys; the caller must consume each value."""
+        self.expect('{')
+        if self.peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self.read_string()
+            self.expect(':')
+            yield key
+            char = self.peek()
+            self._pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                raise self._error(f"expected ',' or '}}' at offset {self._pos - 1}")
+
+    def iter_array(self) -> Iterator[int]:
+        """Iterate array indices; the caller must consume each element."""
+        self.expect('[')
+        if self.peek() == ']':
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            char = self.peek()
+            self._pos += 1
+            if char == ']':
+                return
+            if char != ',':
+                raise self._error(f"expected ',' or ']' at offset {self._pos - 1}")
+
+    def walk(self, parts: List[str], depth: int = 0) -> Iterator[None]:
+        """Position the scanner at each value matching the prefix parts.
+
+        The caller must consume the value before resuming the iterator.
+        """
+        if depth == len(parts):
+            yield None
+            return
+
+        char = self.peek()
+        part = parts[depth]
+        if char == '{' and part != "item":
+            for key in self.iter_object():
+                if key == part:
+                    yield from self.walk(parts, depth + 1)
+                else:
+                    self.skip_value()
+        elif char == '[' and part == "item":
+            for _ in self.iter_array():
+                yield from self.walk(parts, depth + 1)
+        else:
+            self.skip_value()
+
+
+def _split_prefix(prefix: str) -> List[str]:
+    return [part for part in prefix.split(".") if part] if prefix else []
+
+
+def iter_json_items(file_path: Union[str, Path], prefix: str) -> Iterator[Any]:
+    """Iterate values at a path prefix without loading the whole document.
+
+    Args:
+        file_path: Path to JSON file
+        prefix: Dotted path ("" for root, "item" for array elements)
+
+    Yields:
+        Materialized values found at the prefix
+    """
+    parts = _split_prefix(prefix)
+    single = "item" not in parts
+
+    with open_artifact(file_path, 'r') as f:
+        scanner = _JsonScanner(f)
+        for _ in scanner.walk(parts):
+            yield scanner.read_value()
+            if single:
+                return
+
+
+def read_json_value(file_path: Union[str, Path], prefix: str, default: Any = None) -> Any:
+    """Read a single value at a path prefix.
+
+    Args:
+        file_path: Path to JSON file
+        prefix: Dotted path
+        default: Value returned if the path is absent
+
+    Returns:
+        Value at prefix or default
+    """
+    for value in iter_json_items(file_path, prefix):
+        return value
+    return default
+
+
+def read_json_string_head(file_path: Union[str, Path], prefix: str, max_chars: int) -> Optional[str]:
+    """Read the first characters of a (possibly huge) string value.
+
+    Args:
+        file_path: Path to JSON file
+        prefix: Dotted path of a string value
+        max_chars: Maximum number of characters to decode
+
+    Returns:
+        Leading characters of the string, or None if the path is absent
+
+    Raises:
+        ValueError: If the value at prefix is not a string
+    """
+    with open_artifact(file_path, 'r') as f:
+        scanner = _JsonScanner(f)
+        for _ in scanner.walk(_split_prefix(prefix)):
+            if scanner.peek() != '"':
+                raise ValueError(f"Value at '{prefix}' is not a string")
+            return scanner.read_string_head(max_chars)
+    return None
@@ -0,0 +1,254 @@
+"""Compact binary table artifacts (array-of-struct with JSON header).
+
+Layout:
+    magic (8 bytes) | header length (uint32 LE) | header JSON | padding | rows
+
+Rows are fixed-size little-endian packed structs, so the data section can be
+memory-mapped and sliced (or viewed as a numpy structured array) without
+decoding. The row count is derived from the file size.
+"""
+
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+from .compression import strip_codec_suffix
+from .fileops import break_hardlink
+
+TABLE_MAGIC = b"AOSTBL1\x00"
+TABLE_SUFFIX = ".tbl"
+
+# Column type -> struct code
+TABLE_TYPES = {
+    "bool": "?",
+    "i1": "b", "u1": "B",
+    "i2": "h", "u2": "H",
+    "i4": "i", "u4": "I",
+    "i8": "q", "u8": "Q",
+    "f4": "f", "f8": "d",
+}
+
+_HEADER_ALIGN = 8
+
+
+def is_table_path(file_path: Union[str, Path]) -> bool:
+    """Check whether path is a binary table artifact.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        True if the file uses the table format (also when stored compressed)
+    """
+    return strip_codec_suffix(file_path).suffix == TABLE_SUFFIX
+
+
+def _row_struct(fields: Sequence[Tuple[str, str]]) -> struct.Struct:
+    codes = []
+    for name, type_name in fields:
+        if type_name not in TABLE_TYPES:
+            raise ValueError(f"Unsupported column type for {name}: {type_name}")
+        codes.append(TABLE_TYPES[type_name])
+    return struct.Struct("<" + "".join(codes))
+
+
+def read_table_header(file_path: Union[str, Path]) -> Dict[str, Any]:
+    """Read table header without touching row data.
+
+    Args:
+        file_path: Path to table file
+
+    Returns:
+        Header dict (fields, record_size, data_offset, rows)
+
+    Raises:
+        ValueError: If the file is not a table artifact
+    """
+    path = Path(file_path)
+    with open(path, 'rb') as f:
+        prefix = f.read(len(TABLE_MAGIC) + 4)
+        if len(prefix) < len(TABLE_MAGIC) + 4 or prefix[:len(TABLE_MAGIC)] != TABLE_MAGIC:
+            raise ValueError(f"Not a table artifact: {path}")
+        (header_len,) = struct.unpack("<I", prefix[len(TABLE_MAGIC):])
+        header = json.loads(f.read(header_len).decode('utf-8'))
+
+    data_size = path.stat().st_size - header["data_offset"]
+    if data_size % header["record_size"]:
+        raise ValueError(f"Truncated table artifact: {path}")
+    header["fields"] = [tuple(field) for field in header["fields"]]
+    header["rows"] = data_size // header["record_size"]
+    return header
+
+
+class TableWriter:
+    """Buffered writer for binary table artifacts."""
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        fields: Sequence[Tuple[str, str]],
+        buffer_rows: int = 4096
+    ):
+        """Open writer (truncates existing file) and write header.
+
+        Args:
+            file_path: Path to table file
+            fields: Column (name, type) pairs, types from TABLE_TYPES
+            buffer_rows: Rows buffered before flushing
+        """
+        self.file_path = Path(file_path)
+        self.fields = [tuple(field) for field in fields]
+        self.names = [name for name, _ in self.fields]
+        self.buffer_rows = buffer_rows
+        self.count = 0
+        self._struct = _row_struct(self.fields)
+        self._buffer = bytearray()
+        self._buffered = 0
+
+        # data_offset is part of the header, so grow it until the header fits
+        prefix_len = len(TABLE_MAGIC) + 4
+        header = {"fields": self.fields, "record_size": self._struct.size, "data_offset": 0}
+        while True:
+            header_bytes = json.dumps(header).encode('utf-8')
+            needed = -(-(prefix_len + len(header_bytes)) // _HEADER_ALIGN) * _HEADER_ALIGN
+            if needed <= header["data_offset"]:
+                break
+            header["data_offset"] = needed
+        padding = header["data_offset"] - prefix_len - len(header_bytes)
+
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        break_hardlink(self.file_path)
+        self._file = open(self.file_path, 'wb')
+        self._file.write(TABLE_MAGIC + struct.pack("<I", len(header_bytes)) + header_bytes + b" " * padding)
+
+    def write_row(self, row: Union[Sequence[Any], Dict[str, Any]]) -> None:
+        """Append one row.
+
+        Args:
+            row: Values in column order, or dict keyed by column name
+        """
+        if isinstance(row, dict):
+            row = [row[name] for name in self.names]
+        self._buffer += self._struct.pack(*row)
+        self._buffered += 1
+        self.count += 1
+        if self._buffered >= self.buffer_rows:
+            self.flush()
+
+    def write_rows(self, rows: Iterable[Union[Sequence[Any], Dict[str, Any]]]) -> None:
+        """Append multiple rows.
+
+        Args:
+            rows: Iterable of rows
+        """
+        for row in rows:
+            self.write_row(row)
+
+    def flush(self) -> None:
+        """Write buffered rows to disk."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+            self._buffered = 0
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> "TableWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class TableReader:
+    """Memory-mapped reader for binary table artifacts."""
+
+    def __init__(self, file_path: Union[str, Path]):
+        """Open and map table file.
+
+        Args:
+            file_path: Path to table file
+        """
+        self.file_path = Path(file_path)
+        self.header = read_table_header(self.file_path)
+        self.fields: List[Tuple[str, str]] = self.header["fields"]
+        self.names = [name for name, _ in self.fields]
+        self.rows = self.header["rows"]
+        self._struct = _row_struct(self.fields)
+
+        self._file = open(self.file_path, 'rb')
+        self._mmap = None
+        self._data = memoryview(b"")
+        if self.rows:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            offset = self.header["data_offset"]
+            self._data = memoryview(self._mmap)[offset:offset + self.rows * self._struct.size]
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def row(self, index: int) -> Tuple[Any, ...]:
+        """Get a single row.
+
+        Args:
+            index: Row index
+
+        Returns:
+            Row values in column order
+        """
+        if index < 0:
+            index += self.rows
+        if not 0 <= index < self.rows:
+            raise IndexError(f"Row index out of range: {index}")
+        return self._struct.unpack_from(self._data, index * self._struct.size)
+
+    def iter_rows(self) -> Iterator[Tuple[Any, ...]]:
+        """Iterate rows without copying the data section.
+
+        Yields:
+            Row values in column order
+        """
+        return self._struct.iter_unpack(self._data)
+
+    def column(self, name: str) -> List[Any]:
+        """Get all values of one column.
+
+        Args:
+            name: Column name
+
+        Returns:
+            List of column values
+        """
+        index = self.names.index(name)
+        return [row[index] for row in self.iter_rows()]
+
+    def as_numpy(self):
+        """View rows as a numpy structured array (zero-copy, requires numpy).
+
+        Returns:
+            numpy.ndarray backed by the mapped file
+        """
+        import numpy as np
+
+        dtype = np.dtype([(name, "<" + type_name if type_name != "bool" else "?") for name, type_name in self.fields])
+        return np.frombuffer(self._data, dtype=dtype, count=self.rows)
+
+    def close(self) -> None:
+        """Release the mapping and close the file."""
+        self._data.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "TableReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
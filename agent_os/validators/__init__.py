@@ -1,11 +1,44 @@
 """Validators for step outputs (gates)."""
 
-from .common import validate_file_exists, validate_file_size, validate_not_empty
-from .jsonschema_validator import validate_json_schema
+from .common import validate_file_exists, validate_file_size, validate_not_empty, validate_table
+from .jsonschema_validator import (
+    validate_json_schema,
+    validate_json_data,
+    get_schema_validator,
+    get_fast_validator,
+    clear_validator_cache,
+    compute_schema_digest,
+)
+from .records import (
+    validate_json_records,
+    check_record,
+    ValidatingJsonlWriter,
+    RecordValidationError,
+)
+from .result_cache import ValidationResultCache
+from .pipeline import ValidatorPipeline, ValidationCheck, build_checks
+from .codegen import compile_schema_source, load_fast_validator, UnsupportedSchemaError
 
 __all__ = [
     "validate_file_exists",
     "validate_file_size",
     "validate_not_empty",
+    "validate_table",
     "validate_json_schema",
+    "validate_json_data",
+    "validate_json_records",
+    "check_record",
+    "ValidatingJsonlWriter",
+    "RecordValidationError",
+    "get_schema_validator",
+    "get_fast_validator",
+    "clear_validator_cache",
+    "compute_schema_digest",
+    "ValidationResultCache",
+    "ValidatorPipeline",
+    "ValidationCheck",
+    "build_checks",
+    "compile_schema_source",
+    "load_fast_validator",
+    "UnsupportedSchemaError",
 ]
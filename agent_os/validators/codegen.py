@@ -0,0 +1,424 @@
+"""JSON Schema to Python code compiler (fast-path gate validators).
+
+Compiles a schema into a specialized ``validate(data) -> bool`` function with
+the checks inlined, in the spirit of fastjsonschema. Only a commonly used
+subset of draft-07 keywords is supported; schemas using anything else raise
+UnsupportedSchemaError and are validated by jsonschema alone.
+
+The fast path may reject an instance that jsonschema would accept, but
+never the reverse, so callers
+treat True as a pass and re-check False with jsonschema, which also
+produces the detailed error report. Schemas declaring a ``$schema`` other
+than draft-06/07 are not compiled, and an exception raised by generated
+code counts as False.
+
+Generated source is cached on disk by schema digest. Loading it executes
+code, so cached files are written private to the user and ignored unless
+they pass is_trusted_file.
+"""
+
+import hashlib
+import json
+import math
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from ..utils import get_logger, is_trusted_file, write_private_file
+
+logger = get_logger(__name__)
+
+# Bump when generated code changes (part of the cache key)
+CODEGEN_VERSION = 2
+
+# Dialects whose keyword semantics the generated code follows
+_SUPPORTED_DIALECTS = {
+    "http://json-schema.org/draft-06/schema",
+    "http://json-schema.org/draft-07/schema",
+}
+
+# Keywords without validation effect
+_ANNOTATIONS = {
+    "$id", "$comment", "title", "description", "default", "examples",
+    "definitions", "format", "readOnly", "writeOnly",
+}
+
+_TYPE_CHECKS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "integer": "((isinstance({v}, int) and not isinstance({v}, bool)) "
+               "or (isinstance({v}, float) and {v}.is_integer()))",
+}
+
+_OBJECT_KEYWORDS = {"properties", "required", "additionalProperties", "patternProperties",
+                    "minProperties", "maxProperties"}
+_ARRAY_KEYWORDS = {"items", "minItems", "maxItems"}
+_STRING_KEYWORDS = {"minLength", "maxLength", "pattern"}
+_NUMBER_KEYWORDS = {"minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum"}
+_SUPPORTED = (_ANNOTATIONS | _OBJECT_KEYWORDS | _ARRAY_KEYWORDS | _STRING_KEYWORDS | _NUMBER_KEYWORDS
+              | {"$schema", "type", "enum", "const", "$ref", "allOf", "anyOf", "not"})
+
+
+class UnsupportedSchemaError(ValueError):
+    """Schema uses keywords the compiler does not handle."""
+    pass
+
+
+def _literal(value: Any) -> str:
+    """Python source for a JSON value (non-finite numbers are rejected)."""
+    if isinstance(value, float) and not math.isfinite(value):
+        raise UnsupportedSchemaError(f"Non-finite number: {value!r}")
+    if isinstance(value, list):
+        for item in value:
+            _literal(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _literal(item)
+    return repr(value)
+
+
+def _number(schema: Dict[str, Any], keyword: str) -> str:
+    """Python source for a numeric keyword value."""
+    value = schema[keyword]
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        # e.g. draft-04 boolean exclusiveMinimum
+        raise UnsupportedSchemaError(f"Non-numeric {keyword}: {value!r}")
+    return _literal(value)
+
+
+def _count(schema: Dict[str, Any], keyword: str) -> int:
+    """Value of a non-negative integer keyword (minLength, maxItems, ...)."""
+    value = schema[keyword]
+    if isinstance(value, float) and math.isfinite(value) and value.is_integer():
+        value = int(value)
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise UnsupportedSchemaError(f"Invalid {keyword}: {value!r}")
+    return value
+
+
+def _json_equal(a: Any, b: Any) -> bool:
+    """JSON equality: booleans never equal numbers, at any depth (1 == 1.0 holds)."""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    if isinstance(a, dict):
+        return (isinstance(b, dict) and a.keys() == b.keys()
+                and all(_json_equal(item, b[key]) for key, item in a.items()))
+    if isinstance(a, list):
+        return isinstance(b, list) and len(a) == len(b) and all(map(_json_equal, a, b))
+    return not isinstance(b, (dict, list)) and a == b
+
+
+def _enum_match(value: Any, options: List[Any]) -> bool:
+    """Enum membership with JSON equality (never matches True against 1)."""
+    return any(_json_equal(value, option) for option in options)
+
+
+class _CodeGen:
+    """Emit validation code for one root schema."""
+
+    def __init__(self, root: Dict[str, Any]):
+        self.root = root
+        self.constants: List[str] = []
+        self.lines: List[str] = []
+        self._counter = 0
+        self._ref_stack: List[str] = []
+
+    def _name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def _constant(self, expr: str) -> str:
+        name = self._name("_C")
+        self.constants.append(f"{name} = {expr}")
+        return name
+
+    def _emit(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def _resolve_ref(self, ref: str) -> Any:
+        if not ref.startswith("#"):
+            raise UnsupportedSchemaError(f"Non-local $ref: {ref}")
+        node = self.root
+        for part in ref[1:].split("/")[1:]:
+            part = part.replace("~1", "/").replace("~0", "~")
+            node = node[int(part)] if isinstance(node, list) else node[part]
+        return node
+
+    def generate(self, schema: Any, var: str, indent: int) -> None:
+        """Emit checks for schema applied to variable var."""
+        if schema is True or schema == {}:
+            return
+        if schema is False:
+            self._emit(indent, "return False")
+            return
+        if not isinstance(schema, dict):
+            raise UnsupportedSchemaError(f"Invalid subschema: {schema!r}")
+
+        unknown = set(schema) - _SUPPORTED
+        if unknown:
+            raise UnsupportedSchemaError(f"Unsupported keywords: {sorted(unknown)}")
+
+        if "$schema" in schema and str(schema["$schema"]).rstrip("#") not in _SUPPORTED_DIALECTS:
+            raise UnsupportedSchemaError(f"Unsupported $schema: {schema['$schema']}")
+
+        # Siblings of $ref are ignored before 2019-09 and applied since;
+        # checking both is never more lenient than jsonschema
+        if "$ref" in schema:
+            ref = schema["$ref"]
+            if ref in self._ref_stack:
+                raise UnsupportedSchemaError(f"Recursive $ref: {ref}")
+            self._ref_stack.append(ref)
+            self.generate(self._resolve_ref(ref), var, indent)
+            self._ref_stack.pop()
+
+        if "type" in schema:
+            types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+            if any(t not in _TYPE_CHECKS for t in types):
+                raise UnsupportedSchemaError(f"Unknown type: {schema['type']}")
+            check = " or ".join(_TYPE_CHECKS[t].format(v=var) for t in types)
+            self._emit(indent, f"if not ({check}):")
+            self._emit(indent + 1, "return False")
+
+        if "enum" in schema:
+            options = schema["enum"]
+            if all(isinstance(option, str) for option in options):
+                name = self._constant(f"frozenset({sorted(options)!r})")
+                self._emit(indent, f"if not (isinstance({var}, str) and {var} in {name}):")
+            else:
+                name = self._constant(_literal(options))
+                self._emit(indent, f"if not _enum_match({var}, {name}):")
+            self._emit(indent + 1, "return False")
+
+        if "const" in schema:
+            name = self._constant(_literal([schema["const"]]))
+            self._emit(indent, f"if not _enum_match({var}, {name}):")
+            self._emit(indent + 1, "return False")
+
+        if _OBJECT_KEYWORDS & set(schema):
+            self._emit(indent, f"if isinstance({var}, dict):")
+            self._emit(indent + 1, "pass")
+            self._generate_object(schema, var, indent + 1)
+
+        if _ARRAY_KEYWORDS & set(schema):
+            self._emit(indent, f"if isinstance({var}, list):")
+            self._emit(indent + 1, "pass")
+            self._generate_array(schema, var, indent + 1)
+
+        if _STRING_KEYWORDS & set(schema):
+            self._emit(indent, f"if isinstance({var}, str):")
+            self._emit(indent + 1, "pass")
+            if "minLength" in schema:
+                self._emit(indent + 1, f"if len({var}) < {_count(schema, 'minLength')}:")
+                self._emit(indent + 2, "return False")
+            if "maxLength" in schema:
+                self._emit(indent + 1, f"if len({var}) > {_count(schema, 'maxLength')}:")
+                self._emit(indent + 2, "return False")
+            if "pattern" in schema:
+                regex = self._constant(f"re.compile({schema['pattern']!r})")
+                self._emit(indent + 1, f"if not {regex}.search({var}):")
+                self._emit(indent + 2, "return False")
+
+        if _NUMBER_KEYWORDS & set(schema):
+            self._emit(indent, f"if isinstance({var}, (int, float)) and not isinstance({var}, bool):")
+            self._emit(indent + 1, "pass")
+            for keyword, op in (("minimum", "<"), ("maximum", ">"),
+                                ("exclusiveMinimum", "<="), ("exclusiveMaximum", ">=")):
+                if keyword in schema:
+                    self._emit(indent + 1, f"if {var} {op} {_number(schema, keyword)}:")
+                    self._emit(indent + 2, "return False")
+
+        for subschema in schema.get("allOf", []):
+            self.generate(subschema, var, indent)
+
+        if "anyOf" in schema:
+            matched = self._name("_any")
+            self._emit(indent, f"{matched} = False")
+            for subschema in schema["anyOf"]:
+                self._emit(indent, f"if not {matched}:")
+                self._emit_predicate(subschema, var, indent + 1, matched)
+            self._emit(indent, f"if not {matched}:")
+            self._emit(indent + 1, "return False")
+
+        if "not" in schema:
+            matched = self._name("_not")
+            self._emit(indent, f"{matched} = False")
+            self._emit_predicate(schema["not"], var, indent, matched)
+            self._emit(indent, f"if {matched}:")
+            self._emit(indent + 1, "return False")
+
+    def _emit_predicate(self, schema: Any, var: str, indent: int, flag: str) -> None:
+        """Emit a nested function evaluating schema and store the result in flag."""
+        func = self._name("_sub")
+        self._emit(indent, f"def {func}({var}):")
+        body_start = len(self.lines)
+        self.generate(schema, var, indent + 1)
+        if len(self.lines) == body_start:
+            self._emit(indent + 1, "pass")
+        self._emit(indent + 1, "return True")
+        self._emit(indent, f"{flag} = {func}({var})")
+
+    def _generate_object(self, schema: Dict[str, Any], var: str, indent: int) -> None:
+        properties = schema.get("properties", {})
+        patterns = schema.get("patternProperties", {})
+
+        for key in schema.get("required", []):
+            self._emit(indent, f"if {key!r} not in {var}:")
+            self._emit(indent + 1, "return False")
+
+        if "minProperties" in schema:
+            self._emit(indent, f"if len({var}) < {_count(schema, 'minProperties')}:")
+            self._emit(indent + 1, "return False")
+        if "maxProperties" in schema:
+            self._emit(indent, f"if len({var}) > {_count(schema, 'maxProperties')}:")
+            self._emit(indent + 1, "return False")
+
+        for key, subschema in properties.items():
+            item = self._name("_v")
+            self._emit(indent, f"if {key!r} in {var}:")
+            self._emit(indent + 1, f"{item} = {var}[{key!r}]")
+            self.generate(subschema, item, indent + 1)
+
+        pattern_names = [(self._constant(f"re.compile({p!r})"), s) for p, s in patterns.items()]
+        additional = schema.get("additionalProperties", True)
+        if not pattern_names and additional is True:
+            return
+
+        key_var, value_var = self._name("_k"), self._name("_v")
+        self._emit(indent, f"for {key_var}, {value_var} in {var}.items():")
+        for regex, subschema in pattern_names:
+            self._emit(indent + 1, f"if {regex}.search({key_var}):")
+            self._emit(indent + 2, "pass")
+            self.generate(subschema, value_var, indent + 2)
+
+        if additional is not True:
+            conditions = []
+            if properties:
+                names = self._constant(f"frozenset({sorted(properties)!r})")
+                conditions.append(f"{key_var} not in {names}")
+            conditions.extend(f"not {regex}.search({key_var})" for regex, _ in pattern_names)
+            self._emit(indent + 1, f"if {' and '.join(conditions) or 'True'}:")
+            self._emit(indent + 2, "pass")
+            self.generate(additional, value_var, indent + 2)
+
+    def _generate_array(self, schema: Dict[str, Any], var: str, indent: int) -> None:
+        if "minItems" in schema:
+            self._emit(indent, f"if len({var}) < {_count(schema, 'minItems')}:")
+            self._emit(indent + 1, "return False")
+        if "maxItems" in schema:
+            self._emit(indent, f"if len({var}) > {_count(schema, 'maxItems')}:")
+            self._emit(indent + 1, "return False")
+
+        items = schema.get("items", True)
+        if isinstance(items, list):
+            for position, subschema in enumerate(items):
+                item = self._name("_i")
+                self._emit(indent, f"if len({var}) > {position}:")
+                self._emit(indent + 1, f"{item} = {var}[{position}]")
+                self.generate(subschema, item, indent + 1)
+        elif items is not True:
+            item = self._name("_i")
+            self._emit(indent, f"for {item} in {var}:")
+            self._emit(indent + 1, "pass")
+            self.generate(items, item, indent + 1)
+
+
+def compute_schema_digest(schema: Any) -> str:
+    """Compute digest identifying a schema (and the compiler version).
+
+    Args:
+        schema: Parsed JSON schema
+
+    Returns:
+        Hexadecimal SHA256 digest
+    """
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"v{CODEGEN_VERSION}:{canonical}".encode('utf-8')).hexdigest()
+
+
+def compile_schema_source(schema: Any) -> str:
+    """Generate Python source of a fast-path validator.
+
+    Args:
+        schema: Parsed JSON schema
+
+    Returns:
+        Module source defining validate(data) -> bool (False if the
+        generated checks raise, so callers fall back to jsonschema)
+
+    Raises:
+        UnsupportedSchemaError: If the schema uses unsupported keywords
+    """
+    gen = _CodeGen(schema)
+    gen.generate(schema, "data", 1)
+    return "\n".join([
+        f"# Generated by agent_os.validators.codegen v{CODEGEN_VERSION}",
+        "import re",
+        "",
+        *gen.constants,
+        "",
+        "",
+        "def _validate(data):",
+        *gen.lines,
+        "    return True",
+        "",
+        "",
+        "def validate(data):",
+        "    try:",
+        "        return _validate(data)",
+        "    except Exception:",
+        "        return False",
+        "",
+    ])
+
+
+def _load_source(source: str, filename: str) -> Callable[[Any], bool]:
+    namespace: Dict[str, Any] = {"_enum_match": _enum_match}
+    exec(compile(source, filename, "exec"), namespace)
+    return namespace["validate"]
+
+
+def load_fast_validator(
+    schema: Any,
+    cache_dir: Optional[Union[str, Path]] = None
+) -> Optional[Callable[[Any], bool]]:
+    """Compile (or load cached) fast-path validator for a schema.
+
+    Args:
+        schema: Parsed JSON schema
+        cache_dir: Directory for generated sources (no disk cache if None)
+
+    Returns:
+        validate(data) -> bool, or None if the schema cannot be compiled
+    """
+    digest = compute_schema_digest(schema)
+    cache_path = Path(cache_dir) / f"{digest}.py" if cache_dir is not None else None
+
+    if cache_path is not None and cache_path.exists():
+        try:
+            if not is_trusted_file(cache_path):
+                raise PermissionError("not owned by this user or writable by others")
+            return _load_source(cache_path.read_text(encoding='utf-8'), str(cache_path))
+        except Exception as e:
+            logger.warning(f"Ignoring broken generated validator {cache_path}: {e}")
+
+    try:
+        source = compile_schema_source(schema)
+        validate = _load_source(source, cache_path.as_posix() if cache_path else f"<schema {digest[:12]}>")
+    except UnsupportedSchemaError as e:
+        logger.debug(f"Schema not compiled ({e}), using jsonschema only")
+        return None
+    except Exception as e:
+        # e.g. a pattern Python's re cannot compile
+        logger.warning(f"Schema compilation failed ({e}), using jsonschema only")
+        return None
+
+    if cache_path is not None:
+        try:
+            write_private_file(cache_path, source.encode('utf-8'))
+        except OSError as e:
+            logger.warning(f"Could not cache generated validator {cache_path}: {e}")
+
+    return validate
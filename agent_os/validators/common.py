@@ -1,9 +1,9 @@
 """Common validators."""
 
 from pathlib import Path
-from typing import Union
+from typing import Dict, Optional, Union
 
-from ..utils import get_logger
+from ..utils import read_table_header, get_logger
 
 logger = get_logger(__name__)
 
@@ -64,3 +64,38 @@ def validate_not_empty(file_path: Union[str, Path]) -> bool:
         True if file is not empty
     """
     return validate_file_size(file_path, min_size=1)
+
+
+def validate_table(
+    file_path: Union[str, Path],
+    columns: Optional[Dict[str, str]] = None,
+    min_rows: int = 0
+) -> bool:
+    """Validate binary table artifact (header only, rows are not read).
+
+    Args:
+        file_path: Path to table file
+        columns: Required columns as name -> type (optional)
+        min_rows: Minimum number of rows
+
+    Returns:
+        True if table is valid
+    """
+    try:
+        header = read_table_header(file_path)
+    except (OSError, ValueError) as e:
+        logger.error(f"Invalid table artifact {file_path}: {e}")
+        return False
+
+    fields = dict(header["fields"])
+    for name, type_name in (columns or {}).items():
+        if fields.get(name) != type_name:
+            logger.error(f"Table column mismatch: {name} expected {type_name}, got {fields.get(name)}")
+            return False
+
+    if header["rows"] < min_rows:
+        logger.error(f"Table too short: {header['rows']} < {min_rows} rows")
+        return False
+
+    logger.info(f"Table OK: {header['rows']} rows")
+    return True
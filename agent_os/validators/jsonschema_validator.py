@@ -1,18 +1,185 @@
 """JSON Schema validator."""
 
+import hashlib
+import json
 from pathlib import Path
-from typing import Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 import jsonschema
+from referencing import Registry, Resource
+from referencing.jsonschema import DRAFT7
 
-from ..utils import load_json, get_logger
+from ..config import get_config
+from ..utils import compute_sha256, load_json, is_jsonl_path, iter_jsonl, get_logger
+from .codegen import load_fast_validator
 
 logger = get_logger(__name__)
 
+# Compiled validators keyed by resolved schema path, with the stamp of its directory
+_validator_cache: Dict[str, Tuple[Tuple, Any]] = {}
+_fast_validator_cache: Dict[str, Tuple[Tuple, Any]] = {}
+
+
+def _schema_stamp(path: Path) -> Tuple:
+    """(name, mtime_ns, size) of every *.json file next to a schema.
+
+    A compiled validator's registry holds all sibling schemas, so a change
+    to any of them (not just the root) invalidates it.
+    """
+    path.stat()  # Missing root schema raises FileNotFoundError
+    stamp = []
+    for sibling in sorted(path.parent.glob("*.json")):
+        try:
+            stat = sibling.stat()
+        except FileNotFoundError:
+            continue
+        stamp.append((sibling.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(stamp)
+
+
+def _build_registry(schema_dir: Path) -> Registry:
+    """Register all schemas in a directory for $ref resolution.
+
+    Each schema is registered under its file URI (so relative refs such as
+    "step_result.schema.json#/definitions/x" resolve) and under its $id.
+
+    Args:
+        schema_dir: Directory containing *.json schemas
+
+    Returns:
+        Registry of schema resources
+    """
+    resources = []
+    for path in sorted(schema_dir.glob("*.json")):
+        try:
+            contents = load_json(path)
+        except Exception as e:
+            logger.debug(f"Skipping unreadable schema {path}: {e}")
+            continue
+        if not isinstance(contents, dict):
+            continue
+        resource = Resource.from_contents(contents, default_specification=DRAFT7)
+        resources.append((path.resolve().as_uri(), resource))
+        if isinstance(contents.get("$id"), str):
+            resources.append((contents["$id"], resource))
+    return Registry().with_resources(resources)
+
+
+def compute_schema_digest(schema_path: Union[str, Path]) -> Optional[str]:
+    """Digest of a schema together with every schema it can $ref.
+
+    Covers all *.json files in the schema's directory (the registry the
+    validator resolves references against).
+
+    Args:
+        schema_path: Path to JSON schema file
+
+    Returns:
+        Hex digest, or None if the schema does not exist
+    """
+    path = Path(schema_path)
+    if not path.is_file():
+        return None
+    entries = [[path.name, "schema"]]
+    entries.extend([p.name, compute_sha256(p)] for p in sorted(path.parent.glob("*.json")) if p.is_file())
+    return hashlib.sha256(json.dumps(entries).encode('utf-8')).hexdigest()
+
+
+def get_schema_validator(schema_path: Union[str, Path]):
+    """Get compiled validator for a schema file (cached per process).
+
+    The schema is loaded, checked and compiled once; the cache entry is
+    reused until the mtime or size of the schema or of any sibling schema
+    file changes. $refs to sibling schema files are resolved through a
+    registry built at compile time.
+
+    Args:
+        schema_path: Path to JSON schema file
+
+    Returns:
+        jsonschema validator instance
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    path = Path(schema_path).resolve()
+    stamp = _schema_stamp(path)
+    key = str(path)
+
+    entry = _validator_cache.get(key)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+
+    schema = load_json(path)
+    if isinstance(schema, dict) and "$id" not in schema:
+        # Give the root a base URI so relative $refs resolve against its directory
+        schema = {"$id": path.as_uri(), **schema}
+
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    validator = validator_class(schema, registry=_build_registry(path.parent))
+
+    _validator_cache[key] = (stamp, validator)
+    logger.debug(f"Compiled schema validator: {path}")
+    return validator
+
+
+def get_fast_validator(schema_path: Union[str, Path]) -> Optional[Callable[[Any], bool]]:
+    """Get generated fast-path validator for a schema file (cached per process).
+
+    Generated code is also cached on disk under cache.root/validators by
+    schema digest. Disabled by validation.codegen.
+
+    Args:
+        schema_path: Path to JSON schema file
+
+    Returns:
+        validate(data) -> bool, or None if disabled or the schema is not compilable
+    """
+    config = get_config()
+    if not config.validation.codegen:
+        return None
+
+    path = Path(schema_path).resolve()
+    stamp = _schema_stamp(path)
+    key = str(path)
+
+    entry = _fast_validator_cache.get(key)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+
+    validate = load_fast_validator(load_json(path), Path(config.cache.root) / "validators")
+    _fast_validator_cache[key] = (stamp, validate)
+    return validate
+
+
+def clear_validator_cache() -> None:
+    """Clear compiled validator caches."""
+    _validator_cache.clear()
+    _fast_validator_cache.clear()
+
+
+def _check_instance(data: Any, validator, fast_validate: Optional[Callable[[Any], bool]]):
+    """Check instance, using the fast path first.
+
+    Args:
+        data: Instance to validate
+        validator: jsonschema validator (authoritative, detailed errors)
+        fast_validate: Generated validator or None
+
+    Returns:
+        Best-matching ValidationError, or None if valid
+    """
+    if fast_validate is not None and fast_validate(data):
+        return None
+    return jsonschema.exceptions.best_match(validator.iter_errors(data))
+
 
 def validate_json_schema(data_path: Union[str, Path], schema_path: Union[str, Path], strict: bool = True) -> bool:
     """Validate JSON data against schema.
 
+    JSON Lines files (.jsonl) are validated record by record while streaming.
+
     Args:
         data_path: Path to JSON data file
         schema_path: Path to JSON schema file
@@ -22,12 +189,35 @@ def validate_json_schema(data_path: Union[str, Path], schema_path: Union[str, Pa
         True if validation passed
     """
     try:
+        if is_jsonl_path(data_path):
+            return _validate_jsonl_records(data_path, get_schema_validator(schema_path),
+                                           get_fast_validator(schema_path))
+
         data = load_json(data_path)
-        schema = load_json(schema_path)
 
-        # Validate
-        jsonschema.validate(instance=data, schema=schema)
-        logger.info(f"JSON schema validation passed: {data_path}")
+    except Exception as e:
+        logger.error(f"JSON schema validation error: {e}")
+        return False
+
+    return validate_json_data(data, schema_path, label=str(data_path))
+
+
+def validate_json_data(data: Any, schema_path: Union[str, Path], label: str = "<object>") -> bool:
+    """Validate an in-memory object against schema (no file read).
+
+    Args:
+        data: Parsed JSON object
+        schema_path: Path to JSON schema file
+        label: Name used in log messages (e.g. artifact path)
+
+    Returns:
+        True if validation passed
+    """
+    try:
+        error = _check_instance(data, get_schema_validator(schema_path), get_fast_validator(schema_path))
+        if error is not None:
+            raise error
+        logger.info(f"JSON schema validation passed: {label}")
         return True
 
     except jsonschema.ValidationError as e:
@@ -39,3 +229,31 @@ def validate_json_schema(data_path: Union[str, Path], schema_path: Union[str, Pa
     except Exception as e:
         logger.error(f"JSON schema validation error: {e}")
         return False
+
+
+def _validate_jsonl_records(
+    data_path: Union[str, Path],
+    validator,
+    fast_validate: Optional[Callable[[Any], bool]] = None
+) -> bool:
+    """Validate each record of a JSONL file against schema.
+
+    Args:
+        data_path: Path to JSONL data file
+        validator: Compiled validator (applied per record)
+        fast_validate: Generated fast-path validator (optional)
+
+    Returns:
+        True if every record passed
+    """
+    count = 0
+    for count, record in enumerate(iter_jsonl(data_path), start=1):
+        error = _check_instance(record, validator, fast_validate)
+        if error is not None:
+            logger.error(f"JSON schema validation failed at record {count}: {error.message}")
+            logger.error(f"  Path: {error.path}")
+            logger.error(f"  Schema path: {error.schema_path}")
+            return False
+
+    logger.info(f"JSON schema validation passed: {data_path} ({count} records)")
+    return True
@@ -0,0 +1,252 @@
+"""Declarative validator pipeline (gate checks from the task's validator block).
+
+Supported forms of ``validator:`` in task YAML::
+
+    validator:
+      type: "file_exists"
+
+    validator:
+      parallel: true
+      checks:
+        - type: "file_size"
+          min_size: 10
+        - type: "jsonschema"
+          schema: "schemas/summary.schema.json"
+          outputs: ["summary.json"]
+        - type: "records"              # per record, streaming (JSONL or prefix)
+          schema: "schemas/segment.schema.json"
+          prefix: "segments.item"
+          max_failures: 10
+          workers: 4
+          outputs: ["segments.json"]
+
+Checks run in cost order (stat-based existence/size, then table headers,
+then schema, then the step's own validate() as "custom") and stop at the
+first tier with a failure. Checks of one tier for different outputs can run
+in parallel. A "custom" check is always appended if not listed.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from ..utils import is_jsonl_path, get_logger
+from .common import validate_file_exists, validate_file_size, validate_not_empty, validate_table
+from .jsonschema_validator import validate_json_data, validate_json_schema
+from .records import validate_json_records
+
+logger = get_logger(__name__)
+
+# Relative cost of each check type (lower runs first)
+CHECK_COSTS = {
+    "file_exists": 0,
+    "file_size": 1,
+    "not_empty": 1,
+    "table": 2,
+    "jsonschema": 3,
+    "records": 3,
+    "custom": 4,
+}
+
+# Check types applied once per step rather than per output
+_STEP_LEVEL_CHECKS = {"custom"}
+
+
+@dataclass
+class ValidationCheck:
+    """Single gate check (for one output, or the whole step)."""
+    type: str
+    output_key: Optional[str] = None
+    params: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def cost(self) -> int:
+        return CHECK_COSTS[self.type]
+
+    @property
+    def name(self) -> str:
+        return f"{self.type}:{self.output_key}" if self.output_key else self.type
+
+
+def build_checks(validator_config: Dict[str, Any], outputs: List[str]) -> List[ValidationCheck]:
+    """Expand a validator block into per-output checks.
+
+    Args:
+        validator_config: Step validator block (single check or checks list)
+        outputs: Step output keys
+
+    Returns:
+        Checks sorted by cost (custom always last)
+
+    Raises:
+        ValueError: If a check type is unknown
+    """
+    if "checks" in validator_config:
+        specs = validator_config["checks"]
+    elif "type" in validator_config:
+        specs = [validator_config]
+    else:
+        specs = []
+
+    checks: List[ValidationCheck] = []
+    for spec in specs:
+        check_type = spec["type"]
+        if check_type not in CHECK_COSTS:
+            raise ValueError(f"Unknown validator type: {check_type}")
+
+        params = {k: v for k, v in spec.items() if k not in ("type", "outputs")}
+        if check_type in _STEP_LEVEL_CHECKS:
+            checks.append(ValidationCheck(check_type, None, params))
+            continue
+        for output_key in spec.get("outputs", outputs):
+            checks.append(ValidationCheck(check_type, output_key, params))
+
+    if not any(check.type == "custom" for check in checks):
+        checks.append(ValidationCheck("custom"))
+
+    # Stable sort keeps declaration order within a cost tier
+    return sorted(checks, key=lambda check: check.cost)
+
+
+class ValidatorPipeline:
+    """Run gate checks in cost order with short-circuiting."""
+
+    def __init__(self, checks: List[ValidationCheck], parallel: bool = True, workers: Optional[int] = None):
+        """Initialize pipeline.
+
+        Args:
+            checks: Checks (sorted by cost)
+            parallel: Run checks of the same tier concurrently
+            workers: Number of worker threads (defaults to CPU count)
+        """
+        self.checks = checks
+        self.parallel = parallel
+        self.workers = workers or os.cpu_count() or 1
+
+    @classmethod
+    def from_step(cls, step) -> "ValidatorPipeline":
+        """Build pipeline from a step's validator block.
+
+        Args:
+            step: Step instance
+
+        Returns:
+            ValidatorPipeline
+        """
+        config = step.validator_config or {}
+        return cls(build_checks(config, step.outputs), parallel=config.get("parallel", True))
+
+    def _run_check(self, check: ValidationCheck, step, ctx) -> Dict[str, Any]:
+        """Run one check and time it."""
+        start = time.perf_counter()
+        error = None
+        try:
+            passed = bool(self._dispatch(check, step, ctx))
+        except Exception as e:
+            # Not a verdict on the outputs (I/O error, bad schema, ...)
+            logger.error(f"Validation check {check.name} error: {e}")
+            error = str(e)
+            passed = False
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        if not passed:
+            logger.error(f"Validation check failed: {check.name}")
+        result = {
+            "check": check.name,
+            "type": check.type,
+            "output": check.output_key,
+            "passed": passed,
+            "elapsed_ms": round(elapsed_ms, 3),
+        }
+        if error is not None:
+            result["error"] = error
+        return result
+
+    @staticmethod
+    def _dispatch(check: ValidationCheck, step, ctx) -> bool:
+        if check.type == "custom":
+            return step.validate(ctx)
+
+        path = step.get_output_path(ctx, check.output_key)
+        params = check.params
+
+        if check.type == "file_exists":
+            return validate_file_exists(path)
+        if check.type == "file_size":
+            return validate_file_size(path, min_size=params.get("min_size", 1), max_size=params.get("max_size"))
+        if check.type == "not_empty":
+            return validate_not_empty(path)
+        if check.type == "table":
+            return validate_table(path, columns=params.get("columns"), min_rows=params.get("min_rows", 0))
+
+        # Validated record by record while the step wrote the (unchanged) output
+        if check.type in ("jsonschema", "records") and "prefix" not in params:
+            if ctx.is_prevalidated(check.output_key, path, params["schema"]):
+                logger.info(f"Skipping {check.name}: validated while produced")
+                return True
+
+        if check.type == "records":
+            report = validate_json_records(
+                path,
+                params["schema"],
+                prefix=params.get("prefix"),
+                max_failures=params.get("max_failures", 10),
+                workers=params.get("workers", 0),
+            )
+            return report["passed"]
+
+        # jsonschema: validate the object run() saved when possible (no re-read)
+        if is_jsonl_path(path):
+            return validate_json_schema(path, params["schema"])
+        return validate_json_data(step.load_output_json(ctx, check.output_key), params["schema"], label=str(path))
+
+    def run(self, step, ctx) -> Dict[str, Any]:
+        """Run checks tier by tier, stopping after the first failing tier.
+
+        Args:
+            step: Step whose outputs are validated
+            ctx: Step context
+
+        Returns:
+            Report (passed, errored, per-check results with timings, skipped
+            checks, elapsed_ms). errored is True if any check raised instead
+            of reaching a verdict.
+        """
+        start = time.perf_counter()
+        results: List[Dict[str, Any]] = []
+        skipped: List[str] = []
+        passed = True
+
+        tiers: Dict[int, List[ValidationCheck]] = {}
+        for check in self.checks:
+            tiers.setdefault(check.cost, []).append(check)
+
+        for cost in sorted(tiers):
+            tier = tiers[cost]
+            if not passed:
+                skipped.extend(check.name for check in tier)
+                continue
+
+            if self.parallel and len(tier) > 1 and self.workers > 1:
+                with ThreadPoolExecutor(max_workers=min(self.workers, len(tier))) as executor:
+                    tier_results = list(executor.map(lambda c: self._run_check(c, step, ctx), tier))
+            else:
+                tier_results = []
+                for index, check in enumerate(tier):
+                    tier_results.append(self._run_check(check, step, ctx))
+                    if not tier_results[-1]["passed"]:
+                        skipped.extend(c.name for c in tier[index + 1:])
+                        break
+
+            results.extend(tier_results)
+            passed = all(result["passed"] for result in tier_results)
+
+        return {
+            "passed": passed,
+            "errored": any("error" in result for result in results),
+            "checks": results,
+            "skipped": skipped,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+        }
@@ -0,0 +1,296 @@
+"""Streaming record-level schema validation (JSONL records, large arrays).
+
+Records are parsed and checked one at a time, so memory stays bounded by the
+largest record. Uncompressed JSONL files above a size threshold can be split
+at line boundaries and validated across a process pool.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import jsonschema
+
+from ..utils import detect_compression, iter_json_items, loads_json, open_artifact, JsonlWriter, get_logger
+from .jsonschema_validator import get_fast_validator, get_schema_validator
+
+logger = get_logger(__name__)
+
+# Files smaller than this are validated in-process even if workers are requested
+PARALLEL_MIN_SIZE = 64 * 1024 * 1024
+
+# Incremental record check: returns an error message, or None if the record is valid
+RecordCheck = Callable[[Any], Optional[str]]
+
+
+class RecordValidationError(ValueError):
+    """Output record failed validation while being produced."""
+
+    def __init__(self, record_number: int, message: str):
+        """Initialize error.
+
+        Args:
+            record_number: 1-based record number (line number for JSONL)
+            message: Validation error message
+        """
+        super().__init__(f"Record {record_number} invalid: {message}")
+        self.record_number = record_number
+        self.message = message
+
+
+def check_record(
+    record: Any,
+    schema_path: Optional[Union[str, Path]] = None,
+    checks: Iterable[RecordCheck] = ()
+) -> Optional[str]:
+    """Check one record against a schema and custom checks.
+
+    Args:
+        record: Parsed record
+        schema_path: JSON schema (optional)
+        checks: Incremental record checks
+
+    Returns:
+        First error message, or None if valid
+    """
+    if schema_path is not None:
+        fast_validate = get_fast_validator(schema_path)
+        if fast_validate is None or not fast_validate(record):
+            error = jsonschema.exceptions.best_match(get_schema_validator(schema_path).iter_errors(record))
+            if error is not None:
+                return error.message
+    for check in checks:
+        message = check(record)
+        if message:
+            return message
+    return None
+
+
+class _RecordChecker:
+    """Check records against a schema, collecting up to max_failures errors."""
+
+    def __init__(self, schema_path: Union[str, Path], max_failures: int):
+        self.validator = get_schema_validator(schema_path)
+        self.fast_validate = get_fast_validator(schema_path)
+        self.max_failures = max_failures
+        self.failures: List[Dict[str, Any]] = []
+        self.records = 0
+
+    @property
+    def full(self) -> bool:
+        return len(self.failures) >= self.max_failures
+
+    def check(self, record: Any, location: Dict[str, Any]) -> None:
+        self.records += 1
+        if self.fast_validate is not None and self.fast_validate(record):
+            return
+        error = jsonschema.exceptions.best_match(self.validator.iter_errors(record))
+        if error is not None:
+            self.failures.append({
+                **location,
+                "message": error.message,
+                "path": "/".join(str(part) for part in error.absolute_path),
+            })
+
+    def fail(self, location: Dict[str, Any], message: str) -> None:
+        self.records += 1
+        self.failures.append({**location, "message": message, "path": ""})
+
+
+def _iter_lines(f, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, bytes]]:
+    """Yield (line number relative to start, line) for lines starting before end."""
+    pos = start
+    for line_no, line in enumerate(f, start=1):
+        if end is not None and pos >= end:
+            return
+        pos += len(line)
+        yield line_no, line
+
+
+def _check_jsonl_lines(
+    checker: _RecordChecker,
+    lines: Iterator[Tuple[int, bytes]],
+    count_all: bool = False
+) -> int:
+    """Validate JSONL lines until done or enough failures.
+
+    With count_all, lines after the failure limit are still counted (not
+    parsed) so the caller learns the total line count.
+    """
+    line_count = 0
+    for line_no, line in lines:
+        line_count = line_no
+        if checker.full:
+            continue
+        if not line.strip():
+            continue
+        try:
+            record = loads_json(line)
+        except ValueError as e:
+            checker.fail({"line": line_no}, f"Invalid JSON: {e}")
+        else:
+            checker.check(record, {"line": line_no})
+        if checker.full and not count_all:
+            break
+    return line_count
+
+
+def _validate_jsonl_range(args: Tuple[str, str, int, int, int]) -> Dict[str, Any]:
+    """Process-pool worker: validate lines starting in [start, end)."""
+    data_path, schema_path, start, end, max_failures = args
+    checker = _RecordChecker(schema_path, max_failures)
+    with open(data_path, 'rb') as f:
+        f.seek(start)
+        # All lines are counted so later ranges' line numbers can be offset
+        lines = _check_jsonl_lines(checker, _iter_lines(f, start, end), count_all=True)
+    return {"records": checker.records, "failures": checker.failures, "lines": lines}
+
+
+def _split_ranges(data_path: Path, parts: int) -> List[Tuple[int, int]]:
+    """Split file into byte ranges starting at line boundaries."""
+    size = data_path.stat().st_size
+    bounds = [0]
+    with open(data_path, 'rb') as f:
+        for i in range(1, parts):
+            f.seek(max(size * i // parts - 1, bounds[-1]))
+            f.readline()
+            bounds.append(max(f.tell(), bounds[-1]))
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def _validate_jsonl_parallel(
+    data_path: Path,
+    schema_path: Union[str, Path],
+    max_failures: int,
+    workers: int
+) -> Tuple[int, List[Dict[str, Any]]]:
+    ranges = _split_ranges(data_path, workers)
+    tasks = [(str(data_path), str(schema_path), start, end, max_failures) for start, end in ranges]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_validate_jsonl_range, tasks))
+
+    records = 0
+    failures: List[Dict[str, Any]] = []
+    line_offset = 0
+    for result in results:
+        records += result["records"]
+        failures.extend({**failure, "line": failure["line"] + line_offset} for failure in result["failures"])
+        line_offset += result["lines"]
+    return records, failures
+
+
+def validate_json_records(
+    data_path: Union[str, Path],
+    schema_path: Union[str, Path],
+    prefix: Optional[str] = None,
+    max_failures: int = 10,
+    workers: int = 0
+) -> Dict[str, Any]:
+    """Validate each record of a JSONL file or large JSON array while streaming.
+
+    Args:
+        data_path: Path to JSONL file, or JSON file if prefix is given
+        schema_path: Path to JSON schema applied to each record
+        prefix: Dotted path of records in a JSON document ("item" for a
+            top-level array, "records.item" for a nested one)
+        max_failures: Stop after this many failing records
+        workers: Process pool size for large uncompressed JSONL (0 = in-process)
+
+    Returns:
+        Report: passed, records checked, failures (line for JSONL, index for
+        arrays, message, path), truncated (stopped at max_failures)
+    """
+    data_path = Path(data_path)
+    max_failures = max(1, max_failures)
+
+    use_pool = (
+        prefix is None
+        and workers > 1
+        and data_path.stat().st_size >= PARALLEL_MIN_SIZE
+        and detect_compression(data_path) is None
+    )
+
+    if use_pool:
+        records, failures = _validate_jsonl_parallel(data_path, schema_path, max_failures, workers)
+    else:
+        checker = _RecordChecker(schema_path, max_failures)
+        if prefix is None:
+            with open_artifact(data_path) as f:
+                _check_jsonl_lines(checker, _iter_lines(f))
+        else:
+            for index, record in enumerate(iter_json_items(data_path, prefix)):
+                checker.check(record, {"index": index})
+                if checker.full:
+                    break
+        records, failures = checker.records, checker.failures
+
+    truncated = len(failures) >= max_failures
+    failures = failures[:max_failures]
+
+    for failure in failures:
+        where = f"line {failure['line']}" if "line" in failure else f"item {failure['index']}"
+        logger.error(f"Record validation failed at {where}: {failure['message']}")
+    if not failures:
+        logger.info(f"Record validation passed: {data_path} ({records} records)")
+
+    return {
+        "passed": not failures,
+        "records": records,
+        "failures": failures,
+        "truncated": truncated,
+    }
+
+
+class ValidatingJsonlWriter(JsonlWriter):
+    """JSONL writer that validates each record before it is written.
+
+    The first invalid record raises RecordValidationError, so a producing
+    step aborts immediately instead of failing the gate after run().
+    """
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        schema_path: Optional[Union[str, Path]] = None,
+        checks: Iterable[RecordCheck] = (),
+        on_complete: Optional[Callable[[], None]] = None,
+        buffer_size: int = 1024 * 1024
+    ):
+        """Open writer (truncates existing file).
+
+        Args:
+            file_path: Path to JSONL file
+            schema_path: JSON schema applied to each record (optional)
+            checks: Incremental record checks
+            on_complete: Called after a clean close with every record valid
+            buffer_size: Flush threshold in bytes
+        """
+        super().__init__(file_path, buffer_size=buffer_size)
+        self.schema_path = schema_path
+        self.checks = list(checks)
+        self.on_complete = on_complete
+        self.failed = False
+
+    def write(self, record: Any) -> None:
+        """Validate and append one record.
+
+        Args:
+            record: JSON-serializable record
+
+        Raises:
+            RecordValidationError: If the record is invalid
+        """
+        message = check_record(record, self.schema_path, self.checks)
+        if message is not None:
+            self.failed = True
+            raise RecordValidationError(self.count + 1, message)
+        super().write(record)
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.failed = True
+        self.close()
+        if not self.failed and self.on_complete is not None:
+            self.on_complete()
@@ -0,0 +1,89 @@
+"""Persistent cache of gate outcomes (SQLite under cache.root)."""
+
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from ..config import get_config
+from ..utils import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS validation_results (
+    artifact_digest TEXT NOT NULL,
+    validator_id TEXT NOT NULL,
+    passed INTEGER NOT NULL,
+    recorded_at REAL NOT NULL,
+    PRIMARY KEY (artifact_digest, validator_id)
+);
+"""
+
+
+class ValidationResultCache:
+    """Gate outcomes keyed by (artifact digest, validator identity).
+
+    Outcomes are shared across retries, replays and jobs, so identical
+    outputs checked by an identical validator are never validated twice.
+    """
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None):
+        """Open (and create if needed) the cache.
+
+        Args:
+            db_path: Path to SQLite file (defaults to cache.root/validation.sqlite)
+        """
+        self.config = get_config()
+        self.db_path = Path(db_path or Path(self.config.cache.root) / "validation.sqlite")
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, commit on success and always close it."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, artifact_digest: str, validator_id: str) -> Optional[bool]:
+        """Look up a recorded outcome.
+
+        Args:
+            artifact_digest: Digest of the validated artifact(s)
+            validator_id: Digest identifying the validator and its settings
+
+        Returns:
+            True/False if recorded, else None
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT passed FROM validation_results WHERE artifact_digest = ? AND validator_id = ?",
+                (artifact_digest, validator_id),
+            ).fetchone()
+        return None if row is None else bool(row[0])
+
+    def put(self, artifact_digest: str, validator_id: str, passed: bool) -> None:
+        """Record an outcome.
+
+        Args:
+            artifact_digest: Digest of the validated artifact(s)
+            validator_id: Digest identifying the validator and its settings
+            passed: Gate outcome
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO validation_results VALUES (?, ?, ?, ?)",
+                (artifact_digest, validator_id, int(passed), time.time()),
+            )
+
+    def clear(self) -> None:
+        """Remove all recorded outcomes."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM validation_results")
@@ -2,28 +2,33 @@
 """Agent OS CLI - Run, Replay, Distill."""
 
 import argparse
+import shutil
+import sqlite3
 import sys
 from pathlib import Path
 
-from agent_os import Job, Runner, get_config, distill_success_patterns
-from agent_os.utils import load_yaml, setup_logging, get_logger
-from agent_os.steps_builtin import LoadInputStep, SummarizeStep, StubStep
+from agent_os import (
+    Job,
+    Runner,
+    ArtifactManifest,
+    TaskPlan,
+    get_config,
+    distill_success_patterns,
+    load_task_plan,
+)
+from agent_os.gc import collect_garbage, parse_size
+from agent_os.jobindex import JobIndex
+from agent_os.utils import (
+    ARCHIVE_SUFFIX,
+    compute_input_hash,
+    pack_directory,
+    setup_logging,
+    get_logger,
+)
 
 logger = get_logger(__name__)
 
 
-def load_task_spec(task_path: str) -> dict:
-    """Load task specification.
-
-    Args:
-        task_path: Path to task YAML
-
-    Returns:
-        Task spec dict
-    """
-    return load_yaml(task_path)
-
-
 def create_steps_from_spec(task_spec: dict, inputs: dict) -> list:
     """Create Step instances from task spec.
 
@@ -34,44 +39,7 @@ def create_steps_from_spec(task_spec: dict, inputs: dict) -> list:
     Returns:
         List of Step instances
     """
-    steps = []
-    step_classes = {
-        "LoadInputStep": LoadInputStep,
-        "SummarizeStep": SummarizeStep,
-        "StubStep": StubStep,
-    }
-
-    for step_config in task_spec["steps"]:
-        step_type = step_config["type"]
-        step_class = step_classes.get(step_type)
-
-        if not step_class:
-            raise ValueError(f"Unknown step type: {step_type}")
-
-        # Replace placeholders in config
-        config = step_config.get("config", {})
-        for key, value in config.items():
-            if isinstance(value, str) and "{" in value:
-                # Simple placeholder replacement
-                for input_key, input_value in inputs.items():
-                    value = value.replace(f"{{{input_key}}}", str(input_value))
-                config[key] = value
-
-        # Create step instance
-        step = step_class(
-            step_id=step_config["id"],
-            name=step_config["name"],
-            config={
-                **config,
-                "inputs": step_config.get("inputs", []),
-                "outputs": step_config.get("outputs", []),
-                "validator": step_config.get("validator", {})
-            }
-        )
-
-        steps.append(step)
-
-    return steps
+    return TaskPlan.compile(task_spec).instantiate(inputs)
 
 
 def cmd_run(args):
@@ -87,9 +55,9 @@ def cmd_run(args):
     logger.info("Agent OS - Run Task")
     logger.info("=" * 60)
 
-    # Load task spec
-    task_spec = load_task_spec(args.task)
-    task_name = task_spec["name"]
+    # Load compiled task plan (cached by spec hash)
+    plan = load_task_plan(args.task)
+    task_name = plan.name
 
     # Prepare inputs
     inputs = {}
@@ -104,7 +72,7 @@ def cmd_run(args):
     logger.info(f"Workdir: {job.workdir}")
 
     # Create steps
-    steps = create_steps_from_spec(task_spec, inputs)
+    steps = plan.instantiate(inputs)
 
     # Run
     runner = Runner(job, steps)
@@ -142,6 +110,272 @@ def cmd_replay(args):
     sys.exit(1)
 
 
+def get_job_workdir(job_id: str) -> Path:
+    """Get workdir of an existing job.
+
+    Args:
+        job_id: Job ID
+
+    Returns:
+        Path to job workdir
+    """
+    config = get_config()
+    return Path(config.paths.job_root_template.format(job_id=job_id))
+
+
+def get_job_archive_path(job_id: str) -> Path:
+    """Get archive path of a packed job.
+
+    Args:
+        job_id: Job ID
+
+    Returns:
+        Path to job archive (next to the workdir)
+    """
+    workdir = get_job_workdir(job_id)
+    return workdir.with_name(workdir.name + ARCHIVE_SUFFIX)
+
+
+def load_job_manifest(job_id: str):
+    """Load manifest of a job from its workdir or, if packed, its archive.
+
+    Args:
+        job_id: Job ID
+
+    Returns:
+        ArtifactManifest, or None if the job has neither
+    """
+    config = get_config()
+    manifest_path = get_job_workdir(job_id) / config.artifacts.manifest_file
+    if manifest_path.exists():
+        return ArtifactManifest(manifest_path)
+
+    archive_path = get_job_archive_path(job_id)
+    if archive_path.exists():
+        return ArtifactManifest.from_archive(archive_path)
+    return None
+
+
+def cmd_verify(args):
+    """Verify job artifacts against manifest (parallel).
+
+    Args:
+        args: Command arguments
+    """
+    setup_logging()
+
+    manifest = load_job_manifest(args.job)
+    if manifest is None:
+        logger.error(f"Manifest not found for job: {args.job}")
+        sys.exit(1)
+
+    report = manifest.verify_all(workers=args.workers, full=args.full)
+
+    logger.info("=" * 60)
+    logger.info("Verification Summary")
+    logger.info("=" * 60)
+    logger.info(f"Job ID: {args.job}")
+    logger.info(f"Artifacts: {report['artifacts_ok']}/{report['artifacts_total']} OK")
+    logger.info(f"Re-hashed: {report['artifacts_hashed']}")
+    logger.info(f"Bytes: {report['bytes_total']} in {report['elapsed_sec']}s "
+                f"({report['throughput_mb_s']} MB/s)")
+
+    for mismatch in report["mismatches"]:
+        logger.error(f"  {mismatch['key']}: {mismatch['status']}")
+
+    if not report["success"]:
+        sys.exit(1)
+
+
+def iter_job_workdirs():
+    """Iterate workdirs of all existing jobs.
+
+    Yields:
+        Path to each job workdir
+    """
+    config = get_config()
+    pattern = config.paths.job_root_template.format(job_id="*")
+    for workdir in sorted(Path().glob(pattern)):
+        if workdir.is_dir():
+            yield workdir
+
+
+def cmd_dedup(args):
+    """Deduplicate artifacts across jobs via content-addressed hardlinks.
+
+    Args:
+        args: Command arguments
+    """
+    setup_logging()
+
+    config = get_config()
+    try:
+        index = JobIndex()
+    except sqlite3.Error as e:
+        logger.warning(f"Job index unavailable, sizes not refreshed: {e}")
+        index = None
+    totals = {"jobs": 0, "deduplicated": 0, "pooled": 0, "already_linked": 0, "skipped": 0, "bytes_saved": 0}
+
+    for workdir in iter_job_workdirs():
+        manifest_path = workdir / config.artifacts.manifest_file
+        if not manifest_path.exists():
+            continue
+
+        report = ArtifactManifest(manifest_path).dedup()
+        if index is not None and (report["deduplicated"] or report["pooled"]):
+            # Hardlinks changed: refresh the usage GC reads from the index
+            try:
+                index.update_size(workdir.name)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not update job index: {e}")
+        totals["jobs"] += 1
+        for key, value in report.items():
+            totals[key] += value
+
+    logger.info("=" * 60)
+    logger.info("Dedup Summary")
+    logger.info("=" * 60)
+    logger.info(f"Jobs scanned: {totals['jobs']}")
+    logger.info(f"Deduplicated: {totals['deduplicated']}")
+    logger.info(f"Added to pool: {totals['pooled']}")
+    logger.info(f"Already linked: {totals['already_linked']}")
+    logger.info(f"Skipped: {totals['skipped']}")
+    logger.info(f"Bytes saved: {totals['bytes_saved']}")
+
+
+def cmd_pack(args):
+    """Pack a finished job workdir into a single archive file.
+
+    Args:
+        args: Command arguments
+    """
+    setup_logging()
+
+    workdir = get_job_workdir(args.job)
+    if not (workdir / "execution_summary.json").exists():
+        logger.error(f"Job not finished (no execution_summary.json): {workdir}")
+        sys.exit(1)
+
+    archive_path = get_job_archive_path(args.job)
+    index = pack_directory(workdir, archive_path)
+
+    # Check the archive before removing the workdir
+    report = ArtifactManifest.from_archive(archive_path).verify_all(full=True)
+    if not report["success"]:
+        for mismatch in report["mismatches"]:
+            logger.error(f"  {mismatch['key']}: {mismatch['status']}")
+        archive_path.unlink()
+        logger.error("Packed artifacts do not match manifest, workdir kept")
+        sys.exit(1)
+
+    if not args.keep:
+        shutil.rmtree(workdir)
+
+        # The archive is already the job's data: an index error must not fail the pack
+        try:
+            job_index = JobIndex()
+            job_index.set_workdir(args.job, archive_path)
+            job_index.update_size(args.job)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not update job index: {e}")
+
+    logger.info(f"Packed {len(index['members'])} files into {archive_path} "
+                f"({archive_path.stat().st_size} bytes)")
+
+
+def cmd_gc(args):
+    """Evict least-recently-used job data to fit a size budget.
+
+    Args:
+        args: Command arguments
+    """
+    setup_logging()
+
+    index = JobIndex()
+    if args.reindex:
+        count = index.rebuild(list(iter_job_workdirs()))
+        logger.info(f"Indexed {count} job workdirs")
+
+    report = collect_garbage(
+        max_size=parse_size(args.max_size),
+        keep_last=args.keep_last,
+        dry_run=args.dry_run,
+        index=index,
+    )
+
+    logger.info("=" * 60)
+    logger.info("GC Summary" + (" (dry run)" if report["dry_run"] else ""))
+    logger.info("=" * 60)
+    logger.info(f"Jobs: {report['jobs_total']} ({report['jobs_protected']} protected)")
+    logger.info(f"Size: {report['size_before']} -> {report['size_after']} bytes (budget {report['max_size']})")
+    logger.info(f"Trimmed jobs: {len(report['jobs_trimmed'])}")
+    logger.info(f"Evicted jobs: {len(report['jobs_evicted'])}")
+    logger.info(f"Pool orphans reclaimed: {report['pool_reclaimed']} bytes")
+    logger.info(f"Reclaimed: {report['reclaimed_bytes']} bytes")
+
+
+def cmd_pin(args):
+    """Pin (or unpin) a job so GC never evicts it.
+
+    Args:
+        args: Command arguments
+    """
+    setup_logging()
+
+    if not JobIndex().set_pinned(args.job, not args.unpin):
+        logger.error(f"Job not in index: {args.job}")
+        sys.exit(1)
+
+    logger.info(f"{'Unpinned' if args.unpin else 'Pinned'} job: {args.job}")
+
+
+def format_job_row(job: dict) -> str:
+    """Format indexed job as a one-line summary.
+
+    Args:
+        job: Job row from the index
+
+    Returns:
+        Summary line
+    """
+    duration = f"{job['duration_sec']:.1f}s" if job.get("duration_sec") is not None else "-"
+    return (f"{job['job_id']}  {job.get('task_name') or '-'}  {job.get('status') or '-'}  "
+            f"{duration}  {job['size_bytes']}B{'  [pinned]' if job['pinned'] else ''}")
+
+
+def cmd_jobs(args):
+    """Query the job index (list/show/find).
+
+    Args:
+        args: Command arguments
+    """
+    setup_logging()
+
+    index = JobIndex()
+
+    if args.jobs_command == "show":
+        job = index.get(args.job)
+        if job is None:
+            logger.error(f"Job not in index: {args.job}")
+            sys.exit(1)
+        for key, value in job.items():
+            logger.info(f"{key}: {value}")
+        return
+
+    if args.jobs_command == "find":
+        input_hash = args.input_hash
+        if args.input:
+            # Same inputs dict as cmd_run builds
+            input_hash = compute_input_hash({"input_file": args.input})
+        jobs = index.find(task_name=args.task, input_hash=input_hash, status=args.status, limit=args.limit)
+    else:
+        jobs = index.find(status=args.status, limit=args.limit)
+
+    for job in jobs:
+        logger.info(format_job_row(job))
+    logger.info(f"{len(jobs)} job(s)")
+
+
 def cmd_distill(args):
     """Distill success patterns.
 
@@ -168,6 +402,56 @@ def main():
     replay_parser.add_argument("--job", required=True, help="Job ID")
     replay_parser.set_defaults(func=cmd_replay)
 
+    # Verify command
+    verify_parser = subparsers.add_parser("verify", help="Verify job artifacts")
+    verify_parser.add_argument("--job", required=True, help="Job ID")
+    verify_parser.add_argument("--workers", type=int, default=None, help="Number of worker threads")
+    verify_parser.add_argument("--full", action="store_true", help="Re-hash all files (ignore stat cache)")
+    verify_parser.set_defaults(func=cmd_verify)
+
+    # Dedup command
+    dedup_parser = subparsers.add_parser("dedup", help="Deduplicate artifacts across jobs")
+    dedup_parser.set_defaults(func=cmd_dedup)
+
+    # Pack command
+    pack_parser = subparsers.add_parser("pack", help="Pack finished job into a single archive")
+    pack_parser.add_argument("--job", required=True, help="Job ID")
+    pack_parser.add_argument("--keep", action="store_true", help="Keep the workdir after packing")
+    pack_parser.set_defaults(func=cmd_pack)
+
+    # GC command
+    gc_parser = subparsers.add_parser("gc", help="Garbage-collect job workdirs")
+    gc_parser.add_argument("--max-size", required=True, help="Size budget (e.g. 200G)")
+    gc_parser.add_argument("--keep-last", type=int, default=0, help="Keep N most recently used jobs")
+    gc_parser.add_argument("--dry-run", action="store_true", help="Report only, delete nothing")
+    gc_parser.add_argument("--reindex", action="store_true", help="Index existing workdirs first")
+    gc_parser.set_defaults(func=cmd_gc)
+
+    # Pin command
+    pin_parser = subparsers.add_parser("pin", help="Protect job from GC")
+    pin_parser.add_argument("--job", required=True, help="Job ID")
+    pin_parser.add_argument("--unpin", action="store_true", help="Remove protection")
+    pin_parser.set_defaults(func=cmd_pin)
+
+    # Jobs command (index queries)
+    jobs_parser = subparsers.add_parser("jobs", help="Query job index")
+    jobs_subparsers = jobs_parser.add_subparsers(dest="jobs_command", required=True)
+
+    jobs_list_parser = jobs_subparsers.add_parser("list", help="List recent jobs")
+    jobs_list_parser.add_argument("--status", help="Filter by status")
+    jobs_list_parser.add_argument("--limit", type=int, default=20, help="Maximum number of jobs")
+
+    jobs_show_parser = jobs_subparsers.add_parser("show", help="Show indexed job")
+    jobs_show_parser.add_argument("--job", required=True, help="Job ID")
+
+    jobs_find_parser = jobs_subparsers.add_parser("find", help="Find jobs by task/input/status")
+    jobs_find_parser.add_argument("--task", help="Task name")
+    jobs_find_parser.add_argument("--input", help="Input file path (as passed to run)")
+    jobs_find_parser.add_argument("--input-hash", help="Input hash (prefix)")
+    jobs_find_parser.add_argument("--status", help="Filter by status")
+    jobs_find_parser.add_argument("--limit", type=int, default=None, help="Maximum number of jobs")
+    jobs_parser.set_defaults(func=cmd_jobs)
+
     # Distill command
     distill_parser = subparsers.add_parser("distill", help="Distill success patterns")
     distill_parser.add_argument("--job", required=True, help="Job ID")
@@ -82,3 +82,146 @@ def test_manifest_includes_hashes():
     artifact = manifest.get_artifact("test.json")
     assert "sha256" in artifact
     assert len(artifact["sha256"]) == 64  # SHA256 hex length
+
+
+def test_manifest_merkle_root_and_diff():
+    """Test that Merkle root is stored and diff finds changed artifacts."""
+    manifests = []
+    for job_id, summary in (("test_merkle_a", "same"), ("test_merkle_b", "changed")):
+        job = Job(task_name="test_merkle", inputs={}, job_id=job_id)
+        job.setup_workdir()
+        manifest = ArtifactManifest(job.workdir / "artifacts/manifest.json")
+
+        for key, step_id, data in (
+            ("input.json", "load", {"text": "same"}),
+            ("summary.json", "summarize", {"summary": summary}),
+        ):
+            artifact_path = job.get_artifact_path(key)
+            save_json(data, artifact_path)
+            manifest.add_artifact(key=key, path=artifact_path, producer_step=step_id, inputs_used=[])
+
+        manifests.append(manifest)
+
+    a, b = manifests
+    assert len(a.get_merkle_root()) == 64
+    assert a.merkle["steps"]["load"] == b.merkle["steps"]["load"]
+    assert a.diff(b) == ["summary.json"]
+    assert a.diff(a) == []
+
+    # Root survives reload
+    reloaded = ArtifactManifest(a.manifest_path)
+    assert reloaded.get_merkle_root() == a.get_merkle_root()
+    assert "_merkle" not in reloaded.get_all_artifacts()
+
+
+def test_verify_all_reports_mismatches():
+    """Test parallel verification detects modified and missing artifacts."""
+    job = Job(task_name="test_verify", inputs={}, job_id="test_verify")
+    job.setup_workdir()
+    manifest = ArtifactManifest(job.workdir / "artifacts/manifest.json")
+
+    for key in ("a.json", "b.json", "c.json"):
+        artifact_path = job.get_artifact_path(key)
+        save_json({"key": key}, artifact_path)
+        manifest.add_artifact(key=key, path=artifact_path, producer_step="s", inputs_used=[], validated=True)
+
+    assert manifest.verify_all(workers=2)["success"] == True
+
+    save_json({"key": "tampered"}, job.get_artifact_path("b.json"))
+    job.get_artifact_path("c.json").unlink()
+
+    report = manifest.verify_all(workers=2, full=True)
+    statuses = {m["key"]: m["status"] for m in report["mismatches"]}
+    assert report["artifacts_ok"] == 1
+    assert statuses["b.json"] in ("size_mismatch", "hash_mismatch")
+    assert statuses["c.json"] == "missing"
+    assert manifest.should_reuse("b.json") == False
+
+
+def test_artifact_compression_is_transparent():
+    """Test compressed artifacts load transparently and record raw digests."""
+    from agent_os.utils import load_json, compute_sha256, detect_compression
+
+    job = Job(task_name="test_compress", inputs={}, job_id="test_compress")
+    job.setup_workdir()
+    manifest = ArtifactManifest(job.workdir / "artifacts/manifest.json")
+
+    data = {"segments": [{"text": "繰り返し" * 10, "index": i} for i in range(200)]}
+    artifact_path = job.get_artifact_path("transcript.json")
+    save_json(data, artifact_path)
+    raw_sha256 = compute_sha256(artifact_path)
+    raw_size = artifact_path.stat().st_size
+
+    manifest.add_artifact(
+        key="transcript.json",
+        path=artifact_path,
+        producer_step="transcribe",
+        inputs_used=[],
+        validated=True,
+        compression="gzip"
+    )
+
+    artifact = manifest.get_artifact("transcript.json")
+    stored_path = Path(artifact["path"])
+    assert stored_path.name == "transcript.json.gz"
+    assert not artifact_path.exists()
+    assert detect_compression(stored_path) == "gzip"
+    assert artifact["compression"] == "gzip"
+    assert artifact["raw_sha256"] == raw_sha256
+    assert artifact["raw_size"] == raw_size
+    assert artifact["size"] < raw_size
+    assert artifact["sha256"] == compute_sha256(stored_path)
+
+    assert load_json(stored_path) == data
+    assert manifest.should_reuse("transcript.json") == True
+
+
+def test_dedup_hardlinks_identical_artifacts():
+    """Test identical artifacts across jobs share one pooled inode."""
+    import os
+
+    manifests = []
+    for job_id in ("test_dedup_a", "test_dedup_b"):
+        job = Job(task_name="test_dedup", inputs={}, job_id=job_id)
+        job.setup_workdir()
+        manifest = ArtifactManifest(job.workdir / "artifacts/manifest.json")
+
+        artifact_path = job.get_artifact_path("stub.json")
+        save_json({"status": "stub"}, artifact_path)
+        manifest.add_artifact(key="stub.json", path=artifact_path, producer_step="s", inputs_used=[], validated=True)
+        manifests.append(manifest)
+
+    reports = [m.dedup() for m in manifests]
+    assert reports[1]["deduplicated"] + reports[1]["already_linked"] == 1
+
+    path_a, path_b = (Path(m.get_artifact("stub.json")["path"]) for m in manifests)
+    assert os.path.samefile(path_a, path_b)
+    assert manifests[0].should_reuse("stub.json") == True
+
+    # Rewriting one job's artifact must not touch the other
+    save_json({"status": "changed"}, path_a)
+    assert not os.path.samefile(path_a, path_b)
+    assert manifests[1].verify_all(full=True)["success"] == True
+
+
+def test_dedup_pools_only_validated_artifacts(monkeypatch):
+    """Test artifacts join the pool once validated and stay writable."""
+    import os
+    from agent_os.config import get_config
+
+    monkeypatch.setattr(get_config().artifacts, "dedup", True)
+    job = Job(task_name="test_dedup", inputs={}, job_id="test_dedup_validated")
+    job.setup_workdir()
+    (job.workdir / "artifacts/manifest.json").unlink(missing_ok=True)
+    manifest = ArtifactManifest(job.workdir / "artifacts/manifest.json")
+
+    artifact_path = job.get_artifact_path("draft.json")
+    save_json({"status": "draft", "job": "test_dedup_validated"}, artifact_path)
+    manifest.add_artifact(key="draft.json", path=artifact_path, producer_step="s", inputs_used=[])
+    assert artifact_path.stat().st_nlink == 1
+    assert manifest.dedup()["skipped"] == 1
+
+    manifest.mark_validated("draft.json")
+    assert artifact_path.stat().st_nlink == 2
+    assert os.access(artifact_path, os.W_OK) and artifact_path.stat().st_mode & 0o200
+    assert manifest.check_artifact("draft.json")["status"] == "ok"
@@ -0,0 +1,116 @@
+"""Test command executors."""
+
+import sys
+import time
+from agent_os.executors import execute_shell, execute_many, ResourceLimits
+from agent_os.executors.shell import _StreamPump, _TailBuffer
+
+
+def test_execute_shell_streaming_bounded(tmp_path):
+    """Test streaming mode keeps a bounded tail and tees lines to the log."""
+    log_file = tmp_path / "cmd.log"
+    command = f'"{sys.executable}" -c "import sys; [print(i) for i in range(20000)]; sys.stderr.write(\'a\\rb\\n\')"'
+    lines = []
+
+    result = execute_shell(
+        command,
+        log_file=log_file,
+        max_output_bytes=1024,
+        on_line=lambda stream, line: lines.append((stream, line)),
+    )
+
+    assert result["success"]
+    assert result["output_truncated"]
+    assert len(result["stdout"]) <= 1024
+    assert result["stdout"].endswith("19999\n")
+    assert result["stdout_bytes"] > 100000
+
+    assert ("stdout", "0") in lines and ("stdout", "19999") in lines
+    assert ("stderr", "a") in lines and ("stderr", "b") in lines
+    log_text = log_file.read_text()
+    assert "[stdout] 0\n" in log_text
+    assert "Return code: 0" in log_text
+
+
+def test_execute_shell_streaming_timeout(tmp_path):
+    """Test streaming mode kills the command on timeout."""
+    result = execute_shell("echo started; sleep 30", timeout=1, stream=True)
+
+    assert not result["success"]
+    assert result["returncode"] == -1
+    assert result["stdout"] == "started\n"
+    assert "Timeout after 1s" in result["stderr"]
+
+
+def test_execute_many_concurrent(tmp_path):
+    """Test concurrency limit, per-command timeout and result order."""
+    commands = ["sleep 0.5; echo a", "sleep 0.5; echo b", ["sh", "-c", "exit 3"], "sleep 30"]
+
+    result = execute_many(commands, max_concurrency=4, log_dir=tmp_path / "logs", timeout=2)
+
+    assert result["total"] == 4
+    assert result["succeeded"] == 2 and result["failed"] == 2
+    assert [r["stdout"] for r in result["results"][:2]] == ["a\n", "b\n"]
+    assert result["results"][2]["returncode"] == 3
+    assert "Timeout" in result["results"][3]["stderr"]
+    assert result["elapsed_sec"] < 10
+    assert (tmp_path / "logs" / "cmd_0000.log").exists()
+
+
+def test_execute_many_fail_fast_cancels():
+    """Test fail_fast cancels outstanding commands."""
+    result = execute_many(["exit 1", "sleep 30", "sleep 30"], max_concurrency=2, fail_fast=True)
+
+    assert not result["success"]
+    assert result["failed"] == 1
+    assert result["cancelled"] == 2
+    assert result["elapsed_sec"] < 10
+
+
+def test_execute_shell_reports_resources():
+    """Test child CPU time and peak RSS are recorded."""
+    command = f'"{sys.executable}" -c "x = bytearray(50 * 1024 * 1024); sum(range(3000000)); print(len(x))"'
+
+    for stream in (False, True):
+        result = execute_shell(command, stream=stream)
+        assert result["success"]
+        resources = result["resources"]
+        assert resources["user_cpu_sec"] + resources["system_cpu_sec"] > 0
+        assert resources["max_rss_bytes"] >= 50 * 1024 * 1024
+        assert resources["wall_sec"] > 0
+
+
+def test_execute_shell_applies_limits():
+    """Test rlimits are applied to the command only."""
+    result = execute_shell("ulimit -n", limits=ResourceLimits(open_files=64))
+    assert result["stdout"].strip() == "64"
+
+    command = f'"{sys.executable}" -c "while True: pass"'
+    result = execute_shell(command, timeout=30, limits=ResourceLimits(cpu_seconds=1))
+    assert not result["success"]
+    assert result["returncode"] != -1
+    assert result["resources"]["wall_sec"] < 10
+
+
+def test_execute_shell_timeout_with_background_child():
+    """Test a background child holding the pipes cannot outlive the timeout."""
+    for stream in (False, True):
+        start = time.monotonic()
+        result = execute_shell("sleep 5 & echo hi", timeout=1, stream=stream)
+
+        assert time.monotonic() - start < 4
+        assert not result["success"]
+        assert result["returncode"] == -1
+        assert "Timeout after 1s" in result["stderr"]
+
+
+def test_stream_pump_splits_lines_across_chunks():
+    """Test \\n, \\r and \\r\\n line ends, including pairs split across reads."""
+    lines = []
+    pump = _StreamPump("stdout", None, _TailBuffer(1024), None,
+                       on_line=lambda stream, line: lines.append(line))
+
+    for chunk in (b"frame=1\rframe=2\r", b"\ndone\r\nlast ", b"line\n"):
+        pump._split_lines(chunk)
+
+    assert lines == ["frame=1", "frame=2", "done", "last line"]
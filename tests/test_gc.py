@@ -0,0 +1,139 @@
+"""Test size-budgeted garbage collection."""
+
+import pytest
+from pathlib import Path
+from agent_os import Job
+from agent_os.artifacts import ArtifactManifest
+from agent_os.config import get_config
+from agent_os.gc import collect_garbage, parse_size
+from agent_os.jobindex import JobIndex
+
+
+def _make_job(index, job_id, validated):
+    job = Job(task_name="test_gc", inputs={}, job_id=job_id)
+    job.workdir = Path(f"work/test_gc/{job_id}")
+    job.artifacts_dir = job.workdir / "artifacts"
+    job.cache_dir = job.workdir / "cache"
+    for d in (job.artifacts_dir, job.cache_dir):
+        d.mkdir(parents=True, exist_ok=True)
+    index.register(job_id, job.workdir)
+
+    (job.cache_dir / "scratch.bin").write_bytes(b"c" * 1000)
+    manifest = ArtifactManifest(job.workdir / "artifacts/manifest.json")
+    artifact_path = job.artifacts_dir / "out.bin"
+    artifact_path.write_bytes(b"a" * 1000)
+    manifest.add_artifact(key="out.bin", path=artifact_path, producer_step="s", inputs_used=[], validated=validated)
+    index.update_size(job_id)
+    return job
+
+
+def test_gc_trims_then_evicts_lru_jobs(tmp_path):
+    """Test eviction order, keep-last and pinning."""
+    index = JobIndex(tmp_path / "jobs.sqlite")
+    old_pinned = _make_job(index, "gc_old_pinned", validated=True)
+    old = _make_job(index, "gc_old", validated=False)
+    mid = _make_job(index, "gc_mid", validated=True)
+    new = _make_job(index, "gc_new", validated=True)
+    index.set_pinned("gc_old_pinned")
+
+    total = index.total_size()
+    report = collect_garbage(max_size=total - 1500, keep_last=1, index=index)
+
+    # Oldest unpinned job trimmed first (cache + unvalidated artifact)
+    assert report["jobs_trimmed"][0] == "gc_old"
+    assert not (old.cache_dir / "scratch.bin").exists()
+    assert not (old.artifacts_dir / "out.bin").exists()
+    assert report["jobs_evicted"] == []
+
+    report = collect_garbage(max_size=0, keep_last=1, index=index)
+    assert set(report["jobs_evicted"]) == {"gc_old", "gc_mid"}
+    assert not mid.workdir.exists()
+    assert old_pinned.workdir.exists() and new.workdir.exists()
+    assert {job["job_id"] for job in index.list_jobs()} == {"gc_old_pinned", "gc_new"}
+
+
+def test_parse_size():
+    """Test human-readable size parsing."""
+    assert parse_size("200G") == 200 * 1024 ** 3
+    assert parse_size("512MB") == 512 * 1024 ** 2
+    assert parse_size("1024") == 1024
+    with pytest.raises(ValueError):
+        parse_size("lots")
+
+
+def test_gc_counts_shared_files_once_and_skips_running_jobs(tmp_path):
+    """Test deduped files are counted once and running jobs are protected."""
+    import os
+
+    index = JobIndex(tmp_path / "jobs.sqlite")
+    shared = tmp_path / "shared.bin"
+    shared.write_bytes(b"s" * 10000)
+    for job_id in ("gc_link_a", "gc_link_b", "gc_running"):
+        workdir = tmp_path / job_id
+        workdir.mkdir()
+        os.link(shared, workdir / "shared.bin")
+        (workdir / "own.bin").write_bytes(b"o" * 100)
+        index.register(job_id, workdir)
+        index.update_size(job_id)
+    shared.unlink()
+    index.set_status("gc_running", "running")
+
+    report = collect_garbage(max_size=10000, dry_run=True, index=index)
+    assert report["size_before"] == 10000 + 3 * 100
+    # Evicting one linked job frees only its own file
+    assert report["jobs_evicted"] == ["gc_link_a", "gc_link_b"]
+    assert report["size_after"] == 10000 + 100
+
+    report = collect_garbage(max_size=0, index=index)
+    assert report["jobs_evicted"] == ["gc_link_a", "gc_link_b"]
+    assert (tmp_path / "gc_running" / "shared.bin").exists()
+    assert [job["job_id"] for job in index.list_jobs()] == ["gc_running"]
+
+
+def test_gc_reads_usage_from_index_and_rescans_used_jobs(tmp_path):
+    """Test GC uses recorded usage and rescans only jobs used since it was measured."""
+    index = JobIndex(tmp_path / "jobs.sqlite")
+    workdir = tmp_path / "gc_recorded"
+    workdir.mkdir()
+    (workdir / "a.bin").write_bytes(b"a" * 1000)
+    index.register("gc_recorded", workdir)
+    index.update_size("gc_recorded")
+
+    # Written after the measurement: not seen until the job is used again
+    (workdir / "b.bin").write_bytes(b"b" * 500)
+    assert collect_garbage(max_size=10 ** 9, dry_run=True, index=index)["size_before"] == 1000
+
+    index.touch("gc_recorded")
+    assert collect_garbage(max_size=10 ** 9, dry_run=True, index=index)["size_before"] == 1500
+    assert index.get("gc_recorded")["size_bytes"] == 1500
+
+
+def test_crashed_runs_are_not_protected_from_gc(tmp_path, monkeypatch):
+    """Test unexpected errors record "failed" and stale "running" jobs are evicted."""
+    from agent_os import Runner
+    from agent_os.steps_builtin import StubStep
+
+    class CrashingStep(StubStep):
+        def should_skip(self, ctx):
+            raise RuntimeError("crash")
+
+    index_path = tmp_path / "jobs.sqlite"
+    monkeypatch.setattr(get_config().paths, "job_index", str(index_path))
+    job = Job(task_name="test_gc_crash", inputs={}, job_id="test_gc_crash")
+    job.setup_workdir()
+    with pytest.raises(RuntimeError):
+        Runner(job, [CrashingStep("crash", "Crash", {"inputs": [], "outputs": ["out.json"]})]).run_all()
+
+    index = JobIndex(index_path)
+    assert index.get("test_gc_crash")["status"] == "failed"
+
+    workdir = tmp_path / "gc_stale_running"
+    workdir.mkdir()
+    (workdir / "a.bin").write_bytes(b"a" * 100)
+    index.register("gc_stale_running", workdir)
+    index.set_status("gc_stale_running", "running")
+    index.remove("test_gc_crash")
+
+    assert collect_garbage(max_size=0, dry_run=True, index=index)["jobs_evicted"] == []
+    report = collect_garbage(max_size=0, dry_run=True, index=index, running_stale_sec=-1)
+    assert report["jobs_evicted"] == ["gc_stale_running"]
@@ -0,0 +1,72 @@
+"""Test packed job archives."""
+
+import pytest
+from agent_os import Job
+from agent_os.artifacts import ArtifactManifest
+from agent_os.step import StepContext
+from agent_os.utils import JobArchive, pack_directory
+
+
+def _make_packed_job(job_id, tmp_path):
+    job = Job(task_name="test_pack", inputs={}, job_id=job_id)
+    job.setup_workdir()
+    manifest = ArtifactManifest(job.workdir / "artifacts/manifest.json")
+
+    raw_path = job.get_artifact_path("frames.bin")
+    raw_path.write_bytes(bytes(range(256)) * 64)
+    manifest.add_artifact(key="frames.bin", path=raw_path, producer_step="s1", inputs_used=[])
+
+    text_path = job.get_artifact_path("log.txt")
+    text_path.write_text("line\n" * 500)
+    manifest.add_artifact(key="log.txt", path=text_path, producer_step="s2", inputs_used=[],
+                          validated=True, compression="gzip")
+
+    archive_path = tmp_path / f"{job_id}.pack"
+    pack_directory(job.workdir, archive_path)
+    return job, manifest, archive_path
+
+
+def test_pack_and_read_without_extraction(tmp_path):
+    """Test manifest, verification and artifact reads from an archive."""
+    job, original, archive_path = _make_packed_job("test_pack_read", tmp_path)
+
+    archive = JobArchive(archive_path)
+    assert "artifacts/manifest.json" in archive
+    assert "artifacts/frames.bin" in archive.names()
+    assert "artifacts/log.txt.gz" in archive.names()
+
+    packed = ArtifactManifest.from_archive(archive_path)
+    assert packed.get_merkle_root() == original.get_merkle_root()
+    assert packed.verify_all(full=True)["success"]
+    assert packed.should_reuse("frames.bin") is False  # not validated
+
+    with packed.open_artifact("log.txt", mode="r") as f:
+        assert f.read() == "line\n" * 500
+
+    ctx = StepContext(job, packed, memory_bank=None)
+    with ctx.open_artifact_mmap("frames.bin") as view:
+        assert len(view) == 256 * 64
+        assert view[256:260].tobytes() == bytes(range(4))
+    assert ctx.read_artifact_bytes("log.txt").tobytes() == b"line\n" * 500
+
+    with pytest.raises(RuntimeError):
+        packed.save()
+
+
+def test_packed_artifact_corruption_detected(tmp_path):
+    """Test full verification re-hashes archive members."""
+    _, _, archive_path = _make_packed_job("test_pack_corrupt", tmp_path)
+
+    info = JobArchive(archive_path).get_info("artifacts/frames.bin")
+    with open(archive_path, "r+b") as f:
+        f.seek(info["offset"])
+        f.write(b"\xff\xff")
+
+    packed = ArtifactManifest.from_archive(archive_path)
+    assert packed.check_artifact("frames.bin")["status"] == "ok"  # index trusted
+    assert packed.check_artifact("frames.bin", full=True)["status"] == "hash_mismatch"
+
+    not_an_archive = tmp_path / "not_an_archive.pack"
+    not_an_archive.write_bytes(b"x" * 32)
+    with pytest.raises(ValueError):
+        JobArchive(not_an_archive)
@@ -0,0 +1,100 @@
+"""Test the SQLite job index and its advisory use by the runner and CLI."""
+
+import argparse
+import sqlite3
+
+import agent_os_cli
+import pytest
+from agent_os import Job, Runner
+from agent_os.jobindex import JobIndex
+from agent_os.steps_builtin import StubStep
+from agent_os.utils import save_json
+
+
+def test_job_index_status_and_find(tmp_path):
+    """Test status/timing tracking and lookups by task, input hash and status."""
+    index = JobIndex(tmp_path / "jobs.sqlite")
+    index.register("idx_a", "work/jobs/idx_a", task_name="task_a", input_hash="abcd1234")
+    index.register("idx_b", "work/jobs/idx_b", task_name="task_b", input_hash="ffff0000")
+    assert index.get("idx_a")["status"] == "created"
+
+    index.set_status("idx_a", "running")
+    index.set_status("idx_a", "success")
+    index.set_status("idx_b", "running")
+    index.set_status("idx_b", "failed")
+
+    job = index.get("idx_a")
+    assert job["finished_at"] >= job["started_at"]
+    assert job["duration_sec"] >= 0
+
+    # Re-registering keeps task/input metadata
+    index.register("idx_a", "work/jobs/idx_a")
+    assert index.get("idx_a")["task_name"] == "task_a"
+
+    assert [j["job_id"] for j in index.find(input_hash="abcd")] == ["idx_a"]
+    assert [j["job_id"] for j in index.find(status="failed")] == ["idx_b"]
+    assert [j["job_id"] for j in index.find(task_name="task_b", status="success")] == []
+    assert len(index.find(limit=1)) == 1
+
+    with pytest.raises(ValueError):
+        index.set_status("idx_a", "unknown")
+
+
+def test_rebuild_recovers_task_and_input_hash(tmp_path):
+    """Test reindexing reads metadata from the summary or the generated job ID."""
+    index = JobIndex(tmp_path / "jobs.sqlite")
+    with_summary = tmp_path / "manual_job"
+    generated = tmp_path / "20250101_120000_1a2b3c4d"
+    for workdir in (with_summary, generated):
+        workdir.mkdir()
+    save_json({"success": True, "task_name": "task_x", "input_hash": "deadbeef"},
+              with_summary / "execution_summary.json")
+
+    assert index.rebuild([with_summary, generated]) == 2
+    job = index.get("manual_job")
+    assert (job["task_name"], job["input_hash"], job["status"]) == ("task_x", "deadbeef", "success")
+    assert index.get(generated.name)["input_hash"] == "1a2b3c4d"
+
+    # Rebuilding again keeps what the index already knows
+    index.register(generated.name, generated, task_name="task_y")
+    index.rebuild([generated])
+    assert index.get(generated.name)["task_name"] == "task_y"
+
+
+def test_runner_survives_job_index_errors(monkeypatch):
+    """Test a failing job index only logs a warning."""
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(JobIndex, "register", locked)
+    monkeypatch.setattr(JobIndex, "set_status", locked)
+
+    job = Job(task_name="test_index_errors", inputs={}, job_id="test_index_errors")
+    job.setup_workdir()
+    (job.workdir / "artifacts/manifest.json").unlink(missing_ok=True)
+    step = StubStep("stub", "Stub", {"inputs": [], "outputs": ["stub.json"]})
+
+    result = Runner(job, [step]).run_all()
+    assert result["success"] == True
+    assert result["task_name"] == "test_index_errors"
+
+
+def test_pack_survives_job_index_errors(monkeypatch):
+    """Test packing still succeeds when the index cannot record the archive."""
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    job = Job(task_name="test_pack_index_errors", inputs={}, job_id="test_pack_index_errors")
+    job.setup_workdir()
+    (job.workdir / "artifacts/manifest.json").unlink(missing_ok=True)
+    step = StubStep("stub", "Stub", {"inputs": [], "outputs": ["stub.json"]})
+    assert Runner(job, [step]).run_all()["success"] == True
+
+    archive_path = agent_os_cli.get_job_archive_path(job.job_id)
+    archive_path.unlink(missing_ok=True)
+    monkeypatch.setattr(JobIndex, "set_workdir", locked)
+
+    agent_os_cli.cmd_pack(argparse.Namespace(job=job.job_id, keep=False))
+    assert archive_path.exists()
+    assert not job.workdir.exists()
+    archive_path.unlink()
@@ -0,0 +1,163 @@
+"""Test JSON I/O backends and formats."""
+
+import pytest
+from pathlib import Path
+from agent_os.utils import load_json, save_json, set_json_backend, get_json_backend
+from agent_os.utils.jsonio import JSON_BACKENDS
+
+
+@pytest.fixture
+def restore_backend():
+    """Restore the JSON backend after the test."""
+    previous = get_json_backend()
+    yield
+    set_json_backend(previous)
+
+
+@pytest.mark.parametrize("backend", JSON_BACKENDS)
+def test_json_roundtrip_all_backends(backend, restore_backend):
+    """Test that every backend round-trips data (falling back if not installed)."""
+    set_json_backend(backend)
+
+    data = {"text": "日本語", "items": [1, 2.5, None, True], "nested": {"a": {}}}
+    for compact in (False, True):
+        data_path = Path(f"work/test_jsonio_{backend}_{compact}.json")
+        save_json(data, data_path, compact=compact)
+        assert load_json(data_path) == data
+        data_path.unlink(missing_ok=True)
+
+
+def test_compact_json_has_no_whitespace(restore_backend):
+    """Test that compact mode produces minimal JSON."""
+    set_json_backend("stdlib")
+
+    data_path = Path("work/test_jsonio_compact.json")
+    save_json({"a": [1, 2]}, data_path, compact=True)
+    assert data_path.read_text(encoding='utf-8') == '{"a":[1,2]}'
+    data_path.unlink(missing_ok=True)
+
+
+def test_unknown_backend_rejected():
+    """Test that an unknown backend name raises."""
+    with pytest.raises(ValueError):
+        set_json_backend("simplejson")
+
+
+def test_jsonl_writer_roundtrip():
+    """Test buffered JSONL writer and streaming reader."""
+    from agent_os.utils import JsonlWriter, iter_jsonl
+
+    data_path = Path("work/test_jsonio_records.jsonl")
+    records = [{"index": i, "text": f"行 {i}"} for i in range(100)]
+
+    with JsonlWriter(data_path, buffer_size=64) as writer:
+        writer.write_many(records)
+
+    assert writer.count == 100
+    assert list(iter_jsonl(data_path)) == records
+    assert len(data_path.read_bytes().splitlines()) == 100
+    data_path.unlink(missing_ok=True)
+
+
+def test_iter_json_items_reads_subtrees(monkeypatch):
+    """Test incremental parsing of sub-trees across small read chunks."""
+    from agent_os.utils import iter_json_items, read_json_value, read_json_string_head
+    from agent_os.utils import jsonstream
+
+    monkeypatch.setattr(jsonstream, "CHUNK_SIZE", 5)
+
+    data = {
+        "content": "テキスト \"quoted\" \\ 😀" * 10,
+        "segments": [{"text": "a]}", "n": i} for i in range(5)],
+        "length": 42,
+    }
+    data_path = Path("work/test_jsonstream.json")
+    save_json(data, data_path)
+
+    assert list(iter_json_items(data_path, "segments.item")) == data["segments"]
+    assert list(iter_json_items(data_path, "segments.item.n")) == [0, 1, 2, 3, 4]
+    assert read_json_value(data_path, "length") == 42
+    assert read_json_value(data_path, "missing", default="x") == "x"
+    assert read_json_string_head(data_path, "content", 12) == data["content"][:12]
+    data_path.unlink(missing_ok=True)
+
+
+def test_json_scanner_grows_reads_for_large_values(monkeypatch):
+    """Test a value spanning many chunks is buffered in O(log n) refills."""
+    import io
+    import json
+    from agent_os.utils import jsonstream
+
+    monkeypatch.setattr(jsonstream, "CHUNK_SIZE", 16)
+    data = {"content": "x" * 100_000, "segments": [{"n": i} for i in range(5_000)]}
+
+    class CountingReader(io.StringIO):
+        reads = 0
+
+        def read(self, size=-1):
+            CountingReader.reads += 1
+            return super().read(size)
+
+    scanner = jsonstream._JsonScanner(CountingReader(json.dumps(data)))
+    values = []
+    for _ in scanner.walk(["content"]):
+        values.append(scanner.read_value())
+    assert values == [data["content"]]
+    assert CountingReader.reads < 100
+
+    scanner = jsonstream._JsonScanner(io.StringIO(json.dumps(data)))
+    for _ in scanner.walk(["segments"]):
+        assert scanner.read_value() == data["segments"]
+
+
+def test_yaml_cache_invalidates_on_change(tmp_path):
+    """Test parsed YAML cache returns copies and reloads modified files."""
+    import os
+    from agent_os.utils import load_yaml, configure_yaml_cache
+
+    yaml_path = tmp_path / "spec.yaml"
+    yaml_path.write_text("steps:\n  - id: a\n", encoding='utf-8')
+
+    configure_yaml_cache(tmp_path / "cache")
+    try:
+        first = load_yaml(yaml_path)
+        first["steps"].append({"id": "mutated"})
+        assert load_yaml(yaml_path) == {"steps": [{"id": "a"}]}
+        assert list((tmp_path / "cache").glob("*.pickle"))
+
+        yaml_path.write_text("steps:\n  - id: b\n", encoding='utf-8')
+        stat = yaml_path.stat()
+        os.utime(yaml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_yaml(yaml_path) == {"steps": [{"id": "b"}]}
+    finally:
+        configure_yaml_cache(None)
+
+
+def test_yaml_disk_cache_ignores_broken_and_untrusted_pickles(tmp_path):
+    """Test stale pickles and pickles writable by others are never used."""
+    import pickle
+    from agent_os.utils import load_yaml, configure_yaml_cache, clear_yaml_cache
+
+    yaml_path = tmp_path / "spec.yaml"
+    yaml_path.write_text("steps:\n  - id: a\n", encoding='utf-8')
+    expected = {"steps": [{"id": "a"}]}
+
+    configure_yaml_cache(tmp_path / "cache")
+    try:
+        assert load_yaml(yaml_path) == expected
+        (cache_path,) = (tmp_path / "cache").glob("*.pickle")
+        assert cache_path.stat().st_mode & 0o077 == 0
+        stamp, _ = pickle.loads(cache_path.read_bytes())
+
+        # Refers to a class that no longer exists (AttributeError on load)
+        cache_path.write_bytes(b"cbuiltins\nNoSuchClass\n.")
+        clear_yaml_cache()
+        assert load_yaml(yaml_path) == expected
+
+        cache_path.write_bytes(pickle.dumps((stamp, {"forged": True})))
+        cache_path.chmod(0o666)
+        clear_yaml_cache()
+        assert load_yaml(yaml_path) == expected
+    finally:
+        configure_yaml_cache(None)
+        clear_yaml_cache()
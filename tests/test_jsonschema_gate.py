@@ -99,3 +99,181 @@ def test_jsonschema_type_mismatch():
     # Cleanup
     data_path.unlink(missing_ok=True)
     schema_path.unlink(missing_ok=True)
+
+
+def test_jsonschema_validates_jsonl_records():
+    """Test that JSONL artifacts are validated record by record."""
+    from agent_os.utils import save_jsonl
+
+    schema_path = Path("work/test_schema_record.json")
+    save_json({"type": "object", "required": ["text"]}, schema_path)
+
+    data_path = Path("work/test_records.jsonl")
+    save_jsonl([{"text": "a"}, {"text": "b"}], data_path)
+    assert validate_json_schema(data_path, schema_path) == True
+
+    save_jsonl([{"text": "a"}, {"other": "b"}], data_path)
+    assert validate_json_schema(data_path, schema_path) == False
+
+    # Cleanup
+    data_path.unlink(missing_ok=True)
+    schema_path.unlink(missing_ok=True)
+
+
+def test_jsonschema_validator_cache_and_refs(tmp_path):
+    """Test compiled validators are cached per schema file and resolve sibling $refs."""
+    from agent_os.validators import get_schema_validator
+
+    save_json({"definitions": {"name": {"type": "string"}}}, tmp_path / "common.schema.json")
+    schema_path = tmp_path / "item.schema.json"
+    save_json({
+        "type": "object",
+        "properties": {"name": {"$ref": "common.schema.json#/definitions/name"}},
+        "required": ["name"],
+    }, schema_path)
+
+    validator = get_schema_validator(schema_path)
+    assert get_schema_validator(schema_path) is validator
+
+    data_path = tmp_path / "item.json"
+    save_json({"name": "ok"}, data_path)
+    assert validate_json_schema(data_path, schema_path) == True
+    save_json({"name": 1}, data_path)
+    assert validate_json_schema(data_path, schema_path) == False
+
+    # Changed $ref'd sibling schema is picked up
+    save_json({"definitions": {"name": {"type": "integer"}}}, tmp_path / "common.schema.json")
+    assert get_schema_validator(schema_path) is not validator
+    assert validate_json_schema(data_path, schema_path) == True
+    validator = get_schema_validator(schema_path)
+
+    # Changed schema file is recompiled
+    save_json({"type": "object", "required": ["name", "id"]}, schema_path)
+    assert get_schema_validator(schema_path) is not validator
+
+
+def test_codegen_fast_path_matches_jsonschema(tmp_path):
+    """Test generated validators agree with jsonschema and are cached on disk."""
+    import jsonschema
+    from agent_os.utils import load_json
+    from agent_os.validators import load_fast_validator
+
+    schema = load_json("schemas/step_result.schema.json")
+    fast_validate = load_fast_validator(schema, tmp_path)
+    assert fast_validate is not None
+    assert len(list(tmp_path.glob("*.py"))) == 1
+
+    instances = [
+        {"step_id": "s1", "status": "success", "validated": True},
+        {"step_id": "s1", "status": "success", "validated": True, "error": None},
+        {"step_id": "s1", "status": "done", "validated": True},
+        {"step_id": "s1", "status": "success", "validated": "yes"},
+        {"step_id": "s1", "status": "success", "validated": True, "extra": 1},
+        {"step_id": "s1", "status": "success"},
+        [],
+    ]
+    validator = jsonschema.Draft7Validator(schema)
+    for instance in instances:
+        assert fast_validate(instance) == validator.is_valid(instance)
+
+    # Second load comes from the generated source on disk
+    assert load_fast_validator(schema, tmp_path)(instances[0]) is True
+
+    manifest_schema = load_json("schemas/artifact_manifest.schema.json")
+    fast_manifest = load_fast_validator(manifest_schema)
+    entry = {"key": "a", "path": "p", "producer_step": "s", "inputs_used": [], "validated": False,
+             "created_at": "2026-01-01T00:00:00", "table": {"fields": [["x", "i4"]], "rows": 1}}
+    assert fast_manifest({"a": entry, "_merkle": {"algorithm": "sha256", "root": "r", "steps": {}}})
+    assert not fast_manifest({"a": {**entry, "table": {"fields": [["x"]], "rows": 1}}})
+
+    # Unsupported keywords fall back to jsonschema only
+    assert load_fast_validator({"type": "array", "uniqueItems": True}) is None
+
+
+def test_codegen_never_more_lenient_than_jsonschema():
+    """Test other dialects, non-finite numbers and runtime errors are not trusted."""
+    import jsonschema
+    from agent_os.validators import load_fast_validator
+
+    draft4 = {"$schema": "http://json-schema.org/draft-04/schema#",
+              "type": "number", "minimum": 5, "exclusiveMinimum": True}
+    assert not jsonschema.Draft4Validator(draft4).is_valid(5)
+    assert load_fast_validator(draft4) is None
+    assert load_fast_validator({**draft4, "$schema": "http://json-schema.org/draft-07/schema#"}) is None
+
+    draft7 = {"$schema": "http://json-schema.org/draft-07/schema#", "type": "number", "exclusiveMinimum": 5}
+    assert load_fast_validator(draft7)(6) is True
+
+    assert load_fast_validator({"enum": [1.0, float("inf")]}) is None
+    assert load_fast_validator({"maximum": float("nan")}) is None
+    assert load_fast_validator({"maxLength": float("inf")}) is None
+
+    # Exceptions in generated code (non-string key) mean "re-check with jsonschema"
+    fast_validate = load_fast_validator({"patternProperties": {"^a": {"type": "string"}}})
+    assert fast_validate({"ab": "x"}) is True
+    assert fast_validate({1: "x"}) is False
+
+    # Booleans never equal numbers, also inside enum/const containers
+    for schema, instance in [({"enum": [{"a": 1}]}, {"a": True}), ({"enum": [[1]]}, [True]),
+                             ({"const": {"a": 0}}, {"a": False}), ({"const": [1, [0]]}, [1, [False]])]:
+        assert not jsonschema.Draft7Validator(schema).is_valid(instance)
+        assert load_fast_validator(schema)(instance) is False
+    assert load_fast_validator({"enum": [{"a": [1, None]}]})({"a": [1.0, None]}) is True
+
+
+def test_codegen_ignores_untrusted_cached_source(tmp_path):
+    """Test cached validator sources are private and foreign-writable ones are not executed."""
+    from agent_os.validators import load_fast_validator
+    from agent_os.validators.codegen import compute_schema_digest
+
+    schema = {"type": "string"}
+    assert load_fast_validator(schema, tmp_path)("x") is True
+    cache_path = tmp_path / f"{compute_schema_digest(schema)}.py"
+    assert cache_path.stat().st_mode & 0o077 == 0
+
+    cache_path.write_text("def validate(data):\n    return True\n", encoding='utf-8')
+    cache_path.chmod(0o666)
+    assert load_fast_validator(schema, tmp_path)(1) is False
+    assert cache_path.stat().st_mode & 0o077 == 0
+
+
+def test_jsonschema_validates_in_memory_object():
+    """Test validating an object without writing or re-reading a file."""
+    from agent_os.validators import validate_json_data
+
+    schema_path = Path("schemas/step_result.schema.json")
+    assert validate_json_data({"step_id": "s", "status": "success", "validated": True}, schema_path) == True
+    assert validate_json_data({"step_id": "s", "status": "bogus", "validated": True}, schema_path) == False
+
+
+def test_record_validation_reports_first_failures(tmp_path, monkeypatch):
+    """Test streaming record validation of JSONL and arrays (in-process and pooled)."""
+    from agent_os.utils import save_jsonl
+    from agent_os.validators import records, validate_json_records
+
+    schema_path = tmp_path / "record.schema.json"
+    save_json({"type": "object", "properties": {"n": {"type": "integer"}}, "required": ["n"]}, schema_path)
+
+    data = [{"n": i} if i % 50 else {"n": "bad"} for i in range(1, 301)]
+    jsonl_path = tmp_path / "records.jsonl"
+    save_jsonl(data, jsonl_path)
+
+    report = validate_json_records(jsonl_path, schema_path, max_failures=2)
+    assert report["passed"] == False
+    assert [f["line"] for f in report["failures"]] == [50, 100]
+    assert report["truncated"] == True
+
+    # Process pool over line-aligned ranges gives the same line numbers
+    monkeypatch.setattr(records, "PARALLEL_MIN_SIZE", 0)
+    pooled = validate_json_records(jsonl_path, schema_path, max_failures=10, workers=3)
+    assert [f["line"] for f in pooled["failures"]] == [50, 100, 150, 200, 250, 300]
+    assert pooled["records"] == 300
+
+    array_path = tmp_path / "records.json"
+    save_json({"records": data[:60]}, array_path)
+    report = validate_json_records(array_path, schema_path, prefix="records.item")
+    assert [f["index"] for f in report["failures"]] == [49]
+    assert report["records"] == 60
+
+    save_jsonl(data[:10], jsonl_path)
+    assert validate_json_records(jsonl_path, schema_path)["passed"] == True
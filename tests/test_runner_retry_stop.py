@@ -3,6 +3,7 @@
 import pytest
 from pathlib import Path
 from agent_os import Job, Runner
+from agent_os.config import get_config
 from agent_os.step import Step, StepContext
 from agent_os.runner import StepExecutionError
 
@@ -67,3 +68,88 @@ def test_runner_result_contains_failure_info():
     assert summary["success"] == False
     assert summary["failed_step"] == "test_fail"
     assert summary["steps_failed"] >= 1
+
+
+class CountingStep(Step):
+    """Step writing fixed output and counting gate calls."""
+
+    validate_calls = 0
+
+    def run(self, ctx: StepContext):
+        self.save_output_json(ctx, self.outputs[0], {"value": 42})
+        return {"status": "success"}
+
+    def validate(self, ctx: StepContext):
+        CountingStep.validate_calls += 1
+        return self.load_output_json(ctx, self.outputs[0])["value"] == 42
+
+
+def test_runner_reuses_cached_validation_results(tmp_path, monkeypatch):
+    """Test identical outputs across jobs are validated once."""
+    monkeypatch.setattr(get_config().cache, "root", str(tmp_path))
+    CountingStep.validate_calls = 0
+    config = {"inputs": [], "outputs": ["value.json"]}
+    cached = []
+
+    for job_id in ("test_validation_cache_a", "test_validation_cache_b"):
+        job = Job(task_name="test_validation_cache", inputs={}, job_id=job_id)
+        job.setup_workdir()
+        job.get_artifact_path("value.json").unlink(missing_ok=True)
+        (job.workdir / "artifacts/manifest.json").unlink(missing_ok=True)
+
+        result = Runner(job, [CountingStep("count", "Count", dict(config))]).run_all()
+        assert result["success"] == True
+        cached.append(result["validation"]["count"].get("cached", False))
+
+    assert CountingStep.validate_calls == 1
+    assert cached == [False, True]
+
+
+class CompressedOutputStep(CountingStep):
+    """Step whose gate records whether it saw the output uncompressed."""
+
+    gate_saw_raw = None
+
+    def validate(self, ctx: StepContext):
+        from agent_os.utils import detect_compression
+        output_path = self.get_output_path(ctx, self.outputs[0])
+        CompressedOutputStep.gate_saw_raw = detect_compression(output_path) is None
+        return super().validate(ctx)
+
+
+def test_runner_compresses_outputs_after_gate(tmp_path, monkeypatch):
+    """Test outputs are gated as written, then stored under a codec suffix."""
+    from agent_os.utils import load_json
+    monkeypatch.setattr(get_config().cache, "root", str(tmp_path))
+    job = Job(task_name="test_compress_after_gate", inputs={}, job_id="test_compress_after_gate")
+    job.setup_workdir()
+    (job.workdir / "artifacts/manifest.json").unlink(missing_ok=True)
+    config = {"inputs": [], "outputs": ["value.json"], "compression": {"value.json": "gzip"}}
+
+    runner = Runner(job, [CompressedOutputStep("compress", "Compress", config)])
+    assert runner.run_all()["success"] == True
+    assert CompressedOutputStep.gate_saw_raw == True
+
+    artifact = runner.manifest.get_artifact("value.json")
+    assert artifact["validated"] == True
+    assert artifact["compression"] == "gzip"
+    assert artifact["path"].endswith("value.json.gz")
+    assert not job.get_artifact_path("value.json").exists()
+    assert load_json(Path(artifact["path"])) == {"value": 42}
+
+
+def test_runner_validates_uncached_when_cache_unusable(tmp_path, monkeypatch):
+    """Test an unusable validation cache root does not stop the job."""
+    not_a_dir = tmp_path / "cache_root"
+    not_a_dir.write_text("", encoding='utf-8')
+    monkeypatch.setattr(get_config().cache, "root", str(not_a_dir))
+    CountingStep.validate_calls = 0
+
+    job = Job(task_name="test_validation_cache_broken", inputs={}, job_id="test_validation_cache_broken")
+    job.setup_workdir()
+    (job.workdir / "artifacts/manifest.json").unlink(missing_ok=True)
+
+    runner = Runner(job, [CountingStep("count", "Count", {"inputs": [], "outputs": ["value.json"]})])
+    assert runner.validation_cache is None
+    assert runner.run_all()["success"] == True
+    assert CountingStep.validate_calls == 1
@@ -0,0 +1,57 @@
+"""Test StepContext artifact access."""
+
+import pytest
+from agent_os import Job
+from agent_os.artifacts import ArtifactManifest
+from agent_os.step import StepContext
+
+
+def _make_context(job_id):
+    job = Job(task_name="test_ctx", inputs={}, job_id=job_id)
+    job.setup_workdir()
+    manifest = ArtifactManifest(job.workdir / "artifacts/manifest.json")
+    return job, StepContext(job, manifest, memory_bank=None)
+
+
+def test_artifact_mmap_and_bytes():
+    """Test zero-copy artifact views."""
+    job, ctx = _make_context("test_ctx_mmap")
+
+    payload = bytes(range(256)) * 100
+    path = job.get_artifact_path("audio.bin")
+    path.write_bytes(payload)
+    ctx.manifest.add_artifact(key="audio.bin", path=path, producer_step="s", inputs_used=[])
+
+    with ctx.open_artifact_mmap("audio.bin") as view:
+        assert len(view) == len(payload)
+        assert view[256:260].tobytes() == payload[256:260]
+
+    data = ctx.read_artifact_bytes("audio.bin")
+    assert isinstance(data, memoryview)
+    assert data[-4:].tobytes() == payload[-4:]
+
+    empty = job.get_artifact_path("empty.bin")
+    empty.write_bytes(b"")
+    ctx.manifest.add_artifact(key="empty.bin", path=empty, producer_step="s", inputs_used=[])
+    with ctx.open_artifact_mmap("empty.bin") as view:
+        assert len(view) == 0
+
+    with pytest.raises(KeyError):
+        ctx.read_artifact_bytes("missing.bin")
+
+
+def test_output_cache_reused_until_file_changes():
+    """Test gates reuse the saved output object instead of re-reading the file."""
+    from agent_os.steps_builtin import StubStep
+
+    job, ctx = _make_context("test_ctx_output_cache")
+    step = StubStep("stub", "Stub", {"inputs": [], "outputs": ["out.json"]})
+    step.run(ctx)
+
+    data = step.load_output_json(ctx, "out.json")
+    assert data is ctx.output_cache["out.json"][1]
+    assert step.validate(ctx)
+
+    # Rewritten file invalidates the cached object
+    job.get_artifact_path("out.json").write_text('{"step_id": "stub", "status": "changed!"}')
+    assert step.load_output_json(ctx, "out.json")["status"] == "changed!"
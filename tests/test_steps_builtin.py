@@ -0,0 +1,216 @@
+"""Test built-in steps end to end."""
+
+import pytest
+from pathlib import Path
+from agent_os import Job, Runner
+from agent_os.steps_builtin import LoadInputStep, SummarizeStep
+from agent_os.utils import iter_jsonl, load_json, save_json
+
+
+def test_load_and_summarize_jsonl(tmp_path):
+    """Test that line records flow from LoadInputStep into SummarizeStep."""
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("first line\nsecond line\n" * 50, encoding='utf-8')
+
+    job = Job(task_name="test_jsonl_steps", inputs={}, job_id="test_jsonl_steps")
+    job.setup_workdir()
+
+    steps = [
+        LoadInputStep("load", "Load", {
+            "input_file": str(input_file),
+            "inputs": [],
+            "outputs": ["input_lines.jsonl"],
+        }),
+        SummarizeStep("summarize", "Summarize", {
+            "max_summary_length": 15,
+            "inputs": ["input_lines.jsonl"],
+            "outputs": ["summary.json"],
+        }),
+    ]
+
+    result = Runner(job, steps).run_all()
+    assert result["success"] == True
+
+    records = list(iter_jsonl(job.get_artifact_path("input_lines.jsonl")))
+    assert len(records) == 100
+    assert records[1] == {"line": 2, "text": "second line"}
+
+    summary = load_json(job.get_artifact_path("summary.json"))
+    assert summary["summary"] == "first line\nseco..."
+    assert summary["original_length"] == len(input_file.read_text(encoding='utf-8'))
+
+
+def test_jsonl_lengths_match_crlf_input_without_final_newline(tmp_path):
+    """Test line records drop CRLF endings and count an unterminated last line exactly."""
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(b"first\r\nsecond\r\nlast")
+
+    job = Job(task_name="test_jsonl_crlf", inputs={}, job_id="test_jsonl_crlf")
+    job.setup_workdir()
+    (job.workdir / "artifacts/manifest.json").unlink(missing_ok=True)
+
+    steps = [
+        LoadInputStep("load", "Load", {
+            "input_file": str(input_file),
+            "inputs": [],
+            "outputs": ["input_lines.jsonl"],
+        }),
+        SummarizeStep("summarize", "Summarize", {
+            "max_summary_length": 100,
+            "inputs": ["input_lines.jsonl"],
+            "outputs": ["summary.json"],
+        }),
+    ]
+    assert Runner(job, steps).run_all()["success"] == True
+
+    records = list(iter_jsonl(job.get_artifact_path("input_lines.jsonl")))
+    assert records == [
+        {"line": 1, "text": "first"},
+        {"line": 2, "text": "second"},
+        {"line": 3, "text": "last", "eol": False},
+    ]
+
+    summary = load_json(job.get_artifact_path("summary.json"))
+    assert summary["summary"] == "first\nsecond\nlast"
+    assert summary["original_length"] == len(input_file.read_text(encoding='utf-8'))
+
+
+def test_summarize_reads_json_input_head(tmp_path):
+    """Test that SummarizeStep summarizes a LoadInputStep JSON artifact."""
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("本文" * 500, encoding='utf-8')
+
+    job = Job(task_name="test_json_steps", inputs={}, job_id="test_json_steps")
+    job.setup_workdir()
+
+    steps = [
+        LoadInputStep("load", "Load", {
+            "input_file": str(input_file),
+            "inputs": [],
+            "outputs": ["input_data.json"],
+        }),
+        SummarizeStep("summarize", "Summarize", {
+            "max_summary_length": 10,
+            "inputs": ["input_data.json"],
+            "outputs": ["summary.json"],
+        }),
+    ]
+
+    result = Runner(job, steps).run_all()
+    assert result["success"] == True
+
+    summary = load_json(job.get_artifact_path("summary.json"))
+    assert summary["summary"] == "本文" * 5 + "..."
+    assert summary["original_length"] == 1000
+
+
+def test_load_input_reference_mode(tmp_path):
+    """Test reference-mode LoadInputStep snapshots instead of embedding text."""
+    from agent_os.steps_builtin import iter_input_text
+
+    input_file = tmp_path / "corpus.txt"
+    text = "参照モード\n" * 1000
+    input_file.write_text(text, encoding='utf-8')
+
+    job = Job(task_name="test_reference", inputs={}, job_id="test_reference_steps")
+    job.setup_workdir()
+
+    steps = [
+        LoadInputStep("load", "Load", {
+            "input_file": str(input_file),
+            "mode": "reference",
+            "inputs": [],
+            "outputs": ["input_data.json"],
+        }),
+        SummarizeStep("summarize", "Summarize", {
+            "max_summary_length": 5,
+            "inputs": ["input_data.json"],
+            "outputs": ["summary.json"],
+        }),
+    ]
+
+    result = Runner(job, steps).run_all()
+    assert result["success"] == True
+
+    artifact = load_json(job.get_artifact_path("input_data.json"))
+    assert "content" not in artifact
+    assert artifact["size"] == input_file.stat().st_size
+    assert artifact["length"] == len(text)
+    assert "".join(iter_input_text(artifact, chunk_chars=333)) == text
+
+    summary = load_json(job.get_artifact_path("summary.json"))
+    assert summary["summary"] == "参照モード..."
+    assert summary["original_length"] == len(text)
+
+
+def test_load_input_reference_detects_changed_snapshot(tmp_path):
+    """Test same-size edits of a (possibly hardlinked) snapshot fail the gate."""
+    import os
+    from agent_os.artifacts import ArtifactManifest
+    from agent_os.step import StepContext
+    from agent_os.steps_builtin import check_input_snapshot, open_input_text
+
+    input_file = tmp_path / "corpus.txt"
+    input_file.write_text("original text\n", encoding='utf-8')
+
+    job = Job(task_name="test_reference", inputs={}, job_id="test_reference_snapshot")
+    job.setup_workdir()
+    ctx = StepContext(job, ArtifactManifest(job.workdir / "artifacts/manifest.json"), memory_bank=None)
+    step = LoadInputStep("load", "Load", {
+        "input_file": str(input_file), "mode": "reference", "inputs": [], "outputs": ["input_data.json"],
+    })
+    step.run(ctx)
+    assert step.validate(ctx) == True
+
+    artifact = load_json(job.get_artifact_path("input_data.json"))
+    snapshot_path = artifact["snapshot_path"]
+    stat = os.stat(snapshot_path)
+    with open(snapshot_path, 'r+b') as f:
+        f.write(b"ORIGINAL")
+    # Same size and restored mtime: only the digest reveals the edit
+    os.utime(snapshot_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert check_input_snapshot(artifact) is None
+    assert "content changed" in check_input_snapshot(artifact, full=True)
+
+    artifact["snapshot_method"] = "hardlink"
+    save_json(artifact, job.get_artifact_path("input_data.json"))
+    ctx.output_cache.clear()
+    assert step.validate(ctx) == False
+
+    os.utime(snapshot_path)
+    with pytest.raises(ValueError):
+        open_input_text(artifact)
+
+
+def test_summarize_reads_compressed_jsonl_input(tmp_path, monkeypatch):
+    """Test a JSONL artifact stored as .jsonl.gz is still read as line records."""
+    from agent_os.config import get_config
+
+    monkeypatch.setattr(get_config().artifacts, "compress_min_size", 1)
+    monkeypatch.setattr(get_config().artifacts, "compress_codec", "gzip")
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("first line\nsecond line\n" * 50, encoding='utf-8')
+
+    job = Job(task_name="test_jsonl_gz", inputs={}, job_id="test_jsonl_gz")
+    job.setup_workdir()
+    (job.workdir / "artifacts/manifest.json").unlink(missing_ok=True)
+
+    steps = [
+        LoadInputStep("load", "Load", {
+            "input_file": str(input_file),
+            "inputs": [],
+            "outputs": ["input_lines.jsonl"],
+        }),
+        SummarizeStep("summarize", "Summarize", {
+            "max_summary_length": 15,
+            "inputs": ["input_lines.jsonl"],
+            "outputs": ["summary.json"],
+        }),
+    ]
+    runner = Runner(job, steps)
+    assert runner.run_all()["success"] == True
+    assert runner.manifest.get_artifact("input_lines.jsonl")["path"].endswith("input_lines.jsonl.gz")
+
+    summary = load_json(Path(runner.manifest.get_artifact("summary.json")["path"]))
+    assert summary["summary"] == "first line\nseco..."
+    assert summary["original_length"] == len(input_file.read_text(encoding='utf-8'))
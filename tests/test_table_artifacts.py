@@ -0,0 +1,37 @@
+"""Test binary table artifacts."""
+
+import pytest
+from agent_os import Job
+from agent_os.artifacts import ArtifactManifest
+from agent_os.utils import TableWriter, TableReader
+from agent_os.validators import validate_table
+
+FIELDS = [("segment", "i4"), ("energy", "f8"), ("voiced", "bool")]
+
+
+def test_table_roundtrip_and_manifest():
+    """Test writing, reading and registering a table artifact."""
+    job = Job(task_name="test_table", inputs={}, job_id="test_table")
+    job.setup_workdir()
+    table_path = job.get_artifact_path("features.tbl")
+
+    with TableWriter(table_path, FIELDS, buffer_rows=7) as writer:
+        for i in range(100):
+            writer.write_row((i, i * 0.25, i % 3 == 0))
+        writer.write_row({"segment": 100, "energy": 1.5, "voiced": False})
+
+    with TableReader(table_path) as reader:
+        assert len(reader) == 101
+        assert reader.row(2) == (2, 0.5, False)
+        assert reader.row(-1) == (100, 1.5, False)
+        assert reader.column("segment")[:3] == [0, 1, 2]
+
+    manifest = ArtifactManifest(job.workdir / "artifacts/manifest.json")
+    manifest.add_artifact(key="features.tbl", path=table_path, producer_step="s", inputs_used=[])
+    artifact = manifest.get_artifact("features.tbl")
+    assert artifact["format"] == "table"
+    assert artifact["table"]["rows"] == 101
+
+    assert validate_table(table_path, columns={"energy": "f8"}, min_rows=1) == True
+    assert validate_table(table_path, columns={"energy": "f4"}) == False
+    assert validate_table(job.workdir / "artifacts/manifest.json") == False
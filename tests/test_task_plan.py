@@ -0,0 +1,89 @@
+"""Test compiled task plans."""
+
+import pytest
+from pathlib import Path
+from agent_os.plan import TaskPlan, ConfigTemplate, load_task_plan
+from agent_os.steps_builtin import LoadInputStep, StubStep
+
+
+def test_plan_instantiates_steps_with_placeholders():
+    """Test placeholder rendering and dependency graph."""
+    spec = {
+        "name": "plan_test",
+        "steps": [
+            {"id": "load", "name": "Load", "type": "LoadInputStep",
+             "config": {"input_file": "{input_file}", "note": "{unknown}"},
+             "inputs": [], "outputs": ["input_data.json"]},
+            {"id": "stub", "name": "Stub", "type": "StubStep",
+             "config": {"mode": "x"}, "inputs": ["input_data.json"], "outputs": ["out.json"]},
+        ],
+    }
+    plan = TaskPlan.compile(spec)
+
+    steps_a = plan.instantiate({"input_file": "a.txt"})
+    steps_b = plan.instantiate({"input_file": "b.txt"})
+
+    assert isinstance(steps_a[0], LoadInputStep)
+    assert isinstance(steps_a[1], StubStep)
+    assert steps_a[0].config["input_file"] == "a.txt"
+    assert steps_b[0].config["input_file"] == "b.txt"
+    assert steps_a[0].config["note"] == "{unknown}"
+    assert steps_a[1].inputs == ["input_data.json"]
+    assert plan.get_dependency_graph() == {"load": [], "stub": ["load"]}
+
+    # Spec itself is not mutated
+    assert spec["steps"][0]["config"]["input_file"] == "{input_file}"
+
+
+def test_plan_rejects_unknown_step_type():
+    """Test that unknown step types fail at compile time."""
+    spec = {"name": "bad", "steps": [{"id": "x", "name": "X", "type": "NoSuchStep"}]}
+    with pytest.raises(ValueError):
+        TaskPlan.compile(spec)
+
+
+def test_load_task_plan_is_cached():
+    """Test that plans are cached by spec hash."""
+    plan_a = load_task_plan("tasks/examples/video2jp_stub.yaml")
+    plan_b = load_task_plan("tasks/examples/video2jp_stub.yaml")
+
+    assert plan_a is plan_b
+    assert len(plan_a.spec_digest) == 64
+    assert [s.step_id for s in plan_a.instantiate({})] == ["transcribe_stub", "translate_stub", "subtitles_stub"]
+
+
+def test_config_template_multiple_fields():
+    """Test templates with several placeholders."""
+    template = ConfigTemplate("{a}/{b}-{a}.txt")
+    assert template.render({"a": 1, "b": "x"}) == "1/x-1.txt"
+
+
+def test_plan_disk_cache_is_private_to_user(tmp_path, monkeypatch):
+    """Test plan pickles live under the work root and foreign-writable ones are ignored."""
+    import os
+    from agent_os import plan as plan_module
+    from agent_os.config import get_config
+
+    monkeypatch.setattr(get_config().paths, "work_root", str(tmp_path))
+    spec_path = tmp_path / "task.yaml"
+    spec_path.write_text(Path("tasks/examples/video2jp_stub.yaml").read_text(encoding='utf-8'), encoding='utf-8')
+
+    plan_module._plan_cache.clear()
+    load_task_plan(spec_path)
+    plan_module._plan_cache.clear()
+    cache_files = list((tmp_path / "plans").glob("*.pickle"))
+    assert len(cache_files) == 1
+    assert cache_files[0].stat().st_mode & 0o077 == 0
+
+    loads = []
+    real_load = plan_module.pickle.load
+    monkeypatch.setattr(plan_module.pickle, "load", lambda f: loads.append(f) or real_load(f))
+
+    load_task_plan(spec_path)
+    assert len(loads) == 1
+
+    plan_module._plan_cache.clear()
+    os.chmod(cache_files[0], 0o666)
+    plan = load_task_plan(spec_path)
+    assert len(loads) == 1
+    assert [s.step_id for s in plan.instantiate({})] == ["transcribe_stub", "translate_stub", "subtitles_stub"]
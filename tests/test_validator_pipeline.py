@@ -0,0 +1,225 @@
+"""Test declarative validator pipeline."""
+
+import pytest
+from agent_os import Job, Runner
+from agent_os.artifacts import ArtifactManifest
+from agent_os.config import get_config
+from agent_os.step import StepContext
+from agent_os.steps_builtin import StubStep
+from agent_os.utils import load_json, save_json
+from agent_os.validators import ValidatorPipeline, build_checks
+
+
+def test_build_checks_cost_order():
+    """Test checks are expanded per output and sorted by cost, custom last."""
+    checks = build_checks({"checks": [
+        {"type": "jsonschema", "schema": "s.json", "outputs": ["a.json"]},
+        {"type": "file_size", "min_size": 10},
+        {"type": "file_exists"},
+    ]}, ["a.json", "b.json"])
+
+    assert [check.name for check in checks] == [
+        "file_exists:a.json", "file_exists:b.json",
+        "file_size:a.json", "file_size:b.json",
+        "jsonschema:a.json",
+        "custom",
+    ]
+    assert [check.name for check in build_checks({}, ["a.json"])] == ["custom"]
+
+    with pytest.raises(ValueError):
+        build_checks({"type": "bogus"}, ["a.json"])
+
+
+def test_pipeline_short_circuits_and_times_checks(tmp_path):
+    """Test failing cheap checks skip expensive ones."""
+    job = Job(task_name="test_pipeline", inputs={}, job_id="test_pipeline")
+    job.setup_workdir()
+    ctx = StepContext(job, ArtifactManifest(job.workdir / "artifacts/manifest.json"), memory_bank=None)
+
+    schema_path = tmp_path / "stub.schema.json"
+    save_json({"type": "object", "required": ["step_id", "status"]}, schema_path)
+    validator = {"parallel": True, "checks": [
+        {"type": "file_exists"},
+        {"type": "jsonschema", "schema": str(schema_path)},
+    ]}
+
+    step = StubStep("stub", "Stub", {"inputs": [], "outputs": ["a.json", "b.json"], "validator": validator})
+    step.run(ctx)
+    report = ValidatorPipeline.from_step(step).run(step, ctx)
+    assert report["passed"] == True
+    assert [r["check"] for r in report["checks"]][-1] == "custom"
+    assert all(r["elapsed_ms"] >= 0 for r in report["checks"])
+
+    job.get_artifact_path("b.json").unlink()
+    report = ValidatorPipeline.from_step(step).run(step, ctx)
+    assert report["passed"] == False
+    assert report["skipped"] == ["jsonschema:a.json", "jsonschema:b.json", "custom"]
+
+
+def test_runner_reports_validation_timings(tmp_path, monkeypatch):
+    """Test execution summary includes per-check gate results."""
+    monkeypatch.setattr(get_config().cache, "root", str(tmp_path))
+    job = Job(task_name="test_pipeline_runner", inputs={}, job_id="test_pipeline_runner")
+    job.setup_workdir()
+    (job.workdir / "artifacts/manifest.json").unlink(missing_ok=True)
+
+    step = StubStep("stub", "Stub", {
+        "inputs": [], "outputs": ["out.json"],
+        "validator": {"type": "file_size", "min_size": 10},
+    })
+    result = Runner(job, [step]).run_all()
+    assert result["success"] == True
+
+    summary = load_json(job.workdir / "execution_summary.json")
+    report = summary["validation"]["stub"]
+    assert report["passed"] == True
+    assert "cached" not in report
+    assert [r["check"] for r in report["checks"]] == ["file_size:out.json", "custom"]
+
+
+class RecordsStep(StubStep):
+    """Step streaming records from config."""
+
+    def run(self, ctx):
+        with self.open_output_jsonl(ctx, self.outputs[0]) as writer:
+            for record in self.config["records"]:
+                writer.write(record)
+        return {"status": "success"}
+
+
+def test_validating_writer_aborts_on_first_bad_record(tmp_path):
+    """Test records are validated while produced and the gate skips re-validation."""
+    from agent_os.validators import RecordValidationError
+
+    job = Job(task_name="test_validating_writer", inputs={}, job_id="test_validating_writer")
+    job.setup_workdir()
+    ctx = StepContext(job, ArtifactManifest(job.workdir / "artifacts/manifest.json"), memory_bank=None)
+
+    schema_path = tmp_path / "record.schema.json"
+    save_json({"type": "object", "required": ["text"]}, schema_path)
+    validator = {"type": "records", "schema": str(schema_path)}
+
+    bad = RecordsStep("rec", "Records", {
+        "inputs": [], "outputs": ["out.jsonl"], "validator": validator,
+        "records": [{"text": "a"}, {"text": "b"}, {"other": 1}, {"text": "never written"}],
+    })
+    with pytest.raises(RecordValidationError) as excinfo:
+        bad.run(ctx)
+    assert excinfo.value.record_number == 3
+
+    # Registered record checks apply as well
+    checked = RecordsStep("rec", "Records", {
+        "inputs": [], "outputs": ["out.jsonl"], "validator": validator,
+        "records": [{"text": "ok"}, {"text": ""}],
+    })
+    checked.register_record_check("out.jsonl", lambda r: None if r["text"] else "empty text")
+    with pytest.raises(RecordValidationError, match="empty text"):
+        checked.run(ctx)
+
+    good = RecordsStep("rec", "Records", {
+        "inputs": [], "outputs": ["out.jsonl"], "validator": validator,
+        "records": [{"text": "a"}, {"text": "b"}],
+    })
+    good.run(ctx)
+    assert ctx.is_prevalidated("out.jsonl", job.get_artifact_path("out.jsonl"), str(schema_path))
+    report = ValidatorPipeline.from_step(good).run(good, ctx)
+    assert report["passed"] == True
+
+    # JSON outputs are checked before anything is written
+    json_step = StubStep("stub", "Stub", {
+        "inputs": [], "outputs": ["stub.json"],
+        "validator": {"type": "jsonschema", "schema": str(schema_path)},
+    })
+    with pytest.raises(RecordValidationError):
+        json_step.run(ctx)
+    assert not job.get_artifact_path("stub.json").exists()
+
+
+class FlakyStep(StubStep):
+    """Step whose custom check raises on the first call."""
+
+    validate_calls = 0
+
+    def validate(self, ctx):
+        FlakyStep.validate_calls += 1
+        if FlakyStep.validate_calls == 1:
+            raise OSError("transient read error")
+        return True
+
+
+def test_check_errors_are_not_cached(tmp_path, monkeypatch):
+    """Test a check that raises is retried instead of cached as a failure."""
+    monkeypatch.setattr(get_config().cache, "root", str(tmp_path / "cache"))
+    FlakyStep.validate_calls = 0
+
+    job = Job(task_name="test_pipeline_flaky", inputs={}, job_id="test_pipeline_flaky")
+    job.setup_workdir()
+    (job.workdir / "artifacts/manifest.json").unlink(missing_ok=True)
+
+    step = FlakyStep("flaky", "Flaky", {"inputs": [], "outputs": ["out.json"]})
+    ctx = StepContext(job, ArtifactManifest(job.workdir / "artifacts/manifest.json"), memory_bank=None)
+    step.run(ctx)
+    report = ValidatorPipeline.from_step(step).run(step, ctx)
+    assert report["passed"] == False
+    assert report["errored"] == True
+    assert report["checks"][-1]["error"] == "transient read error"
+
+    FlakyStep.validate_calls = 0
+    result = Runner(job, [step]).run_all()
+    assert result["success"] == True
+    assert FlakyStep.validate_calls == 2
+    assert "cached" not in result["validation"]["flaky"]
+
+
+def test_validation_key_covers_checks_and_referenced_schemas(tmp_path):
+    """Test gate cache key changes with the check list and $ref'd schemas."""
+    job = Job(task_name="test_pipeline_key", inputs={}, job_id="test_pipeline_key")
+    job.setup_workdir()
+    ctx = StepContext(job, ArtifactManifest(job.workdir / "artifacts/manifest.json"), memory_bank=None)
+
+    save_json({"definitions": {"status": {"type": "string"}}}, tmp_path / "common.schema.json")
+    schema_path = tmp_path / "stub.schema.json"
+    save_json({"properties": {"status": {"$ref": "common.schema.json#/definitions/status"}}}, schema_path)
+
+    def make_step(checks):
+        validator = {"checks": checks}
+        return StubStep("stub", "Stub", {"inputs": [], "outputs": ["a.json"], "validator": validator})
+
+    step = make_step([{"type": "jsonschema", "schema": str(schema_path)}])
+    step.run(ctx)
+    ctx.manifest.add_artifact(key="a.json", path=job.get_artifact_path("a.json"),
+                              producer_step="stub", inputs_used=[])
+    key = step.get_validation_key(ctx)
+    assert key is not None and key == step.get_validation_key(ctx)
+
+    save_json({"definitions": {"status": {"enum": ["success"]}}}, tmp_path / "common.schema.json")
+    changed = step.get_validation_key(ctx)
+    assert changed[0] == key[0]
+    assert changed[1] != key[1]
+
+    reordered = make_step([{"type": "file_size", "min_size": 5}, {"type": "jsonschema", "schema": str(schema_path)}])
+    assert reordered.get_validation_key(ctx)[1] != changed[1]
+
+
+def test_validation_key_covers_validator_version_and_source(monkeypatch):
+    """Test gate cache key changes when a step's validate() code or version changes."""
+    from agent_os.step import _class_source_digest
+
+    job = Job(task_name="test_pipeline_key", inputs={}, job_id="test_pipeline_key")
+    job.setup_workdir()
+    ctx = StepContext(job, ArtifactManifest(job.workdir / "artifacts/manifest.json"), memory_bank=None)
+
+    class VersionedStub(StubStep):
+        def validate(self, ctx):
+            return True
+
+    config = {"inputs": [], "outputs": ["a.json"]}
+    step = VersionedStub("stub", "Stub", dict(config))
+    step.run(ctx)
+    ctx.manifest.add_artifact(key="a.json", path=job.get_artifact_path("a.json"),
+                              producer_step="stub", inputs_used=[])
+    key = step.get_validation_key(ctx)
+    assert _class_source_digest(VersionedStub) != _class_source_digest(StubStep)
+
+    monkeypatch.setattr(VersionedStub, "VALIDATOR_VERSION", 2)
+    assert step.get_validation_key(ctx)[1] != key[1]
@@ -0,0 +1,13 @@
+# Generated by agent_os.validators.codegen v1
+import re
+
+
+
+def validate(data):
+    if not (isinstance(data, dict)):
+        return False
+    if isinstance(data, dict):
+        pass
+        if 'text' not in data:
+            return False
+    return True
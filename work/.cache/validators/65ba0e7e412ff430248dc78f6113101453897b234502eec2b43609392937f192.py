@@ -0,0 +1,29 @@
+# Generated by agent_os.validators.codegen v1
+import re
+
+
+
+def validate(data):
+    if not (isinstance(data, dict)):
+        return False
+    if isinstance(data, dict):
+        pass
+        if 'step_id' not in data:
+            return False
+        if 'status' not in data:
+            return False
+        if 'validated' not in data:
+            return False
+        if 'step_id' in data:
+            _v1 = data['step_id']
+            if not (isinstance(_v1, str)):
+                return False
+        if 'status' in data:
+            _v2 = data['status']
+            if not (isinstance(_v2, str)):
+                return False
+        if 'validated' in data:
+            _v3 = data['validated']
+            if not (isinstance(_v3, bool)):
+                return False
+    return True
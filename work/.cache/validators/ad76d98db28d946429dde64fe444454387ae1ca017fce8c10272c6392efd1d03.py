@@ -0,0 +1,17 @@
+# Generated by agent_os.validators.codegen v1
+import re
+
+
+
+def validate(data):
+    if not (isinstance(data, dict)):
+        return False
+    if isinstance(data, dict):
+        pass
+        if 'n' not in data:
+            return False
+        if 'n' in data:
+            _v1 = data['n']
+            if not (((isinstance(_v1, int) and not isinstance(_v1, bool)) or (isinstance(_v1, float) and _v1.is_integer()))):
+                return False
+    return True
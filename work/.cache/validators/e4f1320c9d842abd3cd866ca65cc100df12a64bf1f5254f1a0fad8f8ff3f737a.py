@@ -0,0 +1,22 @@
+# Generated by agent_os.validators.codegen v2
+import re
+
+
+
+def _validate(data):
+    if not (isinstance(data, dict)):
+        return False
+    if isinstance(data, dict):
+        pass
+        if 'step_id' not in data:
+            return False
+        if 'status' not in data:
+            return False
+    return True
+
+
+def validate(data):
+    try:
+        return _validate(data)
+    except Exception:
+        return False
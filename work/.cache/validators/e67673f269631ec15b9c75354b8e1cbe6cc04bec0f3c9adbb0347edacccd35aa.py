@@ -0,0 +1,45 @@
+# Generated by agent_os.validators.codegen v1
+import re
+
+_C3 = frozenset(['failure', 'skipped', 'success'])
+_C9 = frozenset(['error', 'outputs', 'status', 'step_id', 'validated'])
+
+
+def validate(data):
+    if not (isinstance(data, dict)):
+        return False
+    if isinstance(data, dict):
+        pass
+        if 'step_id' not in data:
+            return False
+        if 'status' not in data:
+            return False
+        if 'validated' not in data:
+            return False
+        if 'step_id' in data:
+            _v1 = data['step_id']
+            if not (isinstance(_v1, str)):
+                return False
+        if 'status' in data:
+            _v2 = data['status']
+            if not (isinstance(_v2, str)):
+                return False
+            if not (isinstance(_v2, str) and _v2 in _C3):
+                return False
+        if 'outputs' in data:
+            _v4 = data['outputs']
+            if not (isinstance(_v4, dict)):
+                return False
+        if 'validated' in data:
+            _v5 = data['validated']
+            if not (isinstance(_v5, bool)):
+                return False
+        if 'error' in data:
+            _v6 = data['error']
+            if not (isinstance(_v6, str) or _v6 is None):
+                return False
+        for _k7, _v8 in data.items():
+            if _k7 not in _C9:
+                pass
+                return False
+    return True